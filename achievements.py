@@ -0,0 +1,164 @@
+"""
+Achievement definitions and the event-driven rule engine
+Each badge's requirement spec is compiled once into a predicate and indexed
+by the progress event that can change its outcome
+"""
+
+from typing import Callable, Dict, List
+
+# Progress events that can unlock achievements
+EVENT_VISIT = 'visit'
+EVENT_PAGE_COMPLETED = 'page_completed'
+EVENT_QUIZ_SCORED = 'quiz_scored'
+
+# Achievement definitions matching React implementation
+ACHIEVEMENT_DEFINITIONS = {
+    'first_steps': {
+        'title': 'First Steps',
+        'description': 'Complete your first lesson',
+        'icon': '🐾',
+        'category': 'completion',
+        'requirement': {'type': 'pages_visited', 'value': 1}
+    },
+    'setup_master': {
+        'title': 'Setup Master',
+        'description': 'Complete the Getting Started section',
+        'icon': '⚙️',
+        'category': 'completion',
+        'requirement': {'type': 'page_completed', 'page': 'getting-started'}
+    },
+    'concept_explorer': {
+        'title': 'Concept Explorer',
+        'description': 'Learn all core GitHub concepts',
+        'icon': '🧠',
+        'category': 'exploration',
+        'requirement': {'type': 'page_completed', 'page': 'concepts'}
+    },
+    'repository_creator': {
+        'title': 'Repository Creator',
+        'description': 'Create your first repository',
+        'icon': '📁',
+        'category': 'completion',
+        'requirement': {'type': 'page_completed', 'page': 'first-repo'}
+    },
+    'command_line_pro': {
+        'title': 'Command Line Pro',
+        'description': 'Master the command line basics',
+        'icon': '💻',
+        'category': 'completion',
+        'requirement': {'type': 'page_completed', 'page': 'command-line'}
+    },
+    'team_player': {
+        'title': 'Team Player',
+        'description': 'Learn about collaboration',
+        'icon': '🤝',
+        'category': 'exploration',
+        'requirement': {'type': 'page_completed', 'page': 'collaboration'}
+    },
+    'best_practice': {
+        'title': 'Best Practice',
+        'description': 'Learn GitHub best practices',
+        'icon': '✨',
+        'category': 'completion',
+        'requirement': {'type': 'page_completed', 'page': 'best-practices'}
+    },
+    'quiz_master': {
+        'title': 'Quiz Master',
+        'description': 'Score 100% on a quiz',
+        'icon': '🏆',
+        'category': 'mastery',
+        'requirement': {'type': 'quiz_score', 'value': 100}
+    },
+    'knowledge_seeker': {
+        'title': 'Knowledge Seeker',
+        'description': 'Score 80% or higher on all quizzes',
+        'icon': '📚',
+        'category': 'mastery',
+        'requirement': {'type': 'quiz_average', 'value': 80}
+    },
+    'complete_journey': {
+        'title': 'Complete Journey',
+        'description': 'Finish all lessons',
+        'icon': '⭐',
+        'category': 'completion',
+        'requirement': {'type': 'pages_completed', 'value': 11}
+    },
+    'dedicated_learner': {
+        'title': 'Dedicated Learner',
+        'description': 'Spend 30 minutes learning',
+        'icon': '⏰',
+        'category': 'speed',
+        'requirement': {'type': 'time_spent', 'value': 30}
+    },
+    'project_builder': {
+        'title': 'Project Builder',
+        'description': 'Explore real project ideas',
+        'icon': '🔨',
+        'category': 'exploration',
+        'requirement': {'type': 'page_completed', 'page': 'real-projects'}
+    },
+    'resource_collector': {
+        'title': 'Resource Collector',
+        'description': 'Explore all resources',
+        'icon': '📖',
+        'category': 'exploration',
+        'requirement': {'type': 'page_completed', 'page': 'resources'}
+    }
+}
+
+def _pages_visited(requirement: Dict) -> Callable:
+    value = requirement['value']
+    return lambda progress: progress.visited_count >= value
+
+def _pages_completed(requirement: Dict) -> Callable:
+    value = requirement['value']
+    return lambda progress: progress.completed_count >= value
+
+def _page_completed(requirement: Dict) -> Callable:
+    page_id = requirement['page']
+    return lambda progress: progress.is_completed(page_id)
+
+def _quiz_score(requirement: Dict) -> Callable:
+    value = requirement['value']
+    return lambda progress: any(score.percentage >= value for score in progress.quiz_scores.values())
+
+def _quiz_average(requirement: Dict) -> Callable:
+    value = requirement['value']
+    return lambda progress: bool(progress.quiz_scores) and progress.quiz_average() >= value
+
+def _time_spent(requirement: Dict) -> Callable:
+    value = requirement['value']
+    return lambda progress: progress.time_spent >= value
+
+# Requirement type -> (predicate factory, event that can change the outcome)
+REQUIREMENT_TYPES = {
+    'pages_visited': (_pages_visited, EVENT_VISIT),
+    'pages_completed': (_pages_completed, EVENT_PAGE_COMPLETED),
+    'page_completed': (_page_completed, EVENT_PAGE_COMPLETED),
+    'quiz_score': (_quiz_score, EVENT_QUIZ_SCORED),
+    'quiz_average': (_quiz_average, EVENT_QUIZ_SCORED),
+    'time_spent': (_time_spent, EVENT_VISIT),
+}
+
+class AchievementEngine:
+    """Rule engine that evaluates only the achievements subscribed to an event"""
+
+    def __init__(self, definitions: Dict[str, Dict]):
+        self.definitions = definitions
+        self.rules: Dict[str, List] = {}
+        for achievement_id, definition in definitions.items():
+            requirement = definition['requirement']
+            if requirement['type'] not in REQUIREMENT_TYPES:
+                raise ValueError(f"Unknown requirement type {requirement['type']!r} for {achievement_id!r}")
+            factory, event = REQUIREMENT_TYPES[requirement['type']]
+            self.rules.setdefault(event, []).append((achievement_id, factory(requirement)))
+
+    def evaluate(self, event: str, progress) -> List[str]:
+        """Return the ids of achievements newly satisfied by ``event``"""
+        return [
+            achievement_id for achievement_id, predicate in self.rules.get(event, ())
+            if not progress.is_unlocked(achievement_id) and predicate(progress)
+        ]
+
+# Compiled once per process and shared by every session
+ENGINE = AchievementEngine(ACHIEVEMENT_DEFINITIONS)
@@ -0,0 +1,104 @@
+"""
+Quiz answers held per section in fixed-size arrays
+Each section keeps the chosen option, whether it was right, when it was
+answered and how long the learner took, one slot per question position, so
+grading, results and resets are a single pass over one section and never
+build or scan string keys
+"""
+
+from array import array
+from typing import Dict, Iterator, Optional, Tuple
+
+from progress import epoch_now
+from timing import elapsed_ms, now_ns
+
+# Selected-option slot of a question that has not been answered
+UNANSWERED = -1
+
+class SectionAnswers:
+    """Answers to one quiz section, indexed by question position"""
+    __slots__ = ('selected', 'correct', 'answered_at', 'shown_ns', 'response_ms')
+
+    def __init__(self, size: int):
+        self.clear(size)
+
+    def __len__(self) -> int:
+        return len(self.selected)
+
+    def show(self, question_idx: int):
+        """Start the question's response clock the first time it is on screen"""
+        if not self.shown_ns[question_idx]:
+            self.shown_ns[question_idx] = now_ns()
+
+    def record(self, question_idx: int, option: int, is_correct: bool):
+        """Store an answer, replacing any earlier one to the same question"""
+        self.selected[question_idx] = option
+        self.correct[question_idx] = is_correct
+        self.answered_at[question_idx] = epoch_now()
+        shown = self.shown_ns[question_idx]
+        self.response_ms[question_idx] = elapsed_ms(shown) if shown else 0
+
+    def answer(self, question_idx: int) -> Optional[int]:
+        """Selected option, or None when the question was skipped or not reached"""
+        option = self.selected[question_idx]
+        return None if option == UNANSWERED else option
+
+    def is_correct(self, question_idx: int) -> bool:
+        return bool(self.correct[question_idx])
+
+    @property
+    def correct_count(self) -> int:
+        return self.correct.count(1)
+
+    @property
+    def answered_count(self) -> int:
+        return len(self.selected) - self.selected.count(UNANSWERED)
+
+    @property
+    def total_response_ms(self) -> int:
+        return sum(self.response_ms)
+
+    def results(self) -> Iterator[Tuple[Optional[int], bool, int]]:
+        """(selected option or None, correct, response ms) for every question, in order"""
+        for option, correct, response_ms in zip(self.selected, self.correct, self.response_ms):
+            yield (None if option == UNANSWERED else option), bool(correct), response_ms
+
+    def clear(self, size: Optional[int] = None):
+        """Forget every answer and timing in the section"""
+        size = len(self.selected) if size is None else size
+        self.selected = array('b', [UNANSWERED]) * size
+        self.correct = bytearray(size)
+        self.answered_at = array('I', [0]) * size
+        self.shown_ns = array('q', [0]) * size
+        self.response_ms = array('I', [0]) * size
+
+    def to_record(self) -> Dict:
+        """Plain per-question lists for export"""
+        return {'selected': [None if option == UNANSWERED else option for option in self.selected],
+                'correct': [bool(correct) for correct in self.correct],
+                'answered_at': self.answered_at.tolist(),
+                'response_ms': self.response_ms.tolist()}
+
+class AnswerStore:
+    """Answer arrays for every quiz section a session has answered in"""
+    __slots__ = ('sections',)
+
+    def __init__(self):
+        self.sections: Dict[str, SectionAnswers] = {}
+
+    def section(self, section_key: str, size: int) -> SectionAnswers:
+        """A section's answers, created empty on first use or when the section changed size"""
+        answers = self.sections.get(section_key)
+        if answers is None or len(answers) != size:
+            answers = self.sections[section_key] = SectionAnswers(size)
+        return answers
+
+    def clear(self, section_key: str):
+        """Forget one section's answers; other sections are untouched"""
+        answers = self.sections.get(section_key)
+        if answers is not None:
+            answers.clear()
+
+    def keep_only(self, section_key: str):
+        """Drop every other section's answers"""
+        self.sections = {key: answers for key, answers in self.sections.items() if key == section_key}
@@ -0,0 +1,32 @@
+"""
+Page manifest and registry for the GitHub tutorial app
+Navigation metadata lives here; page modules are imported on first visit
+"""
+
+from page_registry import PageRegistry
+
+MANIFEST = [
+    {'id': 'home', 'title': 'Home', 'icon': '🏠', 'module': 'home'},
+    {'id': 'getting-started', 'title': 'Getting Started', 'icon': '📖', 'module': 'getting_started',
+     'description': 'Set up your GitHub account and learn the basics'},
+    {'id': 'concepts', 'title': 'Core Concepts', 'icon': '🎯', 'module': 'core_concepts',
+     'description': 'Master repository, commits, branches, and pull requests'},
+    {'id': 'first-repo', 'title': 'First Repository', 'icon': '💻', 'module': 'first_repository',
+     'description': 'Create your first repository with the Hello World tutorial'},
+    {'id': 'command-line', 'title': 'Command Line', 'icon': '⌨️', 'module': 'command_line',
+     'description': 'Learn Git commands and local to remote workflows'},
+    {'id': 'collaboration', 'title': 'Collaboration', 'icon': '🤝', 'module': 'collaboration',
+     'description': 'Work with others using branches and pull requests'},
+    {'id': 'best-practices', 'title': 'Best Practices', 'icon': '⭐', 'module': 'best_practices',
+     'description': 'Learn professional development workflows'},
+    {'id': 'real-projects', 'title': 'Real Projects', 'icon': '🚀', 'module': 'real_projects',
+     'description': 'Apply your skills with teen-friendly project ideas'},
+    {'id': 'practice', 'title': 'Practice Quiz', 'icon': '📝', 'module': 'practice',
+     'description': 'Test your knowledge with interactive quizzes'},
+    {'id': 'resources', 'title': 'Resources', 'icon': '📚', 'module': 'resources',
+     'description': 'External tools and references to continue your journey'},
+    {'id': 'quick-reference', 'title': 'Quick Reference', 'icon': '⚡', 'module': 'quick_reference',
+     'description': 'Command cheat sheet and concept summary'}
+]
+
+REGISTRY = PageRegistry(__name__, MANIFEST)
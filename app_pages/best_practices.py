@@ -0,0 +1,131 @@
+"""
+Best Practices page of the GitHub tutorial
+"""
+
+import streamlit as st
+from app_state import mark_page_completed
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    st.markdown('<div class="main-content">', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="page-header">
+        <h1>⭐ Best Practices</h1>
+        <p class="page-description">Learn professional development workflows and common mistakes to avoid</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    ## Writing Great Commit Messages 📝
+
+### Good Commit Message Structure:
+```
+type: Brief description (50 chars max)
+
+Longer explanation if needed. Explain what and why, not how.
+Break lines at 72 characters.
+
+Fixes #123
+```
+
+### Types of Commits:
+- **feat**: New feature
+- **fix**: Bug fix
+- **docs**: Documentation changes
+- **style**: Formatting changes
+- **refactor**: Code restructuring
+- **test**: Adding tests
+- **chore**: Maintenance tasks
+    """)
+    
+    # Interactive example
+    st.markdown("### ✨ Good Examples:")
+    
+    good_examples = CONTENT['good_examples']
+    
+    for example in good_examples:
+        st.success(f"✅ {example}")
+    
+    st.markdown("### ❌ Bad Examples:")
+    
+    bad_examples = CONTENT['bad_examples']
+    
+    for example in bad_examples:
+        st.error(f"❌ {example}")
+    
+    st.markdown("""
+    ## The .gitignore File 🚫
+
+A `.gitignore` file tells Git which files to **ignore**. This includes:
+- **Sensitive data** (passwords, API keys)
+- **Temporary files** (`.tmp`, `.log`)
+- **Build files** (compiled code, dependencies)
+- **IDE files** (project settings)
+- **OS files** (`.DS_Store`, `Thumbs.db`)
+    """)
+    
+    st.markdown("### Common .gitignore entries:")
+    
+    gitignore_content = """# Dependencies
+node_modules/
+vendor/
+__pycache__/
+
+# Build outputs
+dist/
+build/
+*.exe
+
+# Environment variables
+.env
+.env.local
+
+# IDE files
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# OS files
+.DS_Store
+Thumbs.db
+
+# Logs
+*.log
+logs/
+"""
+    
+    st.code(gitignore_content, language='gitignore')
+    
+    st.markdown("""
+    ## Common Mistakes to Avoid ⚠️
+
+### 1. Committing Large Files
+- **Problem**: Storing large files in Git
+- **Solution**: Use Git LFS or external storage
+
+### 2. Committing Secrets
+- **Problem**: Accidentally sharing passwords or API keys
+- **Solution**: Use `.gitignore` and environment variables
+
+### 3. Committing to Main Branch
+- **Problem**: Directly changing the main codebase
+- **Solution**: Always use feature branches and pull requests
+
+### 4. Not Writing Commit Messages
+- **Problem**: Unclear history
+- **Solution**: Write descriptive, meaningful messages
+
+### 5. Not Testing Before Committing
+- **Problem**: Breaking the build
+- **Solution**: Always test your changes locally
+    """)
+    
+    if st.button("✅ Mark Best Practices Complete"):
+        mark_page_completed("best-practices")
+        st.success("Perfect! You're following professional development practices.")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,92 @@
+"""
+Collaboration page of the GitHub tutorial
+"""
+
+import streamlit as st
+from app_state import mark_page_completed
+
+def render():
+    st.markdown('<div class="main-content">', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="page-header">
+        <h1>🤝 Collaboration</h1>
+        <p class="page-description">Learn to work with others using branches and pull requests</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    ## Why Collaborate on GitHub? 💡
+
+GitHub makes it easy for multiple people to work on the same project. It's like having a **shared workspace** where everyone can contribute their ideas.
+    """)
+    
+    st.markdown("""
+    ## The Branching Strategy 🌳
+
+### Main Branch (main)
+- **Stable code** that's ready to use
+- **Protected** from direct changes
+- **Source of truth** for the project
+
+### Feature Branches
+- **Experiment safely** without breaking the main code
+- **Develop new features** independently
+- **Easy to track** who is working on what
+    """)
+    
+    st.markdown("""
+    ## Pull Request Process 🔄
+
+### 1. Create a Feature Branch
+```bash
+git checkout -b feature/new-feature
+```
+
+### 2. Make Your Changes
+- Edit files
+- Add new features
+- Fix bugs
+- Write tests
+
+### 3. Commit and Push
+```bash
+git add .
+git commit -m "Add new feature"
+git push origin feature/new-feature
+```
+
+### 4. Open a Pull Request
+- **Navigate** to your repository on GitHub
+- **Click** "Pull requests" → "New pull request"
+- **Compare** your branch with main
+- **Write** a clear description
+- **Request reviews** from team members
+
+### 5. Code Review Process
+- **Team members** review your code
+- **Discuss changes** in comments
+- **Make modifications** if needed
+- **Approve** when ready to merge
+
+### 6. Merge Your Changes
+- **Click "Merge pull request"**
+- **Delete** the feature branch
+- **Celebrate** your contribution! 🎉
+    """)
+    
+    st.markdown("""
+    ## Best Practices for Collaboration ✨
+
+- **Write clear commit messages**
+- **Keep branches small and focused**
+- **Test your code** before creating a PR
+- **Be respectful** in code reviews
+- **Ask for help** when you're stuck
+    """)
+    
+    if st.button("✅ Mark Collaboration Complete"):
+        mark_page_completed("collaboration")
+        st.success("Excellent! You're ready to collaborate with others.")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,86 @@
+"""
+Command Line page of the GitHub tutorial
+"""
+
+import streamlit as st
+from app_state import mark_page_completed
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    st.markdown('<div class="main-content">', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="page-header">
+        <h1>⌨️ Command Line</h1>
+        <p class="page-description">Learn Git commands and workflows from local to remote</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    ## The Command Line Interface 🖥️
+
+The command line (also called **Terminal** or **Command Prompt**) is a text-based way to interact with your computer. Think of it as **talking directly to your computer** instead of clicking buttons.
+
+<div class="explanation-text">
+<strong>Why learn the command line?</strong>
+- **Faster workflows**: Complete tasks quickly
+- **Professional skills**: Developers use CLI daily
+- **More control**: Access advanced features
+- **Automation**: Script repetitive tasks
+</div>
+    """)
+    
+    st.markdown("""
+    ## Essential Git Commands 🚀
+    """)
+    
+    commands = CONTENT['commands']
+    
+    for cmd in commands:
+        st.markdown(f"""
+        ### {cmd['command']}
+        <div class="command-description">
+        <strong>What it does:</strong> {cmd['description']}
+        </div>
+        
+        <div class="command-analogy">
+        <strong>Think of it like:</strong> {cmd['analogy']}
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    ## Typical Workflow 📋
+    """)
+    
+    workflow_steps = """# 1. Create or open your project
+mkdir my-project
+cd my-project
+
+# 2. Initialize Git (one time only)
+git init
+
+# 3. Make changes to your files
+# (edit files in your code editor)
+
+# 4. Check what changed
+git status
+
+# 5. Stage your changes
+git add .
+
+# 6. Commit your changes
+git commit -m "Add new feature"
+
+# 7. Push to GitHub
+git push origin main
+"""
+    
+    st.code(workflow_steps, language='bash')
+    
+    if st.button("✅ Mark Command Line Complete"):
+        mark_page_completed("command-line")
+        st.success("Great work! You're getting comfortable with Git commands.")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,77 @@
+"""
+Core Concepts page of the GitHub tutorial
+"""
+
+import streamlit as st
+from app_state import mark_page_completed
+
+def render():
+    st.markdown('<div class="main-content">', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="page-header">
+        <h1>🎯 Core Concepts</h1>
+        <p class="page-description">Master the fundamental concepts of GitHub and version control</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    ## Repository (Repo) 📁
+
+A **repository** is like a project folder that contains all your files and the history of changes made to those files.
+
+<div class="explanation-text">
+<strong>Think of it like:</strong>
+- A **Google Drive folder** for your code
+- A **game save file** that remembers your progress
+- A **time machine** for your project
+</div>
+
+### What Makes a Repo Special?
+
+- **Version History**: See every change ever made
+- **Branches**: Create different versions of your project
+- **Collaborative**: Multiple people can work on the same project
+    """)
+    
+    st.markdown("""
+    ## Commits 💾
+
+A **commit** is like a **save point** in a video game. It records exactly what your project looks like at that moment.
+
+<div class="explanation-text">
+<strong>Each commit includes:</strong>
+- A **snapshot** of all your files
+- A **message** describing what changed
+- A **timestamp** of when it was saved
+- A **unique ID** to find it later
+</div>
+    """)
+    
+    st.markdown("""
+    ## Branches 🌳
+
+A **branch** is like a **parallel universe** for your project. You can make changes without affecting the main version.
+
+**Why use branches?**
+- **Experiment** with new features safely
+- **Work on different features** at the same time
+- **Prepare for collaboration** with others
+- **Test ideas** before merging them
+    """)
+    
+    st.markdown("""
+    ## Pull Requests (PRs) 🔄
+
+A **pull request** is like asking for permission to merge your changes. It's a way to:
+- **Review changes** before they're merged
+- **Discuss modifications** with your team
+- **Ensure quality** before combining code
+- **Document decisions** about the project
+    """)
+    
+    if st.button("✅ Mark Core Concepts Complete"):
+        mark_page_completed("concepts")
+        st.success("Excellent! You understand the core concepts of GitHub.")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,82 @@
+"""
+First Repository page of the GitHub tutorial
+"""
+
+import streamlit as st
+from app_state import mark_page_completed
+
+def render():
+    st.markdown('<div class="main-content">', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="page-header">
+        <h1>💻 First Repository</h1>
+        <p class="page-description">Create your first repository with the classic "Hello World" tutorial</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    ## Creating Your Hello World Repository 🚀
+
+Follow these steps to create your very first repository on GitHub!
+    """)
+    
+    st.markdown("""
+    ### Step 1: Create a New Repository
+
+1. **Sign in** to your GitHub account
+2. **Click the green "New" button** (or the "+" icon in the top right)
+3. **Repository name**: Type `hello-world`
+4. **Description**: "My first repository on GitHub"
+5. **Public or Private**: Choose public (so others can see it)
+6. **Check "Add a README file"**
+7. **Click "Create repository"** 🎉
+    """)
+    
+    st.markdown("""
+    ### Step 2: Understanding Your Repository
+
+Your new repository contains:
+- **README.md**: A file that describes your project
+- **.gitignore**: Tells Git which files to ignore
+- **Files**: Any code or documents you upload
+    """)
+    
+    st.markdown("""
+    ### Step 3: Edit Your README
+
+1. **Click the pencil icon** (✏️) to edit the README file
+2. **Add a description** about yourself or your project
+3. **Click "Commit changes"** to save your edits
+    """)
+    
+    # Interactive code block simulation
+    st.markdown("### 📝 Your First README Content:")
+    
+    readme_content = """# Hello, World! 👋
+
+I'm [Your Name] and this is my first GitHub repository!
+
+## About Me
+- I'm learning to use GitHub
+- I like [your interests]
+- I'm excited to build cool projects
+
+## What I'm Learning
+- GitHub basics
+- Version control
+- Collaboration
+
+---
+
+*This README was created as part of my GitHub learning journey.*
+"""
+    
+    st.code(readme_content, language='markdown')
+    
+    if st.button("✅ Mark First Repository Complete"):
+        mark_page_completed("first-repo")
+        st.success("Fantastic! You've created your first repository!")
+        st.balloons()
+    
+    st.markdown('</div>', unsafe_allow_html=True)
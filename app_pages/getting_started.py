@@ -0,0 +1,51 @@
+"""
+Getting Started page of the GitHub tutorial
+"""
+
+import streamlit as st
+from app_state import mark_page_completed
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    st.markdown('<div class="main-content">', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="page-header">
+        <h1>📖 Getting Started</h1>
+        <p class="page-description">Set up your GitHub account and learn the basics of version control</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    ## What is GitHub? 🤔
+
+GitHub is like a **digital locker** for your code projects. Just like how you might use Google Drive or iCloud to store your photos and documents, GitHub helps programmers store, track, and share their code.
+
+### Why Should You Care? 💡
+
+- **Show off your projects**: Create a portfolio of your work
+- **Work with others**: Collaborate on team projects
+- **Learn from others**: Explore millions of open source projects
+- **Save your work**: Never lose your code again!
+- **Real-world skills**: Professional developers use GitHub daily
+    """)
+    
+    st.markdown("## Setup Checklist ✅")
+    
+    checklist_items = CONTENT['checklist_items']
+    
+    for i, item in enumerate(checklist_items, 1):
+        col1, col2 = st.columns([1, 5])
+        with col1:
+            st.write(f"{i}.")
+        with col2:
+            st.write(item)
+    
+    if st.button("✅ Mark Getting Started Complete"):
+        mark_page_completed("getting-started")
+        st.success("Great job! You've completed the Getting Started section.")
+        st.balloons()
+    
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,94 @@
+"""
+Home page of the GitHub tutorial
+"""
+
+import streamlit as st
+from app_pages import REGISTRY
+from app_state import navigate_to
+
+# Lessons shown as cards on the learning path
+LEARNING_PATH = ('getting-started', 'concepts', 'first-repo', 'command-line', 'collaboration', 'best-practices')
+
+def render():
+    st.markdown('<div class="main-content">', unsafe_allow_html=True)
+    
+    # Hero section
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown("""
+        <div class="hero-section">
+            <h1>Learn GitHub Like a Pro</h1>
+            <p class="hero-subtitle">Master version control with GitHub in this interactive tutorial designed for 9th graders</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Dashboard widgets
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="dashboard-card">
+            <h3>📊 Progress</h3>
+            <div class="progress-circle">{progress}%</div>
+            <p>{completed} of {total} lessons completed</p>
+        </div>
+        """.format(
+            progress=st.session_state.progress.overall_progress,
+            completed=st.session_state.progress.completed_count,
+            total=st.session_state.progress.total_pages
+        ), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="dashboard-card">
+            <h3>🏆 Achievements</h3>
+            <div class="achievement-count">{unlocked}</div>
+            <p>Achievements unlocked</p>
+        </div>
+        """.format(
+            unlocked=st.session_state.progress.unlocked_count
+        ), unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="dashboard-card">
+            <h3>📚 Current Focus</h3>
+            <div class="current-focus">Next Lesson</div>
+            <p>Continue your journey</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Learning path
+    st.markdown("### 🛤️ Learning Path")
+    
+    learning_modules = [REGISTRY.pages[page_id] for page_id in LEARNING_PATH]
+    
+    cols = st.columns(3)
+    for i, module in enumerate(learning_modules):
+        with cols[i % 3]:
+            status = st.session_state.progress.is_completed(module['id'])
+            is_visited = st.session_state.progress.is_visited(module['id'])
+            
+            if status:
+                status_text = "✅ Completed"
+                card_class = "module-card completed"
+            elif is_visited:
+                status_text = "🔄 In Progress"
+                card_class = "module-card in-progress"
+            else:
+                status_text = "⭕ Not Started"
+                card_class = "module-card not-started"
+            
+            st.markdown(f"""
+            <div class="{card_class}">
+                <div class="module-icon">{module['icon']}</div>
+                <h4>{module['title']}</h4>
+                <p>{module['description']}</p>
+                <div class="module-status">{status_text}</div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            st.button(f"Start {module['title']}", key=f"start_{module['id']}", use_container_width=True,
+                      on_click=navigate_to, args=(module['id'],))
+    
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,153 @@
+"""
+Practice Quiz page of the GitHub tutorial
+"""
+
+import streamlit as st
+from app_state import mark_page_completed, record_quiz_score, rehydrating_callback
+from quiz_bank import load_quiz_bank
+
+# Button callbacks: each applies its transition before the one rerun the click causes
+@rehydrating_callback
+def submit_answer(question_idx, options):
+    selected_answer = st.session_state.get(f"q_{question_idx}")
+    if selected_answer is not None:
+        st.session_state.answers[question_idx] = options.index(selected_answer)
+        st.session_state.show_feedback = True
+
+@rehydrating_callback
+def next_question(section_key):
+    st.session_state.current_question += 1
+    st.session_state.show_feedback = False
+    questions = load_quiz_bank().sections[section_key]["questions"]
+    if st.session_state.current_question == len(questions):
+        # The score is saved once, on the transition to results
+        answers = st.session_state.answers
+        correct_answers = sum(1 for i, question in enumerate(questions) if answers.get(i) == question["correct"])
+        record_quiz_score(section_key, correct_answers, len(questions),
+                          [answers.get(i, -1) for i in range(len(questions))])
+
+@rehydrating_callback
+def retake_quiz():
+    st.session_state.current_question = 0
+    st.session_state.answers = {}
+    st.session_state.show_feedback = False
+    st.session_state.quiz_completed = False
+
+def render():
+    st.markdown('<div class="main-content">', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="page-header">
+        <h1>📝 Practice Quiz</h1>
+        <p class="page-description">Test your knowledge with interactive quizzes</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Quiz sections from the shared question bank
+    quiz_bank = load_quiz_bank()
+    
+    # Section selector
+    section_key = st.selectbox(
+        "Select a quiz section:",
+        quiz_bank.section_keys,
+        format_func=lambda key: quiz_bank.sections[key]["title"]
+    )
+    
+    # Initialize quiz state
+    if 'current_quiz_section' not in st.session_state:
+        st.session_state.current_quiz_section = section_key
+        st.session_state.current_question = 0
+        st.session_state.answers = {}
+        st.session_state.show_feedback = False
+        st.session_state.quiz_completed = False
+    
+    # Reset if section changed
+    if st.session_state.current_quiz_section != section_key:
+        st.session_state.current_quiz_section = section_key
+        st.session_state.current_question = 0
+        st.session_state.answers = {}
+        st.session_state.show_feedback = False
+        st.session_state.quiz_completed = False
+    
+    quiz_data = quiz_bank.sections[section_key]
+    current_q = st.session_state.current_question
+    total_q = quiz_data["question_count"]
+    
+    if current_q < total_q and not st.session_state.quiz_completed:
+        question_data = quiz_data["questions"][current_q]
+        
+        st.markdown(f"### Question {current_q + 1} of {total_q}")
+        st.progress((current_q) / total_q)
+        
+        st.markdown(f"**{question_data['question']}**")
+        
+        selected_answer = st.radio(
+            "Select your answer:",
+            question_data["options"],
+            key=f"q_{current_q}"
+        )
+        
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.button("Submit Answer", disabled=selected_answer is None,
+                      on_click=submit_answer, args=(current_q, question_data["options"]))
+        
+        with col2:
+            st.button("Skip Question", on_click=next_question, args=(section_key,))
+        
+        # Show feedback
+        if st.session_state.show_feedback and current_q in st.session_state.answers:
+            is_correct = st.session_state.answers[current_q] == question_data["correct"]
+            
+            if is_correct:
+                st.success("✅ Correct!")
+            else:
+                st.error("❌ Incorrect")
+            
+            st.info(f"**Explanation:** {question_data['explanation']}")
+            
+            st.button("Next Question", on_click=next_question, args=(section_key,))
+    
+    else:
+        # Show results
+        st.markdown("### Quiz Results 🎉")
+        
+        correct_answers = sum(
+            1 for i, answer in st.session_state.answers.items()
+            if answer == quiz_data["questions"][i]["correct"]
+        )
+        
+        score_percentage = int((correct_answers / total_q) * 100)
+        
+        st.markdown(f"**Score: {correct_answers}/{total_q} ({score_percentage}%)**")
+        
+        if score_percentage >= 90:
+            st.balloons()
+            st.success("🏆 Excellent work!")
+        elif score_percentage >= 70:
+            st.success("👍 Good job!")
+        else:
+            st.info("💪 Keep learning!")
+        
+        # Show detailed results
+        st.markdown("### Detailed Results")
+        for i, question_data in enumerate(quiz_data["questions"]):
+            user_answer = st.session_state.answers.get(i)
+            is_correct = user_answer == question_data["correct"]
+            
+            status = "✅" if is_correct else "❌"
+            st.markdown(f"{status} **Q{i+1}:** {question_data['question']}")
+            
+            if user_answer is not None:
+                st.markdown(f"   Your answer: {question_data['options'][user_answer]}")
+                if not is_correct:
+                    st.markdown(f"   Correct answer: {question_data['options'][question_data['correct']]}")
+        
+        # Retake quiz
+        st.button("🔄 Retake Quiz", on_click=retake_quiz)
+    
+    if st.button("✅ Mark Practice Complete"):
+        mark_page_completed("practice")
+        st.success("Great job on completing the practice section!")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
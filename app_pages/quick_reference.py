@@ -0,0 +1,130 @@
+"""
+Quick Reference page of the GitHub tutorial
+"""
+
+import streamlit as st
+from app_state import mark_page_completed
+from cheat_sheet import COMMANDS, CONCEPTS, load_reference_index
+
+def render():
+    st.markdown('<div class="main-content">', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="page-header">
+        <h1>⚡ Quick Reference</h1>
+        <p class="page-description">Command cheat sheet and concept summary</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Lookup across commands, concepts and the cheat sheet
+    search_term = st.text_input("🔍 Look up a command or concept:", placeholder="e.g. comit, branch, pull request")
+    if search_term:
+        search_results = load_reference_index().results(search_term, limit=5)
+        for term, meaning, _, _ in search_results:
+            st.markdown(f"- **{term}**: {meaning}")
+        if not search_results:
+            st.info(f"No results found for '{search_term}'")
+    
+    st.markdown("""
+    ## Essential Git Commands 🚀
+    """)
+    
+    # Display the Git commands as a nice table
+    for cmd, desc in COMMANDS:
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            st.code(cmd)
+        with col2:
+            st.write(desc)
+    
+    st.markdown("---")
+    
+    st.markdown("""
+    ## Concept Quick Reference 📋
+    """)
+    
+    for term, definition in CONCEPTS.items():
+        st.markdown(f"**{term}**: {definition}")
+    
+    st.markdown("---")
+    
+    st.markdown("""
+    ## Workflow Cheat Sheet 📝
+
+### Starting a New Project
+```bash
+# 1. Create project folder
+mkdir my-project
+cd my-project
+
+# 2. Initialize Git
+git init
+
+# 3. Create files and make changes
+# (edit your files)
+
+# 4. Stage and commit
+git add .
+git commit -m "Initial commit"
+
+# 5. Create repository on GitHub
+# (do this on GitHub.com)
+
+# 6. Connect and push
+git remote add origin <your-repo-url>
+git push -u origin main
+```
+    """)
+    
+    st.markdown("""
+### Working on an Existing Project
+```bash
+# 1. Clone the repository
+git clone <repository-url>
+
+# 2. Create a feature branch
+git checkout -b feature/new-feature
+
+# 3. Make your changes
+# (edit files)
+
+# 4. Stage and commit
+git add .
+git commit -m "Add new feature"
+
+# 5. Push to GitHub
+git push origin feature/new-feature
+
+# 6. Create pull request on GitHub
+# (do this on GitHub.com)
+```
+    """)
+    
+    st.markdown("""
+    ## GitHub Actions (Bonus) ⚡
+
+### Create a Simple Workflow
+1. **Create** `.github/workflows/` folder
+2. **Add** a YAML file (e.g., `build.yml`)
+3. **Define** your workflow
+4. **Commit and push** to see it in action!
+
+### Example Workflow
+```yaml
+name: Build and Test
+on: [push, pull_request]
+jobs:
+  build:
+    runs-on: ubuntu-latest
+    steps:
+    - uses: actions/checkout@v2
+    - name: Run tests
+      run: npm test
+```
+    """)
+    
+    if st.button("✅ Mark Quick Reference Complete"):
+        mark_page_completed("quick-reference")
+        st.success("Perfect! You have a handy reference for Git and GitHub.")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,84 @@
+"""
+Real Projects page of the GitHub tutorial
+"""
+
+import streamlit as st
+from app_state import mark_page_completed
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    st.markdown('<div class="main-content">', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="page-header">
+        <h1>🚀 Real Projects</h1>
+        <p class="page-description">Apply your skills with these teen-friendly project ideas</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    ## Project Ideas for Your Portfolio 💼
+
+Now that you know the basics, let's put your skills to work! Here are some project ideas that are perfect for your skill level and interests.
+    """)
+    
+    projects = CONTENT['projects']
+    
+    for project in projects:
+        difficulty_color = {
+            "Beginner": "🟢",
+            "Intermediate": "🟡",
+            "Advanced": "🔴"
+        }[project["difficulty"]]
+        
+        st.markdown(f"""
+        ### {difficulty_color} {project['title']} ({project['difficulty']})
+
+**What it is:** {project['description']}
+
+**What you'll learn:** {', '.join(project['skills'])}
+
+**Why it's awesome:** {project['why_cool']}
+        """)
+        
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            if st.button(f"💡 Get Started with {project['title']}", key=f"project_{project['title']}"):
+                st.info("This feature is coming soon! Check back later.")
+        with col2:
+            if st.button(f"📖 View Example", key=f"example_{project['title']}"):
+                st.info("Example projects coming soon!")
+        
+        st.markdown("---")
+    
+    st.markdown("""
+    ## Project Planning Tips 📋
+
+### 1. Start Small
+- Break big projects into smaller tasks
+- Complete one feature at a time
+- Don't try to build everything at once
+
+### 2. Document Your Process
+- Write clear README files
+- Add comments to your code
+- Create tutorials for others
+
+### 3. Get Feedback
+- Share your projects with friends
+- Ask for code reviews
+- Join GitHub communities
+
+### 4. Keep Learning
+- Explore new technologies
+- Read other people's code
+- Take online courses
+    """)
+    
+    if st.button("✅ Mark Real Projects Complete"):
+        mark_page_completed("real-projects")
+        st.success("Awesome! You're ready to build real projects!")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
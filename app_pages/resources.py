@@ -0,0 +1,140 @@
+"""
+Resources page of the GitHub tutorial
+"""
+
+import streamlit as st
+from app_state import mark_page_completed
+
+def render():
+    st.markdown('<div class="main-content">', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="page-header">
+        <h1>📚 Resources</h1>
+        <p class="page-description">External tools and references to continue your GitHub journey</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    ## Official GitHub Resources 🔗
+
+### GitHub Skills
+- **Learn GitHub**: Interactive tutorials right on GitHub
+- **URL**: skills.github.com
+- **What you'll learn**: Real GitHub workflows through hands-on exercises
+
+### GitHub Documentation
+- **Pro Git Book**: Free online book about Git
+- **GitHub Guides**: Step-by-step tutorials
+- **GitHub Learning Lab**: Interactive learning experience
+    """)
+    
+    st.markdown("""
+    ## Interactive Learning Tools 🎮
+
+### Learn Git Branching
+- **Visual Git**: See how Git commands affect the repository
+- **URL**: learngitbranching.js.org
+- **Great for**: Understanding branching and merging
+
+### GitHub Desktop
+- **Visual Interface**: Use Git without command line
+- **Free**: Available for Windows, Mac, Linux
+- **Perfect for**: Beginners who want GUI
+
+### Visual Studio Code with Git
+- **Integrated**: Built-in Git support
+- **Extensions**: GitLens for advanced features
+- **Recommended**: If you like coding in VS Code
+    """)
+    
+    st.markdown("""
+    ## Practice Platforms 💪
+
+### Hacktoberfest
+- **Annual Event**: October, celebrate open source
+- **Free T-Shirt**: Complete 4 pull requests
+- **Great for**: Real-world collaboration practice
+
+### First Timers Only
+- **Beginner-Friendly**: Issues labeled for newcomers
+- **URL**: firsttimersonly.com
+- **Perfect for**: First open source contribution
+
+### Up for Grabs
+- **Beginner Issues**: Projects looking for help
+- **URL**: up-for-grabs.net
+- **Variety**: Many different technologies
+    """)
+    
+    st.markdown("""
+    ## YouTube Channels 📺
+
+### GitHub Training & Guides
+- **Official Channel**: GitHub's official tutorials
+- **Content**: Feature announcements, deep dives
+
+### The Net Ninja
+- **Git Tutorial Series**: Comprehensive Git course
+- **Beginner Friendly**: Starts from absolute basics
+
+### Traversy Media
+- **Practical Projects**: Real-world Git workflows
+- **Intermediate**: For those ready to build projects
+    """)
+    
+    st.markdown("""
+    ## Books and Reading 📖
+
+### "Pro Git" (Free Online)
+- **Comprehensive**: Everything about Git
+- **Free**: Available at git-scm.com/book
+- **Advanced**: For serious learners
+
+### "Learn Enough Git to Be Dangerous"
+- **Practical**: Focus on essential commands
+- **Beginner**: Great starting point
+    """)
+    
+    st.markdown("""
+    ## Communities and Support 🤝
+
+### Stack Overflow
+- **Questions**: Get help with specific problems
+- **Search**: Find answers to common issues
+- **Community**: Experienced developers helping beginners
+
+### Reddit
+- **r/github**: GitHub-specific discussions
+- **r/git**: Git version control discussions
+- **r/learnprogramming**: General programming help
+
+### Discord Servers
+- **GitHub Community**: Official Discord server
+- **Programming Communities**: Find beginner-friendly servers
+    """)
+    
+    st.markdown("""
+    ## Next Steps 🚀
+
+### 1. Keep Practicing
+- Create personal projects
+- Contribute to open source
+- Help friends with their repositories
+
+### 2. Explore Advanced Topics
+- GitHub Actions (automation)
+- GitHub Pages (hosting websites)
+- Security features (code scanning, dependency tracking)
+
+### 3. Join the Community
+- Follow GitHub on social media
+- Attend local meetups
+- Share your learning journey
+    """)
+    
+    if st.button("✅ Mark Resources Complete"):
+        mark_page_completed("resources")
+        st.success("Great! You have all the resources you need to continue learning.")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
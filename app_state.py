@@ -0,0 +1,122 @@
+"""
+Session state and progress tracking for the GitHub tutorial
+Shared by every section of the app: one progress record per learner, whichever
+section a page or quiz belongs to
+"""
+
+import functools
+
+import streamlit as st
+from notifications import queue_notification
+from achievements import ACHIEVEMENT_DEFINITIONS, ENGINE, EVENT_VISIT, EVENT_PAGE_COMPLETED, EVENT_QUIZ_SCORED
+from progress import Progress, QuizScore
+from progress_store import forget_resume_token, get_progress_store, keep_resume_token, load_progress, resume_learner_id
+from timing import DwellClock
+
+# Session state the reaper may drop from an idle session; progress comes back from the store
+REBUILDABLE_KEYS = ('progress', 'quiz_data', 'current_quiz_section', 'current_question', 'answers',
+                    'show_feedback', 'quiz_completed', 'current_quiz', 'current_question_index', 'quiz_answers',
+                    'quiz_state', 'visual_guides', 'page_clock')
+
+# Initialize session state for progress tracking
+def initialize_session_state():
+    # A reconnecting browser carries its resume token in the URL
+    if 'learner_id' not in st.session_state:
+        st.session_state.learner_id = resume_learner_id()
+    keep_resume_token(st.session_state.learner_id)
+    
+    if 'progress' not in st.session_state:
+        st.session_state.progress = load_progress(st.session_state.learner_id, 'app', Progress)
+    
+    if 'page_clock' not in st.session_state:
+        st.session_state.page_clock = DwellClock()
+    
+    if 'quiz_data' not in st.session_state:
+        st.session_state.quiz_data = {
+            'current_section': None,
+            'current_question': 0,
+            'answers': {},
+            'show_feedback': False,
+            'quiz_completed': False
+        }
+
+def rehydrating_callback(callback):
+    """Wrap a widget callback that reads state the reaper may have dropped from an idle session
+
+    Callbacks run before the script, so the first click after an eviction would find
+    its keys gone. The shared state is reloaded from the store instead and the click
+    is dropped: it belonged to a page whose state no longer exists, and the run that
+    follows rebuilds that page.
+    """
+    @functools.wraps(callback)
+    def guarded(*args, **kwargs):
+        if 'progress' not in st.session_state:
+            initialize_session_state()
+            return None
+        return callback(*args, **kwargs)
+    return guarded
+
+# Progress tracking functions
+def mark_page_visited(page_id):
+    record_dwell(page_id)
+    st.session_state.progress.visit(page_id)
+    
+    # Check for achievements
+    check_achievements(EVENT_VISIT)
+    save_progress()
+
+def record_dwell(page_id):
+    """Credit the time since the previous run to the page it showed, then start timing ``page_id``"""
+    previous, dwell_ms = st.session_state.page_clock.switch(page_id)
+    if previous is not None:
+        st.session_state.progress.add_dwell(previous, dwell_ms)
+
+def mark_page_completed(page_id):
+    if st.session_state.progress.complete(page_id):
+        # Check for achievements
+        check_achievements(EVENT_PAGE_COMPLETED)
+        save_progress()
+
+def record_quiz_score(section, score, total_questions, answers=()):
+    st.session_state.progress.record_score(section, QuizScore(score, total_questions, answers=answers))
+    
+    # Check for quiz-related achievements
+    check_achievements(EVENT_QUIZ_SCORED)
+    save_progress()
+
+def compact_session_state(state):
+    """Drop per-interaction history of the interactive features that is no longer shown"""
+    quiz_state = state.get('quiz_state')
+    if quiz_state:
+        section_key = quiz_state['current_section']
+        # Other sections' answers are already summarised in their saved scores
+        quiz_state['answers'].keep_only(section_key)
+    visual_guides = state.get('visual_guides')
+    if visual_guides:
+        for title in visual_guides['completed_demos']:
+            visual_guides['demo_progress'].pop(title, None)
+
+def save_progress():
+    """Queue the session's progress for the background writer"""
+    get_progress_store().save(st.session_state.learner_id, 'app', st.session_state.progress)
+
+def navigate_to(page_id):
+    """Switch pages; used as a button callback so the switch lands before the rerun"""
+    st.session_state.current_page = page_id
+
+def reset_progress():
+    """Forget the learner's stored progress and start a fresh session"""
+    get_progress_store().delete(st.session_state.learner_id)
+    forget_resume_token()
+    st.session_state.clear()
+
+# Achievement system
+def check_achievements(event):
+    progress = st.session_state.progress
+    for achievement_id in ENGINE.evaluate(event, progress):
+        progress.unlock(achievement_id)
+        achievement_def = ACHIEVEMENT_DEFINITIONS[achievement_id]
+        show_achievement_unlock(achievement_def['title'], achievement_def['description'])
+
+def show_achievement_unlock(title, message):
+    queue_notification(f"🏆 Achievement Unlocked: {title} - {message}", "achievement")
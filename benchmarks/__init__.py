@@ -0,0 +1,16 @@
+"""
+Offline benchmarks for the tutorial apps
+Run with ``python -m benchmarks.<name>`` from the repository root
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+
+# Benchmarks drive the apps as made-up learners; their progress goes to a scratch
+# database, never the one next to the app that the teacher analytics read
+SCRATCH_DIR = tempfile.mkdtemp(prefix="learngit-benchmarks-")
+SCRATCH_PROGRESS_DB = os.path.join(SCRATCH_DIR, "progress.sqlite3")
+os.environ["LEARNGIT_PROGRESS_DB"] = SCRATCH_PROGRESS_DB
+atexit.register(shutil.rmtree, SCRATCH_DIR, ignore_errors=True)
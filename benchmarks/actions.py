@@ -0,0 +1,197 @@
+"""
+Script executions per user action
+Clicks through the navigation, quiz and guide flows of the three sections,
+on their own and inside the single app, with AppTest and counts how many
+times the script ran for each action. A button
+that changes state in its body and then calls st.rerun() costs two runs; an
+on_click callback applies the change before the one run the click causes.
+
+    python -m benchmarks.actions
+
+Each action also checks the state it should have produced, so a click that
+is lost (a button drawn only on the run that followed another click) fails
+instead of looking cheap. Exits 1 when an action takes more runs than its
+budget or has no effect.
+"""
+
+import argparse
+import sys
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Tuple
+
+from streamlit.runtime.scriptrunner import ScriptRunnerEvent
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+from benchmarks.common import load_app
+from benchmarks.tab_elements import FEATURE_TABS
+
+# (name, prepare the run, check the session state afterwards, allowed runs)
+Action = Tuple[str, Callable, Callable, int]
+
+GUIDES_TAB = FEATURE_TABS[2]
+
+@contextmanager
+def counting_runs():
+    """Count script starts across every AppTest run in the block, st.rerun() included"""
+    counter = {'runs': 0}
+    original = LocalScriptRunner.__init__
+
+    def __init__(self, *args, **kwargs):
+        original(self, *args, **kwargs)
+
+        def count(sender, event, **kwargs):
+            if event == ScriptRunnerEvent.SCRIPT_STARTED:
+                counter['runs'] += 1
+        self.on_event.connect(count, weak=False)
+
+    LocalScriptRunner.__init__ = __init__
+    try:
+        yield counter
+    finally:
+        LocalScriptRunner.__init__ = original
+
+def _noop(at):
+    pass
+
+def _always(at):
+    return True
+
+def _click(label: str) -> Callable:
+    def step(at):
+        next(button for button in at.button if button.label.startswith(label)).click()
+    return step
+
+def _click_key(key: str) -> Callable:
+    def step(at):
+        at.button(key=key).click()
+    return step
+
+def _choose_first(at):
+    radio = at.main.radio[0]
+    radio.set_value(radio.options[0])
+
+def _set_state(key: str, value) -> Callable:
+    def step(at):
+        at.session_state[key] = value
+    return step
+
+def _open_section(script: str) -> Callable:
+    # The browser's navigation menu, for a section of the single app
+    def step(at):
+        at.switch_page(script)
+    return step
+
+def _in_tab(label: str, step: Callable) -> Callable:
+    # AppTest does not send tab state back, so the open tab is set with every action
+    def in_tab(at):
+        at.session_state['feature_tab'] = label
+        step(at)
+    return in_tab
+
+def _state_is(key: str, value) -> Callable:
+    return lambda at: key in at.session_state and at.session_state[key] == value
+
+def _app_quiz(questions: int) -> List[Action]:
+    actions = []
+    for number in range(questions):
+        actions += [
+            (f"choose answer {number + 1}", _choose_first, _always, 1),
+            (f"submit {number + 1}", _click("Submit Answer"), _state_is('show_feedback', True), 1),
+            (f"next {number + 1}", _click("Next Question"), _state_is('current_question', number + 1), 1),
+        ]
+    return actions
+
+def _content_quiz(questions: int) -> List[Action]:
+    actions = []
+    for number in range(questions):
+        last = number == questions - 1
+        actions += [
+            (f"choose answer {number + 1}", _choose_first, _always, 1),
+            (f"submit {number + 1}", _click("Submit Answer"),
+             lambda at, count=number + 1: len(at.session_state['quiz_answers']) == count, 1),
+            (f"{'view results' if last else 'next'} {number + 1}", _click("View Results" if last else "Next Question"),
+             _state_is('current_question_index', number + 1), 1),
+        ]
+    return actions
+
+SCENARIOS: Dict[str, List[Action]] = {
+    'app.py': (
+        [("initial load", _noop, _state_is('current_page', 'home'), 1),
+         ("sidebar to core concepts", _click_key('concepts'), _state_is('current_page', 'concepts'), 1),
+         ("sidebar to home", _click_key('home'), _state_is('current_page', 'home'), 1),
+         ("home card start", _click_key('start_getting-started'), _state_is('current_page', 'getting-started'), 1),
+         ("sidebar to practice", _click_key('practice'), _state_is('current_page', 'practice'), 1)]
+        + _app_quiz(2)
+        + [("skip question", _click("Skip Question"), _state_is('current_question', 3), 1),
+           ("retake quiz", _click("🔄 Retake Quiz"), _state_is('current_question', 0), 1),
+           ("reset progress", _click("🔄 Reset Progress"), _state_is('current_page', 'home'), 1)]
+    ),
+    'content.py': (
+        [("initial load", _noop, _state_is('nav_page', 'Home'), 1),
+         ("home take practice quiz", _click("🎯 Take Practice Quiz"), _state_is('nav_page', 'Practice'), 1),
+         ("start quiz", _click("Start Quiz"), _state_is('current_quiz', 'core-concepts'), 1)]
+        + _content_quiz(3)
+        + [("take another quiz", _click("Take Another Quiz"), _state_is('current_quiz', None), 1)]
+    ),
+    'features.py': (
+        [("initial load", _noop, _always, 1),
+         ("open visual guides", _set_state('feature_tab', GUIDES_TAB), _always, 1),
+         ("guide next", _in_tab(GUIDES_TAB, _click("Next ➡️")), _state_is('current_step', 1), 1),
+         ("guide next again", _in_tab(GUIDES_TAB, _click("Next ➡️")), _state_is('current_step', 2), 1),
+         ("guide previous", _in_tab(GUIDES_TAB, _click("⬅️ Previous")), _state_is('current_step', 1), 1),
+         ("mark step complete", _in_tab(GUIDES_TAB, _click("✅ Mark Step")),
+          lambda at: bool(at.session_state['visual_guides']['completed_demos']), 1)]
+    ),
+    'streamlit_app.py': (
+        [("initial load", _noop, _state_is('current_page', 'home'), 1),
+         ("sidebar to core concepts", _click_key('concepts'), _state_is('current_page', 'concepts'), 1),
+         ("open lessons", _open_section('content.py'), _state_is('nav_page', 'Home'), 1),
+         ("lessons to core concepts", _set_state('nav_page', 'Core Concepts'), _always, 1),
+         ("complete the lesson", _click("✅ Mark Core Concepts"),
+          lambda at: at.session_state['progress'].is_completed('concepts'), 1),
+         ("open interactive features", _open_section('features.py'), lambda at: 'quiz_state' in at.session_state, 1),
+         ("back to the tutorial", _open_section('app.py'), _state_is('current_page', 'concepts'), 1)]
+    ),
+}
+
+def replay(script: str, actions: List[Action]) -> List[Dict]:
+    """Run one scenario from a fresh session, counting runs per action"""
+    at = load_app(script)
+    results = []
+    with counting_runs() as counter:
+        for name, prepare, check, budget in actions:
+            before = counter['runs']
+            try:
+                prepare(at)
+            except (StopIteration, KeyError, IndexError):
+                # The widget this action uses was never drawn
+                results.append({'name': name, 'runs': 0, 'budget': budget, 'applied': False})
+                continue
+            at.run()
+            if at.exception:
+                raise RuntimeError(f"{script} / {name}: {at.exception[0].value}")
+            results.append({'name': name, 'runs': counter['runs'] - before, 'budget': budget, 'applied': check(at)})
+    return results
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('scripts', nargs='*', default=list(SCENARIOS), help="entry points to replay")
+    args = parser.parse_args(argv)
+
+    failures = []
+    print(f"{'Action':<36}{'runs':>6}{'budget':>8}  effect")
+    for script in args.scripts:
+        results = replay(script, SCENARIOS[script])
+        clicks = [result for result in results if result['name'] != "initial load"]
+        print(f"{script}  ({sum(result['runs'] for result in clicks) / len(clicks):.2f} runs per action)")
+        for result in results:
+            applied = "ok" if result['applied'] else "NO EFFECT"
+            print(f"  {result['name']:<34}{result['runs']:>6}{result['budget']:>8}  {applied}")
+            if result['runs'] > result['budget'] or not result['applied']:
+                failures.append(f"{script} / {result['name']}")
+    for failure in failures:
+        print(f"FAILED {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Classroom analytics over a school-sized answer matrix
+Generates answers for a synthetic school, where a learner's chance of getting
+a question right rises with ability and falls with the question's difficulty
+and a fifth of the answers are missing, then times the item statistics and
+checks them against a per-question reference on a sample of columns.
+
+    python -m benchmarks.analytics --students 50000 --questions 500
+
+BLAS runs on one thread, so the figure is for one core. Exits 1 when the
+statistics take longer than the budget or disagree with the reference.
+"""
+
+import os
+
+# Before NumPy loads its BLAS
+for variable in ('OPENBLAS_NUM_THREADS', 'OMP_NUM_THREADS', 'MKL_NUM_THREADS'):
+    os.environ.setdefault(variable, '1')
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from classroom_analytics import item_statistics
+
+OPTIONS = 4
+MISSING = 0.2
+BUDGET_MS = 1000
+
+def school(students: int, questions: int, seed: int = 0):
+    """(answer matrix, answer key, option counts) for a synthetic school"""
+    rng = np.random.default_rng(seed)
+    correct = rng.integers(0, OPTIONS, questions).astype(np.int8)
+    ability = rng.normal(size=(students, 1)).astype(np.float32)
+    difficulty = rng.normal(size=questions).astype(np.float32)
+    right = rng.random((students, questions), dtype=np.float32) < 1 / (1 + np.exp(difficulty - ability))
+    wrong = (correct + rng.integers(1, OPTIONS, (students, questions))) % OPTIONS
+    matrix = np.where(right, correct, wrong).astype(np.int8)
+    matrix[rng.random((students, questions), dtype=np.float32) < MISSING] = -1
+    return matrix, correct, np.full(questions, OPTIONS, dtype=np.int8)
+
+def reference(matrix: np.ndarray, correct: np.ndarray, column: int):
+    """Difficulty, discrimination and option shares of one column, computed directly"""
+    answered = matrix[:, column] >= 0
+    right = (matrix == correct).sum(axis=1)
+    item = (matrix[answered, column] == correct[column]).astype(float)
+    shares = np.bincount(matrix[answered, column], minlength=OPTIONS) / answered.sum()
+    return item.mean(), np.corrcoef(item, right[answered] - item)[0, 1], shares
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--students', type=int, default=50000)
+    parser.add_argument('--questions', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs; the best one counts")
+    args = parser.parse_args(argv)
+
+    matrix, correct, option_counts = school(args.students, args.questions)
+    timings = []
+    for _ in range(args.repeat):
+        began = time.perf_counter()
+        stats = item_statistics(matrix, correct, option_counts)
+        timings.append((time.perf_counter() - began) * 1000)
+    best = min(timings)
+
+    mismatched = []
+    for column in np.linspace(0, args.questions - 1, 5).astype(int):
+        difficulty, discrimination, shares = reference(matrix, correct, column)
+        if not (np.isclose(stats.difficulty[column], difficulty)
+                and np.isclose(stats.discrimination[column], discrimination)
+                and np.allclose(stats.option_shares[column], shares)):
+            mismatched.append(int(column))
+
+    print(f"{args.students:,} students x {args.questions} questions ({matrix.nbytes / 2**20:.1f} MB int8)")
+    print(f"  item statistics  {best:8.1f} ms  budget {BUDGET_MS} ms  {'ok' if best <= BUDGET_MS else 'OVER BUDGET'}")
+    print(f"  difficulty {np.nanmin(stats.difficulty):.2f}..{np.nanmax(stats.difficulty):.2f}  "
+          f"discrimination {np.nanmin(stats.discrimination):.2f}..{np.nanmax(stats.discrimination):.2f}")
+    for column in mismatched:
+        print(f"  MISMATCH column {column}")
+    return 1 if best > BUDGET_MS or mismatched else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
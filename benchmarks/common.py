@@ -0,0 +1,29 @@
+"""
+Shared helpers for driving the apps headlessly with AppTest
+"""
+
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+def load_app(script: str, timeout: float = 30) -> AppTest:
+    """Create an AppTest for one of the entry-point scripts in the repo root"""
+    return AppTest.from_file(str(REPO_ROOT / script), default_timeout=timeout)
+
+def count_elements(node) -> int:
+    """Count every element and block below ``node`` in an AppTest tree"""
+    children = getattr(node, 'children', None)
+    if not isinstance(children, dict):
+        return 0
+    return sum(1 + count_elements(child) for child in children.values())
+
+def payload_bytes(node) -> int:
+    """Serialized protobuf size of every element and block below ``node``"""
+    proto = getattr(node, 'proto', None)
+    total = len(proto.SerializeToString()) if proto is not None else 0
+    children = getattr(node, 'children', None)
+    if isinstance(children, dict):
+        total += sum(payload_bytes(child) for child in children.values())
+    return total
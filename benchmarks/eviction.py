@@ -0,0 +1,110 @@
+"""
+Interactive Features quiz clicks around an idle-session eviction
+Starts a local server with a one-second session TTL and a fast reaper, opens
+the Interactive Features section over the websocket protocol and answers the
+quiz the way a browser does, so every click reruns only the quiz fragment and
+never the rest of the app:
+
+- a learner who keeps changing their answer for longer than the TTL is never
+  evicted, so the Skip that follows moves the quiz on
+- a learner who sits idle through a reap pass gets their session back on the
+  next click instead of an error from the evicted state
+
+    python -m benchmarks.eviction
+
+Exits 1 when a run raises or an active learner's click is lost.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+import websockets
+
+from benchmarks.load_test import Session, start_server
+
+SESSION_TTL = 1.0
+REAP_INTERVAL = 0.25
+FEATURES_PAGE = "interactive"
+
+def position(session: Session) -> str:
+    """The quiz progress marker, like 2/3, from the last run"""
+    return next((body.strip("*") for body in session.markdown
+                 if body.startswith("**") and "/" in body and body.strip("*").replace("/", "").isdigit()), "")
+
+async def scenario(url: str, active_seconds: float) -> list:
+    """(step, quiz position, errors) after each step of the scripted learner"""
+    session = Session(url)
+    steps = []
+
+    def record(step: str):
+        steps.append((step, position(session), list(session.errors)))
+        session.errors.clear()
+
+    async def active():
+        # Answer changes keep the session checked in past the TTL
+        deadline = time.monotonic() + active_seconds
+        option = 0
+        while time.monotonic() < deadline:
+            option = 1 - option
+            await session.choose_answer(option)
+            await asyncio.sleep(REAP_INTERVAL)
+
+    async def idle():
+        # The reaper evicts the session; the click that wakes it rebuilds the quiz
+        await asyncio.sleep(SESSION_TTL + 4 * REAP_INTERVAL)
+        await session.click("⏭️ Skip")
+
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as websocket:
+        session.websocket = websocket
+        await session.rerun()
+        for step, action in [("open interactive features", lambda: session.open_page(FEATURES_PAGE)),
+                             (f"change answer for {active_seconds:.0f} s", active),
+                             ("skip while active", lambda: session.click("⏭️ Skip")),
+                             ("skip after eviction", idle),
+                             ("skip again", lambda: session.click("⏭️ Skip"))]:
+            try:
+                await action()
+            except RuntimeError:
+                # StopIteration from a widget lookup, re-raised by the coroutine
+                session.errors.append("the widget to click was not drawn")
+            record(step)
+            if steps[-1][2]:
+                break
+    return steps
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--port', type=int, default=8598, help="port for the local server")
+    parser.add_argument('--active', type=float, default=3.0, help="seconds of clicking before the first skip")
+    args = parser.parse_args(argv)
+
+    server = start_server(args.port, env={"LEARNGIT_SESSION_TTL": str(SESSION_TTL),
+                                          "LEARNGIT_REAP_INTERVAL": str(REAP_INTERVAL)})
+    try:
+        steps = asyncio.run(scenario(f"ws://localhost:{args.port}/_stcore/stream", args.active))
+    finally:
+        server.terminate()
+        server.wait()
+
+    # Expected position after each step; the click that finds the session evicted is
+    # dropped, since the page it was made on no longer exists
+    expected = ["1/3", "1/3", "2/3", "1/3", "2/3"]
+    failures = []
+    print(f"{'Step':<32}{'position':>10}  result")
+    for (step, seen, errors), wanted in zip(steps, expected):
+        ok = not errors and seen == wanted
+        print(f"  {step:<30}{seen:>10}  {'ok' if ok else f'expected {wanted}'}")
+        for error in errors:
+            print(f"    ERROR {error}")
+        if not ok:
+            failures.append(step)
+    if len(steps) < len(expected):
+        failures.append(f"{len(expected) - len(steps)} steps not reached")
+    for failure in failures:
+        print(f"FAILED {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""
+Classroom-burst load test for the single app
+Starts a local Streamlit server and opens N websocket sessions at the same
+instant. Each session follows a scripted lesson path through the Tutorial
+section (sidebar navigation, mark-complete buttons, the practice quiz) the
+way a browser would, and the harness reports throughput, rerun latency
+percentiles and per-session memory.
+
+    python -m benchmarks.load_test --sessions 150
+
+AppTest swaps a process-global runtime on every run, so concurrent sessions
+have to go through a real server. Memory is read from the server's RSS in
+/proc, so the harness is Linux only.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Dict, List, Optional
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from app_pages import MANIFEST
+from benchmarks import SCRATCH_PROGRESS_DB
+from benchmarks.common import REPO_ROOT
+
+# Pages a student works through before the quiz
+LESSON_PAGES = [page['id'] for page in MANIFEST if page['id'] not in ('home', 'practice')]
+QUIZ_QUESTIONS = 3
+
+def path_length() -> int:
+    """Reruns in one lesson path"""
+    return 1 + 2 * len(LESSON_PAGES) + 1 + 3 * QUIZ_QUESTIONS
+
+class Session:
+    """One simulated browser tab speaking the Streamlit websocket protocol"""
+
+    def __init__(self, url: str):
+        self.url = url
+        # Page of a multipage app the session is on; empty for the default page
+        self.page_script_hash = ""
+        # url path -> page script hash, from the app's navigation message
+        self.pages: Dict[str, str] = {}
+        self.widgets: Dict[str, object] = {}
+        # widget id -> id of the fragment that drew it, empty outside fragments
+        self.fragment_ids: Dict[str, str] = {}
+        self.markdown: List[str] = []
+        # Script runs and elements the last interaction cost
+        self.runs = 0
+        self.elements = 0
+        self.values: Dict[str, str] = {}
+        self.latencies: List[float] = []
+        self.errors: List[str] = []
+
+    async def rerun(self, trigger: Optional[str] = None, fragment_id: str = ""):
+        """Send the widget state, wait for the run to finish and time it"""
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        message.rerun_script.page_script_hash = self.page_script_hash
+        message.rerun_script.fragment_id = fragment_id
+        for widget_id, value in self.values.items():
+            state = message.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            state.string_value = value
+        if trigger is not None:
+            state = message.rerun_script.widget_states.widgets.add()
+            state.id = trigger
+            state.trigger_value = True
+
+        began = time.perf_counter()
+        await self.websocket.send(message.SerializeToString())
+        # A fragment run redraws only the widgets of that fragment
+        self.widgets = {label: widget for label, widget in self.widgets.items()
+                        if fragment_id and self.fragment_ids.get(widget.id) != fragment_id}
+        self.markdown = []
+        self.runs = self.elements = 0
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.websocket.recv())
+            kind = forward.WhichOneof('type')
+            delta = forward.delta.WhichOneof('type') if kind == 'delta' else None
+            if delta in ('new_element', 'add_block'):
+                self.elements += 1
+            if delta == 'new_element':
+                element = forward.delta.new_element
+                element_type = element.WhichOneof('type')
+                if element_type == 'exception':
+                    self.errors.append(element.exception.message)
+                elif element_type in ('button', 'radio'):
+                    widget = getattr(element, element_type)
+                    self.widgets[widget.label] = widget
+                    self.fragment_ids[widget.id] = forward.delta.fragment_id
+                elif element_type == 'markdown':
+                    self.markdown.append(element.markdown.body)
+            elif kind == 'navigation':
+                self.pages = {page.url_pathname: page.page_script_hash for page in forward.navigation.app_pages}
+            elif kind == 'script_finished':
+                self.runs += 1
+                if forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    break
+                # st.rerun() inside the script: the browser sees one interaction
+                self.widgets = {}
+        self.latencies.append(time.perf_counter() - began)
+
+    async def click(self, label_prefix: str):
+        widget = next(widget for label, widget in self.widgets.items() if label.startswith(label_prefix))
+        await self.rerun(trigger=widget.id, fragment_id=self.fragment_ids.get(widget.id, ""))
+
+    async def click_page(self, page_id: str):
+        widget = next(widget for widget in self.widgets.values() if widget.id.endswith(f"-{page_id}"))
+        await self.rerun(trigger=widget.id)
+
+    async def choose_answer(self, option: int = 0):
+        radio = next(widget for widget in self.widgets.values() if hasattr(widget, 'options'))
+        self.values[radio.id] = radio.options[option]
+        await self.rerun(fragment_id=self.fragment_ids.get(radio.id, ""))
+
+    async def open_page(self, url_path: str):
+        """Switch sections through the navigation menu"""
+        self.page_script_hash = self.pages[url_path]
+        await self.rerun()
+
+    async def lesson(self):
+        """The scripted path one student follows"""
+        await self.rerun()
+        for page_id in LESSON_PAGES:
+            await self.click_page(page_id)
+            await self.click("✅ Mark")
+        await self.click_page('practice')
+        for _ in range(QUIZ_QUESTIONS):
+            await self.choose_answer()
+            await self.click("Submit Answer")
+            await self.click("Next Question")
+
+    async def run(self, start: asyncio.Event, done: asyncio.Event):
+        async with websockets.connect(self.url, subprotocols=["streamlit"], max_size=None) as websocket:
+            self.websocket = websocket
+            await start.wait()
+            try:
+                await self.lesson()
+            except Exception as error:
+                self.errors.append(f"{type(error).__name__}: {error}")
+            # Stay connected so the session is still alive when memory is read
+            await done.wait()
+
+def server_rss_kb(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+def start_server(port: int, script: str = "streamlit_app.py", env: Optional[Dict[str, str]] = None) -> subprocess.Popen:
+    """Launch an entry point headless and wait until it reports healthy; ``env`` adds server settings"""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", script,
+         "--server.port", str(port), "--server.headless", "true"],
+        cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        env={**os.environ, "LEARNGIT_PROGRESS_DB": SCRATCH_PROGRESS_DB, **(env or {})},
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health", timeout=1):
+                return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("Streamlit server did not become healthy")
+
+async def burst(url: str, sessions: int, pid: Optional[int]) -> Dict:
+    """Run one warm-up session, then every session concurrently"""
+    warm = asyncio.Event()
+    warm.set()
+    await Session(url).run(warm, warm)
+    rss_before = server_rss_kb(pid) if pid else None
+
+    start, done = asyncio.Event(), asyncio.Event()
+    clients = [Session(url) for _ in range(sessions)]
+    tasks = [asyncio.create_task(client.run(start, done)) for client in clients]
+    await asyncio.sleep(0.5)  # let every websocket connect
+    began = time.perf_counter()
+    start.set()
+    while not all(len(client.latencies) == path_length() or client.errors for client in clients):
+        await asyncio.sleep(0.05)
+    elapsed = time.perf_counter() - began
+    rss_after = server_rss_kb(pid) if pid else None
+    done.set()
+    await asyncio.gather(*tasks)
+
+    latencies = [latency for client in clients for latency in client.latencies]
+    quantiles = statistics.quantiles(latencies, n=100, method='inclusive')
+    return {
+        'sessions': sessions,
+        'reruns': len(latencies),
+        'errors': [error for client in clients for error in client.errors],
+        'elapsed_s': elapsed,
+        'throughput': len(latencies) / elapsed,
+        'p50_ms': quantiles[49] * 1000,
+        'p95_ms': quantiles[94] * 1000,
+        'p99_ms': quantiles[98] * 1000,
+        'max_ms': max(latencies) * 1000,
+        'rss_kb_per_session': (rss_after - rss_before) / sessions if pid else None,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sessions', type=int, default=30, help="concurrent simulated students")
+    parser.add_argument('--port', type=int, default=8599, help="port for the local server")
+    parser.add_argument('--url', help="websocket URL of an already running server (skips memory)")
+    args = parser.parse_args(argv)
+
+    server = None if args.url else start_server(args.port)
+    url = args.url or f"ws://localhost:{args.port}/_stcore/stream"
+    try:
+        result = asyncio.run(burst(url, args.sessions, server.pid if server else None))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    print(f"Sessions:       {result['sessions']} concurrent, {path_length()} reruns each")
+    print(f"Completed:      {result['reruns']} reruns in {result['elapsed_s']:.1f} s, {len(result['errors'])} errors")
+    print(f"Throughput:     {result['throughput']:.1f} reruns/s")
+    print(f"Latency:        p50 {result['p50_ms']:.0f} ms, p95 {result['p95_ms']:.0f} ms, "
+          f"p99 {result['p99_ms']:.0f} ms, max {result['max_ms']:.0f} ms")
+    if result['rss_kb_per_session'] is not None:
+        print(f"Memory/session: {result['rss_kb_per_session']:.0f} KB server RSS")
+    for error in result['errors'][:5]:
+        print(f"ERROR {error}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Server memory for a whole-tutorial deployment
+Starts every server a deployment needs and adds up the servers' RSS twice:
+after one session's first page, and after that session has walked through
+every page the server hosts. The three separate entry points need a process
+each; the single multipage app hosts all three sections in one.
+
+    python -m benchmarks.memory
+
+Exits 1 when the single app needs more than its budgeted share of the memory
+of the separate entry points. The Quick Reference page loads pyarrow (and
+with it pandas) in whichever process serves it, a fixed cost both layouts pay
+once, so the every-page figure gets the looser budget. Memory is read from
+/proc, so the harness is Linux only.
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Dict, List, Tuple
+
+import websockets
+from streamlit.util import calc_hash
+
+from app_pages import MANIFEST as TUTORIAL_MANIFEST
+from benchmarks.load_test import Session, server_rss_kb, start_server
+from streamlit_app import SECTIONS
+
+DEPLOYMENTS = {
+    'separate entry points': tuple(section['script'] for section in SECTIONS),
+    'single app': ('streamlit_app.py',),
+}
+
+# Single app / separate entry points, by how far the session got
+MAX_RATIO = {'first page': 0.40, 'every page': 0.60}
+
+async def walk_tutorial(session: Session):
+    for page in TUTORIAL_MANIFEST:
+        await session.click_page(page['id'])
+
+async def walk_lessons(session: Session):
+    radio = session.widgets["Navigate to:"]
+    for option in radio.options:
+        session.values[radio.id] = option
+        await session.rerun()
+
+async def walk_features(session: Session):
+    # The feature tabs share one script, so its first run already loads everything they use
+    pass
+
+WALKS = {'app.py': walk_tutorial, 'content.py': walk_lessons, 'features.py': walk_features}
+
+async def walk_sections(session: Session):
+    for section in SECTIONS:
+        session.page_script_hash = calc_hash(section['url_path'])
+        session.values = {}
+        await session.rerun()
+        await WALKS[section['script']](session)
+
+async def visit(url: str, script: str, pid: int) -> Tuple[Dict[str, int], List[str]]:
+    """Server RSS after one session's first page and after it walked every page of ``script``"""
+    session = Session(url)
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as websocket:
+        session.websocket = websocket
+        await session.rerun()
+        rss = {'first page': server_rss_kb(pid)}
+        await (walk_sections if script == 'streamlit_app.py' else WALKS[script])(session)
+        rss['every page'] = server_rss_kb(pid)
+    return rss, session.errors
+
+def deployment_rss(scripts: Tuple[str, ...], port: int) -> Dict:
+    """RSS of each server for ``scripts``, by how far its session got"""
+    servers = {script: start_server(port + offset, script) for offset, script in enumerate(scripts)}
+    try:
+        rss, errors = {}, []
+        for offset, (script, server) in enumerate(servers.items()):
+            rss[script], session_errors = asyncio.run(
+                visit(f"ws://localhost:{port + offset}/_stcore/stream", script, server.pid))
+            errors += session_errors
+    finally:
+        for server in servers.values():
+            server.terminate()
+            server.wait()
+    return {'rss_kb': rss, 'errors': errors}
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--port', type=int, default=8610, help="first port for the local servers")
+    args = parser.parse_args(argv)
+
+    totals = {}
+    failed = False
+    print(f"{'':<24}{'first page':>12}{'every page':>12}")
+    for name, scripts in DEPLOYMENTS.items():
+        result = deployment_rss(scripts, args.port)
+        totals[name] = {stage: sum(rss[stage] for rss in result['rss_kb'].values()) for stage in MAX_RATIO}
+        print(f"{name} ({len(scripts)} process{'es' if len(scripts) > 1 else ''})")
+        for script, rss in result['rss_kb'].items():
+            print(f"  {script:<22}" + "".join(f"{rss[stage] / 1024:9.1f} MB" for stage in MAX_RATIO))
+        print(f"  {'total':<22}" + "".join(f"{totals[name][stage] / 1024:9.1f} MB" for stage in MAX_RATIO))
+        for error in result['errors'][:3]:
+            print(f"  ERROR {error}")
+        failed = failed or bool(result['errors'])
+
+    for stage, budget in MAX_RATIO.items():
+        ratio = totals['single app'][stage] / totals['separate entry points'][stage]
+        print(f"single app / separate entry points, {stage}: {ratio:.2f}  budget {budget:.2f}  "
+              f"{'ok' if ratio <= budget else 'OVER BUDGET'}")
+        failed = failed or ratio > budget
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+"""
+Bytes sent per rerun of features.py, per open tab
+Sums the serialized size of the elements each run emits; the achievement tab
+is measured with nothing and with every badge unlocked
+"""
+
+from achievements import ACHIEVEMENT_DEFINITIONS
+from benchmarks.common import load_app, payload_bytes
+from benchmarks.tab_elements import FEATURE_TABS
+
+def measure():
+    """Return {label: (tab bytes, whole-run bytes)} for each open tab"""
+    at = load_app('features.py')
+    results = {}
+    for index, label in enumerate(FEATURE_TABS):
+        at.session_state['feature_tab'] = label
+        at.run()
+        if at.exception:
+            raise RuntimeError(f"{label}: {at.exception[0].value}")
+        results[label] = (payload_bytes(at.tabs[index]), payload_bytes(at._tree))
+
+    # Every badge unlocked
+    progress = at.session_state['progress']
+    for achievement_id in ACHIEVEMENT_DEFINITIONS:
+        progress.unlock(achievement_id)
+    index = FEATURE_TABS.index("🏆 Achievements")
+    at.session_state['feature_tab'] = FEATURE_TABS[index]
+    at.run()
+    results["🏆 Achievements (all unlocked)"] = (payload_bytes(at.tabs[index]), payload_bytes(at._tree))
+    return results
+
+def main():
+    print(f"{'Open tab':<32}{'tab bytes':>10}{'run bytes':>10}")
+    for label, (tab, run) in measure().items():
+        print(f"{label:<32}{tab:>10}{run:>10}")
+
+if __name__ == "__main__":
+    main()
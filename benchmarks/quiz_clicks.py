@@ -0,0 +1,105 @@
+"""
+Script runs and elements per click in the Interactive Features quiz
+Starts a local server, opens the Interactive Features section over the
+websocket protocol and answers a quiz section the way a browser does, so a
+click inside the quiz fragment reruns only the fragment. Counts the script
+runs and the elements and blocks sent for every click.
+
+    python -m benchmarks.quiz_clicks
+
+AppTest always reruns the whole script, so fragment reruns need a real
+server. Submit changes the dashboard's answered count, so it is budgeted the
+cut-short fragment run plus one app run; every other click should stay inside
+the fragment. Exits 1 when a click takes more runs or sends more elements
+than its budget, or raises.
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Callable, List, Tuple
+
+import websockets
+
+from benchmarks.load_test import Session, start_server
+
+FEATURES_PAGE = "interactive"
+
+# Elements a click may send when it reruns only the quiz fragment, and when it reruns the app
+FRAGMENT_ELEMENTS = 36
+APP_ELEMENTS = 60
+
+# (name, click, allowed runs, allowed elements); the first option is wrong in every
+# question of the default section, so no click unlocks an achievement
+Click = Tuple[str, Callable, int, int]
+
+def _answer(session: Session):
+    return session.choose_answer(0)
+
+def _click(label: str) -> Callable:
+    return lambda session: session.click(label)
+
+CLICKS: List[Click] = [
+    ("choose answer 1", _answer, 1, FRAGMENT_ELEMENTS),
+    ("submit 1", _click("✅ Submit"), 2, APP_ELEMENTS),
+    ("next 1", _click("➡️ Next"), 1, FRAGMENT_ELEMENTS),
+    ("skip 2", _click("⏭️ Skip"), 1, FRAGMENT_ELEMENTS),
+    ("choose answer 3", _answer, 1, FRAGMENT_ELEMENTS),
+    ("submit 3", _click("✅ Submit"), 2, APP_ELEMENTS),
+    ("next to results", _click("➡️ Next"), 1, FRAGMENT_ELEMENTS),
+    ("mark section complete", _click("✅ Mark Section"), 1, FRAGMENT_ELEMENTS),
+    ("retake quiz", _click("🔄 Retake"), 1, FRAGMENT_ELEMENTS),
+]
+
+async def replay(url: str) -> List[dict]:
+    """Run every click from a fresh session on the Interactive Features page"""
+    session = Session(url)
+    results = []
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as websocket:
+        session.websocket = websocket
+        await session.rerun()
+        await session.open_page(FEATURES_PAGE)
+        results.append({'name': "open interactive features", 'runs': session.runs, 'elements': session.elements,
+                        'budget': (1, APP_ELEMENTS), 'errors': list(session.errors)})
+        for name, click, runs, elements in CLICKS:
+            session.errors.clear()
+            try:
+                await click(session)
+            except RuntimeError:
+                # StopIteration from a widget lookup, re-raised by the coroutine
+                session.errors.append("the widget to click was not drawn")
+            results.append({'name': name, 'runs': session.runs, 'elements': session.elements,
+                            'budget': (runs, elements), 'errors': list(session.errors)})
+            if session.errors:
+                break
+    return results
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--port', type=int, default=8597, help="port for the local server")
+    args = parser.parse_args(argv)
+
+    server = start_server(args.port)
+    try:
+        results = asyncio.run(replay(f"ws://localhost:{args.port}/_stcore/stream"))
+    finally:
+        server.terminate()
+        server.wait()
+
+    failures = []
+    print(f"{'Click':<28}{'runs':>6}{'budget':>8}{'elements':>10}{'budget':>8}")
+    for result in results:
+        runs, elements = result['budget']
+        print(f"  {result['name']:<26}{result['runs']:>6}{runs:>8}{result['elements']:>10}{elements:>8}")
+        for error in result['errors']:
+            print(f"    ERROR {error}")
+        if result['runs'] > runs or result['elements'] > elements or result['errors']:
+            failures.append(result['name'])
+    if len(results) < len(CLICKS) + 1:
+        failures.append(f"{len(CLICKS) + 1 - len(results)} clicks not reached")
+    for failure in failures:
+        print(f"FAILED {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Rerun benchmark suite for app.py, content.py and features.py
+Replays every page, quiz flow and tab headlessly with AppTest and records
+wall time, element count and peak allocation per rerun. Results are compared
+with stored baselines and the run fails when a step regresses past the
+threshold.
+
+    python -m benchmarks.reruns                     # compare with baselines
+    python -m benchmarks.reruns --update-baselines  # record new baselines
+
+Wall times are machine specific, so record baselines on the box that gates.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from app_pages import MANIFEST as APP_MANIFEST
+from benchmarks.common import REPO_ROOT, count_elements, load_app
+from benchmarks.tab_elements import FEATURE_TABS
+from content_pages import MANIFEST as CONTENT_MANIFEST
+
+BASELINES_PATH = REPO_ROOT / "benchmarks" / "baselines.json"
+
+# A step prepares the next rerun (widget value, click, session state); the
+# harness then runs the script and measures that run
+Step = Tuple[str, Callable]
+
+def _noop(at):
+    pass
+
+def _goto_page(page_id: str) -> Callable:
+    def step(at):
+        at.session_state['current_page'] = page_id
+    return step
+
+def _navigate(page_id: str) -> Callable:
+    def step(at):
+        at.sidebar.radio[0].set_value(page_id)
+    return step
+
+def _open_tab(label: str) -> Callable:
+    def step(at):
+        at.session_state['feature_tab'] = label
+    return step
+
+def _choose_answer(at):
+    at.main.radio[0].set_value(at.main.radio[0].options[0])
+
+def _click(label: str) -> Callable:
+    def step(at):
+        next(button for button in at.button if button.label.startswith(label)).click()
+    return step
+
+def _quiz_flow(submit: str, next_label: str, questions: int = 3, last_label: str = None) -> List[Step]:
+    steps = []
+    for number in range(1, questions + 1):
+        label = last_label if number == questions and last_label else next_label
+        steps += [
+            (f"quiz q{number} choose", _choose_answer),
+            (f"quiz q{number} submit", _click(submit)),
+            (f"quiz q{number} next", _click(label)),
+        ]
+    return steps
+
+SCENARIOS: Dict[str, List[Step]] = {
+    'app.py': (
+        [("initial load", _noop)]
+        + [(f"page {page['id']}", _goto_page(page['id'])) for page in APP_MANIFEST]
+        + [("back to practice", _goto_page('practice'))]
+        + _quiz_flow("Submit Answer", "Next Question")
+    ),
+    'content.py': (
+        [("initial load", _noop)]
+        + [(f"page {page['id']}", _navigate(page['id'])) for page in CONTENT_MANIFEST]
+        + [("back to practice", _navigate('Practice')), ("quiz start", _click("Start Quiz"))]
+        + _quiz_flow("Submit Answer", "Next Question", last_label="View Results")
+    ),
+    'features.py': (
+        [("initial load", _noop)]
+        + [(f"tab {label}", _open_tab(label)) for label in FEATURE_TABS]
+        + [("back to quiz tab", _open_tab(FEATURE_TABS[0]))]
+        + _quiz_flow("✅ Submit", "➡️ Next")
+    ),
+}
+
+def _replay(script: str, steps: List[Step], trace: bool) -> List[Dict]:
+    """Run one scenario from a fresh session and measure every rerun"""
+    at = load_app(script)
+    samples = []
+    for name, prepare in steps:
+        prepare(at)
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        at.run()
+        elapsed = time.perf_counter() - start
+        if trace:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        if at.exception:
+            raise RuntimeError(f"{script} / {name}: {at.exception[0].value}")
+        samples.append({
+            'ms': elapsed * 1000,
+            'elements': count_elements(at._tree),
+            'peak_kb': peak / 1024 if trace else None,
+        })
+    return samples
+
+def measure(repeat: int = 5) -> Dict[str, Dict[str, Dict]]:
+    """Median wall time, element count and peak allocation for every step"""
+    results = {}
+    for script, steps in SCENARIOS.items():
+        timed = [_replay(script, steps, trace=False) for _ in range(repeat)]
+        # Allocation tracing slows the interpreter, so it gets its own pass,
+        # made after the timed ones so first-import costs are not counted
+        traced = _replay(script, steps, trace=True)
+        results[script] = {
+            name: {
+                'ms': round(statistics.median(run[index]['ms'] for run in timed), 2),
+                'elements': traced[index]['elements'],
+                'peak_kb': round(traced[index]['peak_kb'], 1),
+            }
+            for index, (name, _) in enumerate(steps)
+        }
+    return results
+
+def compare(results: Dict, baselines: Dict, threshold: float, slack_ms: float,
+            slack_kb: float) -> List[str]:
+    """Describe every step that regressed past ``threshold`` times its baseline"""
+    regressions = []
+    for script, steps in results.items():
+        for name, current in steps.items():
+            baseline = baselines.get(script, {}).get(name)
+            if baseline is None:
+                continue
+            if current['ms'] > baseline['ms'] * threshold + slack_ms:
+                regressions.append(f"{script} / {name}: {current['ms']:.1f} ms (baseline {baseline['ms']:.1f} ms)")
+            if current['elements'] > baseline['elements'] * threshold:
+                regressions.append(f"{script} / {name}: {current['elements']} elements (baseline {baseline['elements']})")
+            if current['peak_kb'] > baseline['peak_kb'] * threshold + slack_kb:
+                regressions.append(f"{script} / {name}: {current['peak_kb']:.0f} KB peak (baseline {baseline['peak_kb']:.0f} KB)")
+    return regressions
+
+def report(results: Dict, baselines: Dict):
+    print(f"{'Step':<44}{'ms':>9}{'base':>9}{'elements':>10}{'peak KB':>10}")
+    for script, steps in results.items():
+        print(script)
+        for name, current in steps.items():
+            baseline = baselines.get(script, {}).get(name, {})
+            base_ms = f"{baseline['ms']:.1f}" if baseline else "-"
+            print(f"  {name:<42}{current['ms']:>9.1f}{base_ms:>9}{current['elements']:>10}{current['peak_kb']:>10.0f}")
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5, help="timed replays per scenario (median is kept)")
+    parser.add_argument('--threshold', type=float, default=1.5, help="allowed ratio over the baseline")
+    parser.add_argument('--slack-ms', type=float, default=10.0, help="absolute wall-time noise allowance")
+    parser.add_argument('--slack-kb', type=float, default=256.0, help="absolute peak-allocation noise allowance")
+    parser.add_argument('--update-baselines', action='store_true', help="store this run as the new baselines")
+    args = parser.parse_args(argv)
+
+    results = measure(args.repeat)
+    baselines = json.loads(BASELINES_PATH.read_text()) if BASELINES_PATH.exists() else {}
+    report(results, baselines)
+
+    if args.update_baselines:
+        BASELINES_PATH.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n")
+        print(f"Baselines written to {BASELINES_PATH.relative_to(REPO_ROOT)}")
+        return 0
+
+    regressions = compare(results, baselines, args.threshold, args.slack_ms, args.slack_kb)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
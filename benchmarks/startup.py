@@ -0,0 +1,123 @@
+"""
+Cold-start profile and budget for the single app and its three section scripts
+For each script, starts a fresh Streamlit server and times how long it takes
+to report healthy and to finish the first session's first run, then profiles
+the imports that first run triggers with -X importtime in a fresh interpreter.
+
+    python -m benchmarks.startup --top 10
+
+Exits 1 when a script's first run, or its first response (healthy plus first
+run), is over budget. The first run is where this repo's imports and caches
+load; server boot is mostly Streamlit's own and gets the looser budget.
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import websockets
+
+from benchmarks import SCRATCH_PROGRESS_DB
+from benchmarks.common import REPO_ROOT
+from benchmarks.load_test import Session, start_server
+
+SCRIPTS = ('streamlit_app.py', 'app.py', 'features.py', 'content.py')
+
+# Milliseconds for a cold process's first script run, per entry point
+FIRST_RUN_BUDGET_MS = {'streamlit_app.py': 500, 'app.py': 500, 'features.py': 450, 'content.py': 450}
+# Milliseconds from process start to the first finished run
+FIRST_RESPONSE_BUDGET_MS = 1800
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+FIRST_RUN_MARKER = "--- first run ---"
+
+async def first_run_ms(url: str) -> Tuple[float, List[str]]:
+    """Open one session and time its initial script run"""
+    session = Session(url)
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as websocket:
+        session.websocket = websocket
+        await session.rerun()
+    return session.latencies[0] * 1000, session.errors
+
+def server_startup(script: str, port: int) -> Dict:
+    """Time a cold server to healthy, then its first and second sessions"""
+    began = time.perf_counter()
+    server = start_server(port, script)
+    healthy_ms = (time.perf_counter() - began) * 1000
+    url = f"ws://localhost:{port}/_stcore/stream"
+    try:
+        first_ms, errors = asyncio.run(first_run_ms(url))
+        second_ms, more_errors = asyncio.run(first_run_ms(url))
+    finally:
+        server.terminate()
+        server.wait()
+    return {
+        'healthy_ms': healthy_ms,
+        'first_run_ms': first_ms,
+        'second_run_ms': second_ms,
+        'first_response_ms': healthy_ms + first_ms,
+        'errors': errors + more_errors,
+    }
+
+def first_run_imports(script: str) -> List[Tuple[str, float, float]]:
+    """(module, self ms, cumulative ms) for each top-level import made during the first run"""
+    code = (
+        "import sys\n"
+        "from streamlit.testing.v1 import AppTest\n"
+        f"sys.stderr.write({FIRST_RUN_MARKER!r} + '\\n')\n"
+        f"AppTest.from_file({str(REPO_ROOT / script)!r}, default_timeout=60).run()\n"
+    )
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=REPO_ROOT, capture_output=True, text=True,
+                            env={**os.environ, "LEARNGIT_PROGRESS_DB": SCRATCH_PROGRESS_DB})
+    lines = result.stderr.split(FIRST_RUN_MARKER, 1)[-1].splitlines()
+    imports = []
+    for line in lines:
+        match = IMPORT_LINE.match(line)
+        # importtime indents nested imports by two spaces per level; keep the roots
+        if match and len(match.group(3)) == 1:
+            imports.append((match.group(4), int(match.group(1)) / 1000, int(match.group(2)) / 1000))
+    return imports
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('scripts', nargs='*', default=SCRIPTS, help="entry points to profile")
+    parser.add_argument('--port', type=int, default=8598, help="port for the local server")
+    parser.add_argument('--top', type=int, default=8, help="imports to list per script")
+    parser.add_argument('--budget-ms', type=float, help="override every script's first-run budget")
+    args = parser.parse_args(argv)
+
+    over_budget = []
+    for script in args.scripts:
+        timing = server_startup(script, args.port)
+        budget = args.budget_ms or FIRST_RUN_BUDGET_MS.get(script, 500)
+        first_run_ok = timing['first_run_ms'] <= budget
+        first_response_ok = timing['first_response_ms'] <= FIRST_RESPONSE_BUDGET_MS
+        print(f"{script}")
+        print(f"  server healthy   {timing['healthy_ms']:8.0f} ms")
+        print(f"  first run        {timing['first_run_ms']:8.0f} ms   budget {budget:.0f} ms  "
+              f"{'ok' if first_run_ok else 'OVER BUDGET'}   (second session {timing['second_run_ms']:.0f} ms)")
+        print(f"  first response   {timing['first_response_ms']:8.0f} ms   budget {FIRST_RESPONSE_BUDGET_MS} ms  "
+              f"{'ok' if first_response_ok else 'OVER BUDGET'}")
+        for error in timing['errors'][:3]:
+            print(f"  ERROR {error}")
+
+        imports = first_run_imports(script)
+        total = sum(cumulative for _, _, cumulative in imports)
+        print(f"  first-run imports {total:7.0f} ms across {len(imports)} top-level modules")
+        for module, self_ms, cumulative_ms in sorted(imports, key=lambda item: -item[2])[:args.top]:
+            print(f"    {module:<40}{cumulative_ms:8.1f} ms  (self {self_ms:.1f})")
+        if not (first_run_ok and first_response_ok) or timing['errors']:
+            over_budget.append(script)
+
+    if over_budget:
+        print(f"Over budget or failing: {', '.join(over_budget)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Session state size after a full lesson path
+Completes every lesson page in app.py and a full quiz section in features.py,
+separately and as sections of the single app, then reports the deep size of
+each session state entry
+"""
+
+from benchmarks.common import load_app
+from state_size import session_size
+
+def _click(at, label: str):
+    next(button for button in at.button if button.label.startswith(label)).click().run()
+
+def complete_lessons(at):
+    from app_pages import MANIFEST
+    for page in MANIFEST:
+        if page['id'] in ('home', 'practice'):
+            continue
+        at.button(key=page['id']).click().run()
+        _click(at, "✅ Mark")
+
+def answer_quiz_section(at):
+    while not any(button.label.startswith("🔄 Retake") for button in at.button):
+        at.radio[0].set_value(at.radio[0].options[0]).run()
+        _click(at, "✅ Submit")
+        _click(at, "➡️ Next")
+
+def app_session():
+    """app.py after visiting and completing every lesson page"""
+    at = load_app('app.py')
+    complete_lessons(at.run())
+    return at
+
+def features_session():
+    """features.py after answering a full quiz section"""
+    at = load_app('features.py')
+    answer_quiz_section(at.run())
+    return at
+
+def tutorial_session():
+    """streamlit_app.py after the same lessons and quiz section, in one session"""
+    at = load_app('streamlit_app.py')
+    complete_lessons(at.run())
+    answer_quiz_section(at.switch_page('features.py').run())
+    return at
+
+def report(name: str, at):
+    if at.exception:
+        raise RuntimeError(f"{name}: {at.exception[0].value}")
+    sizes = session_size(at.session_state)
+    print(f"{name}: {sum(sizes.values()):,} bytes across {len(sizes)} entries")
+    for key, size in list(sizes.items())[:6]:
+        print(f"  {key:<28}{size:>10,}")
+
+def main():
+    report('app.py', app_session())
+    report('features.py', features_session())
+    report('streamlit_app.py', tutorial_session())
+
+if __name__ == "__main__":
+    main()
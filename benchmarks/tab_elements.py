@@ -0,0 +1,43 @@
+"""
+Elements emitted per run of features.py, per open tab
+Compares lazy tab rendering with the eager equivalent, where every tab's
+content is sent on every run
+"""
+
+from benchmarks.common import count_elements, load_app
+
+FEATURE_TABS = [
+    "📝 Interactive Quiz",
+    "🏆 Achievements",
+    "🎬 Visual Guides",
+    "📊 Session Management",
+    "🎉 Celebrations",
+]
+
+def measure():
+    """Return (elements per run for each open tab, elements around the tabs)"""
+    at = load_app('features.py')
+    per_tab = {}
+    shell = 0
+    for index, label in enumerate(FEATURE_TABS):
+        at.session_state['feature_tab'] = label
+        at.run()
+        if at.exception:
+            raise RuntimeError(f"{label}: {at.exception[0].value}")
+        total = count_elements(at._tree)
+        tab_content = count_elements(at.tabs[index])
+        per_tab[label] = total
+        shell = total - tab_content
+    return per_tab, shell
+
+def main():
+    per_tab, shell = measure()
+    eager = shell + sum(total - shell for total in per_tab.values())
+
+    print(f"{'Open tab':<24}{'lazy':>8}{'eager':>8}")
+    for label, total in per_tab.items():
+        print(f"{label:<24}{total:>8}{eager:>8}")
+    print(f"Average lazy run: {sum(per_tab.values()) / len(per_tab):.0f} elements, eager run: {eager} elements")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Run time of unlocking every achievement at once
+A headless run visits and completes every page, scores full marks in every
+quiz section and credits thirty minutes on task through the app's own
+progress functions, then drains the notification queue, so all achievements
+unlock and are announced in that one run.
+
+    python -m benchmarks.unlocks
+
+An unlock that blocks the script (the old two-second sleep per badge) shows
+up as a run far over budget. Exits 1 when the run takes longer than the
+budget or a badge is not unlocked and announced.
+"""
+
+import argparse
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from achievements import ACHIEVEMENT_DEFINITIONS
+
+BUDGET_MS = 250
+
+def unlock_everything():
+    """App script that earns every achievement in a single run"""
+    import streamlit as st
+
+    from app_pages import MANIFEST
+    from app_state import initialize_session_state, mark_page_completed, mark_page_visited, record_quiz_score
+    from notifications import drain_notifications
+    from quiz_bank import load_quiz_bank
+
+    initialize_session_state()
+    for page in MANIFEST:
+        mark_page_visited(page['id'])
+    # Thirty minutes on task, as the page clock credits it on the next visit
+    st.session_state.progress.add_dwell(MANIFEST[0]['id'], 30 * 60 * 1000)
+    mark_page_visited(MANIFEST[0]['id'])
+    for page in MANIFEST:
+        mark_page_completed(page['id'])
+    bank = load_quiz_bank()
+    for section_key in bank.section_keys:
+        questions = bank.sections[section_key]['question_count']
+        record_quiz_score(section_key, questions, questions)
+    drain_notifications()
+
+def timed_run(timeout: float):
+    """(wall ms, achievements unlocked, toasts shown) for one run from a fresh session"""
+    at = AppTest.from_function(unlock_everything, default_timeout=timeout)
+    began = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - began) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return elapsed, at.session_state['progress'].unlocked_count, len(at.toast)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs; the best one counts")
+    args = parser.parse_args(argv)
+
+    # The first run pays for importing the app modules, which is not what is measured
+    timed_run(timeout=30)
+    results = [timed_run(timeout=30) for _ in range(args.repeat)]
+    best, unlocked, toasts = min(results)
+    expected = len(ACHIEVEMENT_DEFINITIONS)
+
+    print(f"{'Unlocked':<12}{unlocked:>6} / {expected}")
+    print(f"{'Toasts':<12}{toasts:>6} / {expected}")
+    print(f"{'Run':<12}{best:>6.1f} ms  (budget {BUDGET_MS} ms, best of {args.repeat})")
+    failures = []
+    if unlocked != expected:
+        failures.append(f"{expected - unlocked} achievements not unlocked")
+    if toasts != expected:
+        failures.append(f"{toasts} toasts for {expected} unlocks")
+    if best > BUDGET_MS:
+        failures.append(f"run took {best:.1f} ms")
+    for failure in failures:
+        print(f"FAILED {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Git command and concept reference shared by the quick-reference pages
+Searched through an index and rendered from an Arrow table, both built once per process.
+pyarrow is imported with the table, so pages that only search never load it.
+"""
+
+from typing import TYPE_CHECKING
+
+import streamlit as st
+
+from content_bundle import module_content
+from search_index import SearchIndex
+
+if TYPE_CHECKING:
+    import pyarrow
+
+CONTENT = module_content(__name__)
+
+# (term, what it does, when to use it, example)
+CHEAT_SHEET = CONTENT['cheat_sheet']
+
+# (command, description)
+COMMANDS = CONTENT['commands']
+
+# term -> definition
+CONCEPTS = CONTENT['concepts']
+
+# Title matches outrank descriptions, which outrank usage notes and examples
+FIELD_WEIGHTS = (3.0, 1.0, 0.5, 0.5)
+
+TABLE_COLUMNS = ("Term/Command", "What it does", "When to use it", "Example")
+
+def reference_entries():
+    """Every cheat sheet, command and concept entry as (term, meaning, when, example), first wording wins"""
+    entries = {}
+    rows = CHEAT_SHEET + tuple((command, description, "", "") for command, description in COMMANDS) \
+        + tuple((term, definition, "", "") for term, definition in CONCEPTS.items())
+    for row in rows:
+        entries.setdefault(row[0].lower(), row)
+    return tuple(entries.values())
+
+@st.cache_resource
+def load_reference_index() -> SearchIndex:
+    """Build the reference search index once per process and share it across sessions"""
+    return SearchIndex(reference_entries(), FIELD_WEIGHTS)
+
+@st.cache_resource
+def load_reference_table() -> "pyarrow.Table":
+    """Every reference entry as one Arrow table, row-aligned with the index; the cheat sheet comes first"""
+    import pyarrow as pa
+
+    entries = reference_entries()
+    return pa.table({name: [entry[column] for entry in entries] for column, name in enumerate(TABLE_COLUMNS)})
+
+def lookup(query: str, limit: int = 20) -> "pyarrow.Table":
+    """Rows for a query: ranked index hits, else a literal substring match for queries like -m or *.log"""
+    import pyarrow.compute as pc
+
+    table = load_reference_table()
+    hits = load_reference_index().search(query, limit)
+    if hits:
+        return table.take(list(hits))
+    matches = [pc.match_substring(table[name], query, ignore_case=True) for name in TABLE_COLUMNS]
+    mask = matches[0]
+    for match in matches[1:]:
+        mask = pc.or_(mask, match)
+    return table.filter(mask).slice(0, limit)
@@ -0,0 +1,122 @@
+"""
+Item analytics over every learner's saved quiz answers
+Saved answers become one int8 students x questions matrix, -1 where a question
+was not answered, with the quiz bank's questions as columns in section order.
+Every statistic is a sum over students, so the matrix is read in row blocks of
+whole-array NumPy passes and matrix-vector products:
+
+- difficulty: share of the learners who answered a question that got it right
+- discrimination: corrected item-total point-biserial correlation, how well
+  getting the question right tracks the learner's score on every other question
+- option shares: share of the learners who answered a question that chose
+  each option, so unpopular distractors stand out
+"""
+
+from typing import Dict, Iterable, Mapping
+
+import numpy as np
+import streamlit as st
+
+from answer_store import UNANSWERED
+from progress_store import get_progress_store
+from quiz_bank import QuizBank, load_quiz_bank
+
+# Students per block, so the float64 temporaries of a block stay a few MB
+BLOCK_ROWS = 1024
+
+# Statistics are refreshed at most this often, in seconds
+REFRESH_INTERVAL = 60
+
+class QuestionColumns:
+    """Matrix column of every quiz bank question, with its answer key"""
+    __slots__ = ('sections', 'correct', 'option_counts', 'width')
+
+    def __init__(self, bank: QuizBank):
+        self.sections: Dict[str, slice] = {}
+        correct, option_counts = [], []
+        for section_key in bank.section_keys:
+            questions = bank.sections[section_key]['questions']
+            self.sections[section_key] = slice(len(correct), len(correct) + len(questions))
+            correct += [question['correct'] for question in questions]
+            option_counts += [len(question['options']) for question in questions]
+        self.correct = np.array(correct, dtype=np.int8)
+        self.option_counts = np.array(option_counts, dtype=np.int8)
+        self.width = len(correct)
+
+class ItemStatistics:
+    """Per-question statistics; every array has one entry (or row) per matrix column"""
+    __slots__ = ('students', 'answered', 'difficulty', 'discrimination', 'option_shares')
+
+    def __init__(self, students: int, answered: np.ndarray, difficulty: np.ndarray,
+                 discrimination: np.ndarray, option_shares: np.ndarray):
+        self.students = students
+        self.answered = answered
+        self.difficulty = difficulty
+        self.discrimination = discrimination
+        self.option_shares = option_shares
+
+def answer_matrix(records: Iterable[Mapping], columns: QuestionColumns) -> np.ndarray:
+    """Students x questions matrix of chosen options from stored progress records"""
+    # Learners with no saved answers get no row; sections that changed size since are skipped
+    rows = []
+    for record in records:
+        row = None
+        for section_key, values in record.get('quiz_scores', {}).items():
+            columns_slice = columns.sections.get(section_key)
+            if columns_slice is None or len(values) < 5 or len(values[4]) != columns_slice.stop - columns_slice.start:
+                continue
+            if row is None:
+                row = np.full(columns.width, UNANSWERED, dtype=np.int8)
+            row[columns_slice] = values[4]
+        if row is not None:
+            rows.append(row)
+    return np.vstack(rows) if rows else np.empty((0, columns.width), dtype=np.int8)
+
+def item_statistics(matrix: np.ndarray, correct: np.ndarray, option_counts: np.ndarray) -> ItemStatistics:
+    """Difficulty, discrimination and option shares of every column of an answer matrix"""
+    width = matrix.shape[1]
+    max_options = int(option_counts.max()) if width else 0
+    answered = np.zeros(width, dtype=np.int64)
+    hits = np.zeros(width, dtype=np.int64)
+    chosen = np.zeros((width, max_options), dtype=np.int64)
+    # Sums of the student's total score T over the answerers (a) and the right answerers (x) of each item
+    a_total = np.zeros(width)
+    a_total_squared = np.zeros(width)
+    x_total = np.zeros(width)
+
+    for start in range(0, matrix.shape[0], BLOCK_ROWS):
+        block = matrix[start:start + BLOCK_ROWS]
+        answered_block = (block >= 0).astype(np.float64)
+        right_block = (block == correct).astype(np.float64)
+        total = right_block.sum(axis=1)
+        answered += answered_block.sum(axis=0).astype(np.int64)
+        hits += right_block.sum(axis=0).astype(np.int64)
+        a_total += total @ answered_block
+        a_total_squared += (total * total) @ answered_block
+        x_total += total @ right_block
+        for option in range(max_options):
+            chosen[:, option] += np.count_nonzero(block == option, axis=0)
+
+    # Correlate each item with the rest score T - x over the learners who answered it
+    rest = a_total - hits
+    rest_squared = a_total_squared - 2 * x_total + hits
+    item_rest = x_total - hits
+    with np.errstate(divide='ignore', invalid='ignore'):
+        difficulty = hits / answered
+        discrimination = ((answered * item_rest - hits * rest)
+                          / np.sqrt((answered * hits - hits * hits) * (answered * rest_squared - rest * rest)))
+        option_shares = chosen / answered[:, None]
+    option_shares[np.arange(max_options) >= option_counts[:, None]] = np.nan
+    return ItemStatistics(matrix.shape[0], answered, difficulty, discrimination, option_shares)
+
+@st.cache_resource(ttl=REFRESH_INTERVAL, show_spinner="Crunching classroom answers...")
+def load_item_statistics() -> ItemStatistics:
+    """Statistics over every learner's saved answers, shared by every teacher session"""
+    columns = question_columns()
+    matrix = answer_matrix(get_progress_store().records('app'), columns)
+    return item_statistics(matrix, columns.correct, columns.option_counts)
+
+@st.cache_resource
+def question_columns() -> QuestionColumns:
+    """Column layout of the quiz bank, built once per process"""
+    return QuestionColumns(load_quiz_bank())
@@ -0,0 +1,56 @@
+"""
+Class-based card components shared by the tutorial apps
+Styling lives in components.css, which the stylesheet pipeline ships once per
+session, so each card sends only its content and a class name per rerun
+"""
+
+from typing import Dict, Iterable, Tuple
+
+import streamlit as st
+
+from stylesheets import load_stylesheet
+
+STYLESHEET = "components.css"
+
+def load_components():
+    """Attach the component stylesheet to the current page"""
+    load_stylesheet(STYLESHEET)
+
+def _markdown(html: str):
+    st.markdown(html, unsafe_allow_html=True)
+
+def banner(title: str, subtitle: str = "", icon: str = "", heading: str = "h1", variant: str = ""):
+    """Gradient banner with an optional icon and subtitle"""
+    icon_html = f'<div class="icon">{icon}</div>' if icon else ""
+    subtitle_html = f"<p>{subtitle}</p>" if subtitle else ""
+    css_class = f"banner {variant}" if variant else "banner"
+    _markdown(f'<div class="{css_class}">{icon_html}<{heading}>{title}</{heading}>{subtitle_html}</div>')
+
+def hero(title: str, subtitle: str, actions: Iterable[Tuple[str, str]]):
+    """Landing banner with call-to-action links given as (label, href) pairs"""
+    links = "".join(f'<a href="{href}">{label}</a>' for label, href in actions)
+    _markdown(f'<div class="banner hero"><h1>{title}</h1><p>{subtitle}</p><div class="actions">{links}</div></div>')
+
+def achievement_grid(definitions: Dict[str, Dict], is_unlocked):
+    """Render a grid of achievement badges in a single element"""
+    cards = "".join(
+        f'<div class="on"><i>{definition["icon"]}</i><h4>{definition["title"]}</h4><p>{definition["description"]}</p></div>'
+        if is_unlocked(achievement_id) else
+        f'<div><i>🔒</i><h4>{definition["title"]}</h4><p>{definition["description"]}</p></div>'
+        for achievement_id, definition in definitions.items()
+    )
+    _markdown(f'<div class="badges">{cards}</div>')
+
+def module_row(icon: str, title: str, description: str, status: str):
+    """Learning-path module row with a status label"""
+    _markdown(
+        f'<div class="step-container module-row"><i>{icon}</i>'
+        f'<div><h3>{title}</h3><p>{description}</p></div><b>{status}</b></div>'
+    )
+
+def tool_card(icon: str, name: str, description: str, link: str):
+    """Fixed-height card linking to an external practice tool"""
+    _markdown(
+        f'<div class="tool-card"><i>{icon}</i><h3>{name}</h3><p>{description}</p>'
+        f'<a href="{link}" target="_blank">Try it now</a></div>'
+    )
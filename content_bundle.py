@@ -0,0 +1,148 @@
+"""
+Versioned content bundle
+Lesson tables, visual guides, the quiz bank and the reference sheet live as
+JSON under content_data/, one file per module that renders them. The build
+step compiles every file into one binary snapshot:
+
+    python -m content_bundle
+
+Each process loads the snapshot once and shares it read-only (tuples and
+mapping proxies), so a rerun allocates no content. The snapshot records the
+size and modification time of every source; when they no longer match it is
+recompiled on load, the way .pyc files are.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import threading
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Optional
+
+SOURCE_DIR = Path(__file__).parent / "content_data"
+SNAPSHOT_PATH = SOURCE_DIR / "bundle.snapshot"
+
+# Bump when the layout of the bundle changes
+BUNDLE_VERSION = 1
+
+# Bundle magic, layout version and the interpreter's marshal format, then the source stamp
+_HEADER = b"LGCB" + BUNDLE_VERSION.to_bytes(2, "little") + MAGIC_NUMBER
+_STAMP_SIZE = 32
+
+_EMPTY = MappingProxyType({})
+
+class ContentBundle:
+    """Read-only content for every module, keyed by dotted module name"""
+
+    def __init__(self, stamp: bytes, modules: Dict[str, Dict], source: str):
+        self.stamp = stamp
+        self.modules = MappingProxyType({name: freeze(content) for name, content in modules.items()})
+        self.source = source
+
+    def __getitem__(self, module: str) -> Mapping:
+        return self.modules[module]
+
+    def get(self, module: str) -> Mapping:
+        return self.modules.get(module, _EMPTY)
+
+def freeze(value):
+    """Lists become tuples and dicts become read-only mapping proxies, all the way down"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def iter_text(value) -> Iterator[str]:
+    """Every string value in a piece of content, in order"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, Mapping):
+        for item in value.values():
+            yield from iter_text(item)
+    elif isinstance(value, tuple):
+        for item in value:
+            yield from iter_text(item)
+
+def _sources(source_dir: Path) -> Dict[str, Path]:
+    """Module name -> JSON source path, in a stable order"""
+    return {".".join(path.relative_to(source_dir).with_suffix("").parts): path
+            for path in sorted(source_dir.rglob("*.json"))}
+
+def _stamp(sources: Dict[str, Path]) -> bytes:
+    """Digest of every source's name, size and modification time"""
+    stamp = hashlib.sha256()
+    for name, path in sources.items():
+        stat = path.stat()
+        stamp.update(f"{name}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode("utf-8"))
+    return stamp.digest()
+
+def compile_bundle(source_dir: Path = SOURCE_DIR, snapshot_path: Path = SNAPSHOT_PATH) -> ContentBundle:
+    """Compile the JSON sources and write the snapshot; a read-only checkout keeps it in memory only"""
+    sources = _sources(source_dir)
+    stamp = _stamp(sources)
+    modules = {name: json.loads(path.read_bytes()) for name, path in sources.items()}
+    try:
+        temporary = snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_bytes(_HEADER + stamp + marshal.dumps(modules))
+        os.replace(temporary, snapshot_path)
+    except OSError:
+        pass
+    return ContentBundle(stamp, modules, "sources")
+
+def read_snapshot(snapshot_path: Path = SNAPSHOT_PATH, stamp: Optional[bytes] = None) -> Optional[ContentBundle]:
+    """The bundle in a snapshot file, or None when it is missing, from another build or not for ``stamp``"""
+    try:
+        data = snapshot_path.read_bytes()
+    except OSError:
+        return None
+    header_size = len(_HEADER) + _STAMP_SIZE
+    if len(data) < header_size or not data.startswith(_HEADER):
+        return None
+    snapshot_stamp = data[len(_HEADER):header_size]
+    if stamp is not None and snapshot_stamp != stamp:
+        return None
+    try:
+        modules = marshal.loads(memoryview(data)[header_size:])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return ContentBundle(snapshot_stamp, modules, "snapshot")
+
+def load_bundle(source_dir: Path = SOURCE_DIR, snapshot_path: Path = SNAPSHOT_PATH) -> ContentBundle:
+    """The snapshot when it matches the sources, else a fresh compile"""
+    if not source_dir.is_dir():
+        # Deployed without sources: the snapshot is the content
+        bundle = read_snapshot(snapshot_path)
+        if bundle is None:
+            raise FileNotFoundError(f"No content sources in {source_dir} and no readable snapshot at {snapshot_path}")
+        return bundle
+    bundle = read_snapshot(snapshot_path, _stamp(_sources(source_dir)))
+    return bundle if bundle is not None else compile_bundle(source_dir, snapshot_path)
+
+# Process-wide, like the page registry; loaded on first use and never mutated
+_bundle: Optional[ContentBundle] = None
+_load_lock = threading.Lock()
+
+def get_content_bundle() -> ContentBundle:
+    """The process-wide content bundle"""
+    global _bundle
+    if _bundle is None:
+        with _load_lock:
+            if _bundle is None:
+                _bundle = load_bundle()
+    return _bundle
+
+def module_content(module: str) -> Mapping:
+    """Read-only content for a module, empty when it has none"""
+    return get_content_bundle().get(module)
+
+if __name__ == "__main__":
+    bundle = compile_bundle()
+    size = SNAPSHOT_PATH.stat().st_size if SNAPSHOT_PATH.exists() else 0
+    print(f"Compiled {len(bundle.modules)} content modules into {SNAPSHOT_PATH.name} "
+          f"({size / 1024:.1f} KB, stamp {bundle.stamp.hex()[:12]})")
+    sys.exit(0 if size else 1)
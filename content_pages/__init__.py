@@ -0,0 +1,27 @@
+"""
+Page manifest and registry for the interactive learning content
+Navigation metadata lives here; page modules are imported on first visit
+"""
+
+from app_pages import MANIFEST as TUTORIAL_MANIFEST
+from page_registry import PageRegistry
+
+MANIFEST = [
+    {'id': 'Home', 'title': 'Home', 'icon': '🏠', 'module': 'home'},
+    {'id': 'Getting Started', 'title': 'Getting Started', 'icon': '🚀', 'module': 'getting_started'},
+    {'id': 'Core Concepts', 'title': 'Core Concepts', 'icon': '🧠', 'module': 'core_concepts'},
+    {'id': 'First Repository', 'title': 'First Repository', 'icon': '🏗️', 'module': 'first_repository'},
+    {'id': 'Command Line', 'title': 'Command Line', 'icon': '⌨️', 'module': 'command_line'},
+    {'id': 'Collaboration', 'title': 'Collaboration', 'icon': '👥', 'module': 'collaboration'},
+    {'id': 'Best Practices', 'title': 'Best Practices', 'icon': '⭐', 'module': 'best_practices'},
+    {'id': 'Real Projects', 'title': 'Real Projects', 'icon': '🚀', 'module': 'real_projects'},
+    {'id': 'Practice', 'title': 'Practice Quiz', 'icon': '🎯', 'module': 'practice'},
+    {'id': 'Quick Reference', 'title': 'Quick Reference', 'icon': '📚', 'module': 'quick_reference'},
+    {'id': 'Resources', 'title': 'Resources', 'icon': '📖', 'module': 'resources'}
+]
+
+REGISTRY = PageRegistry(__name__, MANIFEST)
+
+# Lessons share the learner's progress with the tutorial page built on the same module
+_TUTORIAL_IDS = {page['module']: page['id'] for page in TUTORIAL_MANIFEST}
+PROGRESS_IDS = {page['id']: _TUTORIAL_IDS[page['module']] for page in MANIFEST}
@@ -0,0 +1,151 @@
+"""
+Best Practices page of the interactive learning content
+"""
+
+import streamlit as st
+from content_pages.common import display_header, complete_page
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    """Best Practices - Common mistakes and professional habits"""
+    display_header("Best Practices", "Learn the common mistakes that trip up beginners and how to avoid them", "⭐")
+    
+    st.markdown("These habits will save you time, stress, and help you work like a pro.")
+    
+    # Common beginner mistakes
+    st.markdown("## Common Beginner Mistakes (and How to Avoid Them)")
+    
+    mistakes = CONTENT['mistakes']
+    
+    for mistake in mistakes:
+        severity_colors = {
+            "high": ("#dc3545", "#f8d7da"),
+            "medium": ("#ffc107", "#fff3cd"), 
+            "low": ("#6c757d", "#f8f9fa")
+        }
+        
+        border_color, bg_color = severity_colors[mistake["severity"]]
+        
+        st.markdown(f"""
+        <div class='step-container'>
+            <div style='display: grid; grid-template-columns: 1fr 1fr; gap: 2rem;'>
+                <div>
+                    <h4 style='color: #dc3545; margin-bottom: 0.5rem;'>❌ Mistake: {mistake['mistake']}</h4>
+                    <p style='color: #721c24; background: {bg_color}; padding: 0.8rem; border-radius: 8px; border-left: 4px solid {border_color};'>
+                        <strong>Why it hurts:</strong> {mistake['why']}
+                    </p>
+                </div>
+                <div>
+                    <h4 style='color: #28a745; margin-bottom: 0.5rem;'>✅ Better Habit: {mistake['better']}</h4>
+                    <p style='color: #155724; background: #d4edda; padding: 0.8rem; border-radius: 8px; border-left: 4px solid #28a745;'>
+                        <strong>Quick fix:</strong> {mistake['fix']}
+                    </p>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # .gitignore basics
+    st.markdown("## .gitignore Basics")
+    st.markdown("A `.gitignore` file tells Git which files to ignore. The point is to avoid committing anything sensitive or unneeded.")
+    
+    gitignore_examples = CONTENT['gitignore_examples']
+    
+    cols = st.columns(2)
+    for i, (category, examples, why) in enumerate(gitignore_examples):
+        col = cols[i % 2]
+        with col:
+            st.markdown(f"""
+            <div style='border: 1px solid #e0e0e0; border-radius: 8px; padding: 1rem; background: white; margin: 0.5rem 0;'>
+                <h4 style='color: #2c3e50; margin-bottom: 0.5rem;'>{category}</h4>
+                <code style='background: #f8f9fa; padding: 0.4rem 0.6rem; border-radius: 4px; color: #d63384; display: block; margin-bottom: 0.5rem;'>{examples}</code>
+                <p style='color: #6c757d; margin: 0; font-size: 0.9rem;'>{why}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class='info-box'>
+        <h4>💡 Pro Tip:</h4>
+        <p>Start with a small, project-specific list and grow it only when you know why. For many classroom projects, ignoring temporary files, logs, and system files is enough.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Commit hygiene
+    st.markdown("## Commit Hygiene")
+    st.markdown("Good commit habits will carry you far. Here are the key principles for writing great commit messages:")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Best Practices:")
+        commit_tips = CONTENT['commit_tips']
+        
+        for tip in commit_tips:
+            st.markdown(f"• {tip}")
+    
+    with col2:
+        st.markdown("### Good vs Bad Examples:")
+        
+        st.markdown("""
+        <div style='border-left: 4px solid #28a745; padding: 0.8rem; background: #d4edda; border-radius: 8px; margin-bottom: 1rem;'>
+            <h5 style='color: #155724; margin-bottom: 0.5rem;'>✅ Good:</h5>
+            <code style='color: #155724; display: block;'>"Add user profile page with bio section"</code>
+            <code style='color: #155724; display: block;'>"Fix mobile menu layout on small screens"</code>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div style='border-left: 4px solid #dc3545; padding: 0.8rem; background: #f8d7da; border-radius: 8px;'>
+            <h5 style='color: #721c24; margin-bottom: 0.5rem;'>❌ Bad:</h5>
+            <code style='color: #721c24; display: block;'>"Fixed stuff"</code>
+            <code style='color: #721c24; display: block;'>"updated the thing"</code>
+            <code style='color: #721c24; display: block;'>"wip"</code>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Safety and ethics
+    st.markdown("## Safe and Ethical Use")
+    st.markdown("A few responsible-use principles will keep you and your classmates safe:")
+    
+    safety_tips = CONTENT['safety_tips']
+    
+    for tip in safety_tips:
+        st.markdown(f"""
+        <div class='step-container'>
+            <h4 style='color: #2c3e50; margin-bottom: 0.5rem;'>{tip['title']}</h4>
+            <p style='color: #6c757d; margin-bottom: 1rem;'>{tip['description']}</p>
+            <div class='info-box'>
+                <strong>Action:</strong> {tip['action']}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style='background: #f8d7da; border: 1px solid #f5c6cb; border-radius: 8px; padding: 1rem; margin: 1rem 0;'>
+        <h4 style='color: #721c24; margin-bottom: 0.5rem;'>🚨 If You Accidentally Commit a Secret:</h4>
+        <p style='color: #721c24; margin: 0;'>Talk to your teacher immediately and follow their guidance to remove it safely from history. Never commit API keys, passwords, or other sensitive information.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Key takeaways
+    st.markdown("## Key Takeaways")
+    
+    takeaways = CONTENT['takeaways']
+    
+    cols = st.columns(3)
+    for takeaway in takeaways:
+        with cols[takeaways.index(takeaway)]:
+            st.markdown(f"""
+            <div style='text-align: center; padding: 1.5rem; background: white; border-radius: 10px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+                <div style='font-size: 3rem; margin-bottom: 1rem;'>{takeaway['icon']}</div>
+                <h4 style='color: #2c3e50; margin-bottom: 1rem;'>{takeaway['title']}</h4>
+                <p style='color: #7f8c8d; font-size: 0.9rem;'>{takeaway['description']}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    if st.button("✅ Complete Best Practices", use_container_width=True):
+        complete_page("Best Practices")
+        st.balloons()
+        st.success("🎯 Excellent! You're now equipped with professional habits. Ready to build something real?")
@@ -0,0 +1,125 @@
+"""
+Collaboration page of the interactive learning content
+"""
+
+import streamlit as st
+from content_pages.common import display_header, complete_page
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    """Collaboration - Team workflows and pull requests"""
+    display_header("Collaboration", "Master branches, pull requests, and code review", "👥")
+    
+    st.markdown("Learn how teams work together safely and efficiently using GitHub's collaboration features.")
+    
+    # Simple team workflow
+    st.markdown("## Simple Team Workflow")
+    st.markdown("Branches keep your main project stable. When you want to add a feature or fix something, create a branch, do the work, and open a pull request.")
+    
+    team_workflow = CONTENT['team_workflow']
+    
+    for i, (who, action, happens) in enumerate(team_workflow, 1):
+        st.markdown(f"""
+        <div class='step-container'>
+            <div style='display: flex; align-items: center; gap: 1rem;'>
+                <div style='background: #3498db; color: white; width: 30px; height: 30px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-weight: bold;'>{i}</div>
+                <div style='flex: 1;'>
+                    <div style='color: #007bff; font-weight: bold;'>{who}</div>
+                    <div style='color: #2c3e50; font-weight: bold; margin: 0.2rem 0;'>{action}</div>
+                    <div style='color: #6c757d;'>{happens}</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # What is a pull request
+    st.markdown("## What is a Pull Request?")
+    st.markdown("A pull request shows a diff—a side-by-side view of what changed—and invites discussion. Reviewers can leave comments, suggest changes, and approve the PR. When approved, you merge and delete the branch.")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### ✅ Before Opening PR:")
+        st.markdown("""
+        <ul>
+            <li>Make sure your code works</li>
+            <li>Test your changes</li>
+            <li>Write a clear description</li>
+            <li>Link related issues</li>
+        </ul>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("### 👀 When Reviewing PRs:")
+        st.markdown("""
+        <ul>
+            <li>Test the changes if possible</li>
+            <li>Check code quality and style</li>
+            <li>Ask questions if something is unclear</li>
+            <li>Suggest improvements kindly</li>
+        </ul>
+        """, unsafe_allow_html=True)
+    
+    # Best practices
+    st.markdown("## Collaboration Best Practices")
+    
+    practices = CONTENT['practices']
+    
+    cols = st.columns(2)
+    for i, practice in enumerate(practices):
+        col = cols[i % 2]
+        with col:
+            st.markdown(f"""
+            <div style='background: white; border: 1px solid #e0e0e0; border-radius: 10px; padding: 1.5rem; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+                <h4 style='color: #2c3e50; margin-bottom: 1rem;'>{practice['title']}</h4>
+                <div style='background: #e8f4f8; padding: 0.8rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #3498db;'>
+                    <strong style='color: #2c3e50;'>💡 {practice['tip']}</strong>
+                </div>
+                <p style='color: #6c757d; margin: 0;'>{practice['why']}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Code review benefits
+    st.markdown("## Why Code Review Matters")
+    
+    benefits = CONTENT['benefits']
+    
+    cols = st.columns(3)
+    for benefit in benefits:
+        with cols[benefits.index(benefit)]:
+            st.markdown(f"""
+            <div style='text-align: center; padding: 1.5rem; background: white; border-radius: 10px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+                <div style='font-size: 3rem; margin-bottom: 1rem;'>{benefit['icon']}</div>
+                <h4 style='color: #2c3e50; margin-bottom: 1rem;'>{benefit['title']}</h4>
+                <p style='color: #7f8c8d; font-size: 0.9rem;'>{benefit['description']}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Kind reviewing
+    st.markdown("## How to Review Code Kindly")
+    st.markdown("Reviewing is not about being critical; it's about helping each other catch mistakes and learn. Keep comments friendly and specific.")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div style='border-left: 4px solid #28a745; padding: 1rem; background: #d4edda; border-radius: 8px;'>
+            <h4 style='color: #155724;'>✅ Good Review Comment:</h4>
+            <p style='color: #155724; margin: 0;'>"Consider adding alt text to this image for accessibility. Screen readers will be able to describe the image to users."</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div style='border-left: 4px solid #dc3545; padding: 1rem; background: #f8d7da; border-radius: 8px;'>
+            <h4 style='color: #721c24;'>❌ Avoid This Type of Comment:</h4>
+            <p style='color: #721c24; margin: 0;'>"This is wrong. Why would you do it this way?"</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    if st.button("✅ Complete Collaboration Tutorial", use_container_width=True):
+        complete_page("Collaboration")
+        st.balloons()
+        st.success("🤝 Perfect! You're now ready to work effectively in teams. Next up: best practices!")
@@ -0,0 +1,112 @@
+"""
+Command Line page of the interactive learning content
+"""
+
+import streamlit as st
+from content_pages.common import display_header, complete_page
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    """Command Line - Git commands and workflows"""
+    display_header("Command Line Basics", "Learn Git commands and how to sync your local work with GitHub", "⌨️")
+    
+    st.markdown("Master the essential workflow: edit → stage → commit → push.")
+    
+    # From local to GitHub flow
+    st.markdown("## From Local Folder to GitHub")
+    
+    command_flow = CONTENT['command_flow']
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🖥️ Local Setup (Steps 1-5)")
+        for i, step in enumerate(command_flow[:5], 1):
+            st.markdown(f"""
+            <div style='border-left: 4px solid #3498db; padding: 0.8rem; background: #f8f9fa; margin: 0.5rem 0;'>
+                <div style='display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.3rem;'>
+                    <span style='background: #3498db; color: white; width: 20px; height: 20px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 0.8rem; font-weight: bold;'>{i}</span>
+                    <code style='background: #e9ecef; padding: 0.2rem 0.4rem; border-radius: 4px; color: #d63384;'>{step['command']}</code>
+                </div>
+                <p style='margin: 0.3rem 0 0 0; color: #6c757d; font-size: 0.9rem;'>{step['what']}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("### ☁️ Connect to GitHub (Steps 6-9)")
+        for i, step in enumerate(command_flow[5:], 6):
+            st.markdown(f"""
+            <div style='border-left: 4px solid #9b59b6; padding: 0.8rem; background: #f8f9fa; margin: 0.5rem 0;'>
+                <div style='display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.3rem;'>
+                    <span style='background: #9b59b6; color: white; width: 20px; height: 20px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 0.8rem; font-weight: bold;'>{i}</span>
+                    <code style='background: #e9ecef; padding: 0.2rem 0.4rem; border-radius: 4px; color: #d63384;'>{step['command']}</code>
+                </div>
+                <p style='margin: 0.3rem 0 0 0; color: #6c757d; font-size: 0.9rem;'>{step['what']}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Core cycle visualization
+    st.markdown("""
+    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 2rem; border-radius: 10px; text-align: center; margin: 2rem 0;'>
+        <h3>🔄 The Core Git Cycle</h3>
+        <div style='display: flex; justify-content: center; align-items: center; gap: 1rem; flex-wrap: wrap; margin: 1rem 0;'>
+            <div style='background: rgba(255,255,255,0.2); padding: 0.8rem; border-radius: 50px;'>1. Edit files</div>
+            <span>→</span>
+            <div style='background: rgba(255,255,255,0.2); padding: 0.8rem; border-radius: 50px;'>2. git add</div>
+            <span>→</span>
+            <div style='background: rgba(255,255,255,0.2); padding: 0.8rem; border-radius: 50px;'>3. git commit</div>
+            <span>→</span>
+            <div style='background: rgba(255,255,255,0.2); padding: 0.8rem; border-radius: 50px;'>4. git push</div>
+        </div>
+        <p>Use <code style='background: rgba(255,255,255,0.3); padding: 0.2rem 0.4rem; border-radius: 4px;'>git status</code> often, especially when you are learning. It tells you what changed, what is staged, and what is untracked.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Most used commands
+    st.markdown("## Local Commands You Will Use Most")
+    
+    most_used = CONTENT['most_used']
+    
+    for cmd, when, expect in most_used:
+        col1, col2, col3 = st.columns([2, 2, 3])
+        with col1:
+            st.code(cmd, language='bash')
+        with col2:
+            st.caption(f"**When:** {when}")
+        with col3:
+            st.caption(f"**Expect:** {expect}")
+    
+    # Branching and merging
+    st.markdown("## Branching and Merging Locally")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🌿 Create a Branch")
+        st.code("git checkout -b feature/new-page", language='bash')
+        st.markdown("Creates and switches to a new branch. Use the modern `git switch` equivalents if your version supports them.")
+    
+    with col2:
+        st.markdown("### 🔗 Merge Changes")
+        st.code("git merge feature/new-page", language='bash')
+        st.markdown("Combines changes from another branch. If the same line changed in both branches, you will get a conflict—resolve it by editing the file, staging, and committing the merge.")
+    
+    # Important notes
+    st.markdown("""
+    <div class='info-box'>
+        <h3>📝 Important Notes</h3>
+        <ul>
+            <li><strong>Default branch names:</strong> Older guides use "master," while modern defaults use "main." Follow your teacher's policy.</li>
+            <li><strong>One focused change per commit:</strong> Good commit messages like "Fix hamburger menu on mobile" make history clear.</li>
+            <li><strong>Use -u flag:</strong> The first time you push, use <code>git push -u origin main</code> to set up tracking.</li>
+            <li><strong>View history:</strong> <code>git log</code> shows your commit trail; press Q to exit the pager.</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if st.button("✅ Complete Command Line Basics", use_container_width=True):
+        complete_page("Command Line")
+        st.balloons()
+        st.success("🚀 Great work! You're now ready to collaborate with others using GitHub!")
@@ -0,0 +1,56 @@
+"""
+Layout helpers shared by the content pages
+"""
+
+import streamlit as st
+from app_state import mark_page_completed
+from components import banner
+from content_pages import PROGRESS_IDS
+
+def navigate_to(page_id: str):
+    """Switch pages through the sidebar radio; used as a button callback, before the radio is drawn"""
+    st.session_state.nav_page = page_id
+
+def complete_page(page_id: str):
+    """Mark a lesson complete in the learner's shared progress"""
+    mark_page_completed(PROGRESS_IDS[page_id])
+
+def is_page_completed(page_id: str) -> bool:
+    """Whether a lesson is complete, in this section or in the tutorial"""
+    return st.session_state.progress.is_completed(PROGRESS_IDS[page_id])
+
+def display_header(title: str, subtitle: str, emoji: str = "🎓"):
+    """Display consistent page headers"""
+    banner(f"{emoji} {title}", subtitle, variant="page")
+
+def display_progress_dashboard():
+    """Display learning progress dashboard"""
+    progress = st.session_state.progress
+    total_pages = progress.total_pages
+    completed_count = progress.completed_count
+    progress_percentage = (completed_count / total_pages) * 100
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(
+            "Your Progress",
+            f"{progress_percentage:.0f}%",
+            f"{completed_count} of {total_pages} lessons completed"
+        )
+    
+    with col2:
+        quiz_completed = len(progress.quiz_scores)
+        st.metric(
+            "Quiz Scores",
+            f"{quiz_completed}",
+            "sections completed"
+        )
+    
+    with col3:
+        recent_activity = "Active today" if progress_percentage > 0 else "Not started"
+        st.metric(
+            "Current Status",
+            recent_activity,
+            "Keep learning!"
+        )
@@ -0,0 +1,112 @@
+"""
+Core Concepts page of the interactive learning content
+"""
+
+import streamlit as st
+from content_pages.common import display_header, complete_page
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    """Core Concepts with age-appropriate analogies"""
+    display_header("Core Concepts", "Master the fundamentals through teen-friendly analogies", "🧠")
+    
+    st.markdown("Understanding these basics will make everything else click into place.")
+    
+    # Essential GitHub concepts with analogies
+    concepts = CONTENT['concepts']
+    
+    # Display concepts in a grid
+    cols = st.columns(2)
+    for i, concept in enumerate(concepts):
+        col = cols[i % 2]
+        with col:
+            st.markdown(f"""
+            <div style='background: white; border: 1px solid #e0e0e0; border-radius: 10px; padding: 1.5rem; margin: 0.5rem 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+                <h3 style='color: #2c3e50; margin-bottom: 1rem;'>🧠 {concept['title']}</h3>
+                <div style='background: #e8f4f8; padding: 0.8rem; border-radius: 8px; margin-bottom: 1rem; border-left: 4px solid #3498db;'>
+                    <strong>Analogy: {concept['analogy']}</strong>
+                </div>
+                <p style='color: #7f8c8d; margin-bottom: 1rem;'>{concept['description']}</p>
+                <div style='border-top: 1px solid #ecf0f1; padding-top: 1rem; font-size: 0.9rem; color: #34495e;'>
+                    {concept['details']}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Branch naming best practices
+    st.markdown("## Branch Naming Best Practices")
+    st.markdown("Use a pattern like `type/short-description` to keep branches clear for everyone.")
+    
+    branch_examples = CONTENT['branch_examples']
+    
+    for branch_name, purpose in branch_examples:
+        st.markdown(f"""
+        <div style='border-left: 4px solid #3498db; padding: 0.8rem; background: #f8f9fa; margin: 0.5rem 0;'>
+            <code style='background: #e9ecef; padding: 0.2rem 0.4rem; border-radius: 4px; color: #d63384;'>{branch_name}</code>
+            <p style='margin: 0.5rem 0 0 0; color: #6c757d;'>{purpose}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class='info-box'>
+        <h4>💡 Why naming matters:</h4>
+        <p>Clear branch names help teammates understand what you're working on without having to dig into the code changes.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Three areas workflow
+    st.markdown("## How Changes Move Through Git")
+    st.markdown("Understanding the three areas explains how your changes move from 'desk' to 'history' to 'cloud.'")
+    
+    workflow_areas = CONTENT['workflow_areas']
+    
+    for i, area in enumerate(workflow_areas, 1):
+        color_map = {
+            "primary": ("#3498db", "#e3f2fd"),
+            "warning": ("#f39c12", "#fff8e1"), 
+            "success": ("#27ae60", "#e8f5e8"),
+            "secondary": ("#9b59b6", "#f3e5f5")
+        }
+        border_color, bg_color = color_map[area["color"]]
+        
+        st.markdown(f"""
+        <div style='padding: 1.5rem; border: 2px solid {border_color}; background: {bg_color}; border-radius: 8px; margin: 1rem 0;'>
+            <div style='display: flex; justify-content: between; align-items: center; margin-bottom: 0.5rem;'>
+                <h4 style='margin: 0; color: #2c3e50;'>{i}. {area['name']}</h4>
+                <span style='background: {border_color}; color: white; padding: 0.2rem 0.6rem; border-radius: 20px; font-size: 0.8rem;'>Step {i}</span>
+            </div>
+            <p style='margin: 0.5rem 0; color: #34495e;'>{area['description']}</p>
+            <code style='background: white; padding: 0.4rem 0.6rem; border-radius: 4px; color: #d63384; font-size: 0.9rem;'>{area['action']}</code>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class='success-box'>
+        <h4>🔄 The path is: edit → stage → commit → push</h4>
+        <p>Understanding this flow helps you keep changes organized and makes collaboration smoother.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Key takeaways
+    st.markdown("## Key Takeaways")
+    
+    takeaways = CONTENT['takeaways']
+    
+    cols = st.columns(3)
+    for i, takeaway in enumerate(takeaways):
+        with cols[i]:
+            st.markdown(f"""
+            <div style='text-align: center; padding: 1.5rem; background: white; border-radius: 10px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+                <div style='font-size: 3rem; margin-bottom: 1rem;'>{takeaway['icon']}</div>
+                <h4 style='color: #2c3e50; margin-bottom: 1rem;'>{takeaway['title']}</h4>
+                <p style='color: #7f8c8d; font-size: 0.9rem;'>{takeaway['description']}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Completion button
+    if st.button("✅ Mark Core Concepts as Complete", use_container_width=True):
+        complete_page("Core Concepts")
+        st.balloons()
+        st.success("Great job! You've mastered the core concepts. Ready to create your first repository?")
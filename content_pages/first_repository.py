@@ -0,0 +1,121 @@
+"""
+First Repository page of the interactive learning content
+"""
+
+import streamlit as st
+from content_pages.common import display_header, complete_page
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    """First Repository - Hello World Tutorial"""
+    display_header("Your First Repository", "Create your first GitHub repository with the classic 'Hello World' tutorial", "🏗️")
+    
+    st.markdown("This quick walkthrough shows you how collaboration works without touching the command line.")
+    
+    # Quick actions overview
+    st.markdown("## Quick Actions Overview")
+    
+    quick_actions = CONTENT['quick_actions']
+    
+    cols = st.columns(5)
+    for i, (action, what, why, icon) in enumerate(quick_actions):
+        with cols[i]:
+            st.markdown(f"""
+            <div style='text-align: center; padding: 1rem; background: #f8f9fa; border-radius: 8px; margin: 0.5rem 0;'>
+                <div style='font-size: 2rem; margin-bottom: 0.5rem;'>{icon}</div>
+                <h4 style='color: #2c3e50; margin: 0.5rem 0;'>{action}</h4>
+                <p style='color: #6c757d; font-size: 0.8rem; margin: 0.2rem 0;'>{what}</p>
+                <p style='color: #007bff; font-size: 0.8rem; font-weight: bold;'>{why}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Step-by-step tutorial
+    st.markdown("## Step-by-Step Tutorial")
+    
+    steps = CONTENT['steps']
+    
+    for i, step in enumerate(steps, 1):
+        with st.expander(f"Step {i}: {step['title']}", expanded=(i <= 2)):
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                st.markdown(f"**What to do:** {step['description']}")
+                
+                st.markdown("**Detailed steps:**")
+                for detail in step['details']:
+                    st.markdown(f"• {detail}")
+                
+                st.markdown(f"""
+                <div class='info-box'>
+                    <h4>💡 Pro Tip:</h4>
+                    <p>{step['tip']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    # README explanation
+    st.markdown("## What Is a README and Why It Matters")
+    st.markdown("A README is the first thing people see. Use it to explain the project in plain language—what it does, how to run or open it, and how to contribute.")
+    
+    readme_template = """# Project Name
+
+A brief description of what this project does.
+
+## Getting Started
+
+How to get started with this project.
+
+## Contributing
+
+How others can contribute to this project.
+
+## License
+
+What license this project uses."""
+    
+    st.code(readme_template, language='markdown')
+    
+    # Merge conflicts primer
+    st.markdown("""
+    <div class='warning-box'>
+        <h3>⚠️ Merge Conflicts: A Quick Primer</h3>
+        <p>A merge conflict happens when two branches change the same line in different ways, and Git cannot automatically combine them. GitHub will show you the conflict and let you choose which change to keep (or keep both).</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown("""
+        <div style='background: #f8d7da; border: 1px solid #f5c6cb; padding: 1rem; border-radius: 8px; text-align: center;'>
+            <h4>&lt;&lt;&lt;&lt;&lt;&lt;</h4>
+            <p>Start of your change</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col2:
+        st.markdown("""
+        <div style='background: #fff3cd; border: 1px solid #ffeaa7; padding: 1rem; border-radius: 8px; text-align: center;'>
+            <h4>=======</h4>
+            <p>Separator - compare both sides</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col3:
+        st.markdown("""
+        <div style='background: #d4edda; border: 1px solid #c3e6cb; padding: 1rem; border-radius: 8px; text-align: center;'>
+            <h4>&gt;&gt;&gt;&gt;&gt;&gt;</h4>
+            <p>End of the other change</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class='warning-box'>
+        <h4>🔧 Fix:</h4>
+        <p>Resolve the conflict, stage the file, and continue the merge. For this simple exercise, conflicts are unlikely. If they happen, read the on-screen instructions, resolve the differences, and mark the PR as ready to merge.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Completion
+    if st.button("✅ Complete First Repository Tutorial", use_container_width=True):
+        complete_page("First Repository")
+        st.balloons()
+        st.success("🎉 Excellent! You've created your first repository. Ready to learn the command line?")
@@ -0,0 +1,105 @@
+"""
+Getting Started page of the interactive learning content
+"""
+
+import streamlit as st
+from content_pages.common import display_header, complete_page
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    """Getting Started - Setup and configuration"""
+    display_header("Getting Started", "Set up your GitHub account and configure Git in under 10 minutes", "🚀")
+    
+    # Why Git + GitHub section
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("""
+        <div class='info-box'>
+            <h3>Why Git + GitHub?</h3>
+            <p><strong>Git (Your Computer):</strong> Tracks changes on your computer, keeps a history, lets you branch to try ideas safely.</p>
+            <p><strong>GitHub (Online):</strong> Hosts your repository online, makes collaboration easier, enables review via pull requests.</p>
+            <p><strong>Key Point:</strong> You can use Git without GitHub, and you can use GitHub with Git—together they are a powerful team.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("### Quick Setup (10 minutes)")
+        st.markdown("""
+        1. **Install Git** (5 min)
+        2. **Create GitHub Account** (3 min)  
+        3. **Configure Git** (2 min)
+        """)
+    
+    # Setup checklist
+    st.markdown("## Setup Checklist")
+    st.markdown("Complete these steps to get ready for GitHub:")
+    
+    setup_steps = CONTENT['setup_steps']
+    
+    completed_count = sum(1 for step in setup_steps if st.session_state.setup_steps[step["id"]])
+    
+    # Progress indicator
+    st.progress(completed_count / len(setup_steps))
+    st.caption(f"Setup Progress: {completed_count} of {len(setup_steps)} completed")
+    
+    # Step checkboxes
+    for i, step in enumerate(setup_steps, 1):
+        with st.expander(f"Step {i}: {step['title']}", expanded=(i <= 2)):
+            st.markdown(f"**What you need to do:** {step['description']}")
+            
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.code(step['action'], language='bash')
+                
+                st.markdown("**Details:**")
+                for detail in step['details']:
+                    st.markdown(f"• {detail}")
+            
+            with col2:
+                completed = st.checkbox(
+                    "Mark as completed",
+                    value=st.session_state.setup_steps[step['id']],
+                    key=f"setup_{step['id']}"
+                )
+                
+                if completed != st.session_state.setup_steps[step['id']]:
+                    st.session_state.setup_steps[step['id']] = completed
+                    
+                    # Check if all completed
+                    if all(st.session_state.setup_steps.values()):
+                        complete_page("Getting Started")
+                        st.balloons()
+                        st.success("🎉 Setup Complete! You've successfully set up Git and GitHub!")
+    
+    # Terminal commands cheat sheet
+    if completed_count > 0:
+        st.markdown("""
+        <div class='success-box'>
+            <h3>💡 Pro Tip: Essential Terminal Commands</h3>
+            <p>Keep these handy while you set up and practice:</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        commands = CONTENT['commands']
+        
+        for cmd, desc in commands:
+            col1, col2 = st.columns([2, 3])
+            with col1:
+                st.code(cmd, language='bash')
+            with col2:
+                st.text(desc)
+    
+    # Completion encouragement
+    if completed_count == len(setup_steps):
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); 
+                    color: white; padding: 2rem; border-radius: 10px; text-align: center; margin-top: 2rem;'>
+            <h2>🎉 Setup Complete!</h2>
+            <p>Congratulations! You've successfully set up Git and GitHub. You're ready to start learning version control.</p>
+            <a href='#core-concepts' style='background: white; color: #11998e; padding: 1rem 2rem; 
+               border-radius: 8px; text-decoration: none; font-weight: bold;'>Continue to Core Concepts →</a>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,42 @@
+"""
+Home page of the interactive learning content
+"""
+
+import streamlit as st
+from components import hero, module_row
+from content_pages.common import display_progress_dashboard, is_page_completed, navigate_to
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    """Home page with learning path and overview"""
+    hero(
+        "Master GitHub with Interactive Learning",
+        "Learn version control and collaboration the fun way. Build real projects, "
+        "earn achievements, and become a confident programmer through hands-on tutorials "
+        "designed for 9th graders.",
+        [("🚀 Start Learning", "#getting-started"), ("📚 Quick Reference", "#quick-reference")]
+    )
+    
+    display_progress_dashboard()
+    
+    st.markdown("## Your Learning Journey")
+    st.markdown("Follow our structured path from complete beginner to confident GitHub user. Each lesson builds on the previous one, with hands-on practice and real-world examples.")
+    
+    # Learning modules with descriptions
+    modules = CONTENT['modules']
+    
+    for module in modules:
+        status = "✅ Completed" if is_page_completed(module['page']) else "📝 In Progress"
+        module_row(module['icon'], module['title'], module['description'], status)
+    
+    # Quick actions
+    st.markdown("## Ready to Dive Deeper?")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.button("🎯 Take Practice Quiz", use_container_width=True, on_click=navigate_to, args=("Practice",))
+    
+    with col2:
+        st.button("📖 Quick Reference", use_container_width=True, on_click=navigate_to, args=("Quick Reference",))
@@ -0,0 +1,160 @@
+"""
+Practice Quiz page of the interactive learning content
+"""
+
+import streamlit as st
+from app_state import record_quiz_score, rehydrating_callback
+from content_pages.common import complete_page, display_header
+from quiz_bank import load_quiz_bank
+
+# Button callbacks: each applies its transition before the one rerun the click causes
+@rehydrating_callback
+def start_quiz(section_id):
+    if st.session_state.current_quiz != section_id:
+        st.session_state.current_quiz = section_id
+        st.session_state.current_question_index = 0
+        st.session_state.quiz_answers = {}
+
+@rehydrating_callback
+def submit_answer(question_id):
+    selected_answer = st.session_state[f"q_{question_id}"]
+    st.session_state.quiz_answers[question_id] = int(selected_answer.split('.')[0]) - 1
+
+@rehydrating_callback
+def next_question():
+    st.session_state.current_question_index += 1
+
+@rehydrating_callback
+def finish_quiz(section_id):
+    # The score is saved once, on the transition to results
+    questions = load_quiz_bank().sections[section_id]['questions']
+    correct_count = sum(1 for q in questions if st.session_state.quiz_answers.get(q['id']) == q['correct'])
+    record_quiz_score(section_id, correct_count, len(questions),
+                      [st.session_state.quiz_answers.get(q['id'], -1) for q in questions])
+    next_question()
+
+@rehydrating_callback
+def close_quiz():
+    st.session_state.current_quiz = None
+    st.session_state.current_question_index = 0
+    st.session_state.quiz_answers = {}
+
+def render():
+    """Practice - Interactive quizzes and testing"""
+    display_header("Practice & Mastery", "Test your knowledge with interactive quizzes", "🎯")
+    
+    st.markdown("Review explanations for each question to strengthen your understanding of GitHub concepts.")
+    
+    # Quiz sections from the shared question bank
+    quiz_bank = load_quiz_bank()
+    quiz_sections = quiz_bank.sections
+    
+    # Section selector
+    st.markdown("## Choose a Section to Practice")
+    
+    # Show completed sections, whichever part of the tutorial they were taken in
+    quiz_scores = st.session_state.progress.quiz_scores
+    for section_id, section_data in quiz_sections.items():
+        if section_id in quiz_scores:
+            st.success(f"✅ {section_data['title']} Quiz - Score: {quiz_scores[section_id].percentage}%")
+    
+    # Select section to take
+    section_id = st.selectbox(
+        "Select a quiz section:",
+        quiz_bank.section_keys,
+        format_func=lambda key: f"{quiz_sections[key]['title']} - {quiz_sections[key]['description']}"
+    )
+    section_data = quiz_sections[section_id]
+    
+    # Quiz interface
+    if 'current_quiz' not in st.session_state:
+        st.session_state.current_quiz = None
+    if 'current_question_index' not in st.session_state:
+        st.session_state.current_question_index = 0
+    if 'quiz_answers' not in st.session_state:
+        st.session_state.quiz_answers = {}
+    
+    # Start quiz
+    st.button("Start Quiz", on_click=start_quiz, args=(section_id,))
+    if st.session_state.current_quiz == section_id:
+        questions = section_data['questions']
+        current_index = st.session_state.current_question_index
+        
+        if current_index < len(questions):
+            question = questions[current_index]
+            
+            # Progress
+            progress = (current_index + 1) / len(questions)
+            st.progress(progress)
+            st.caption(f"Question {current_index + 1} of {len(questions)}")
+            
+            # Question
+            st.markdown(f"### {question['question']}")
+            
+            # Answer options
+            st.radio("Select your answer:", 
+                     [f"{i+1}. {option}" for i, option in enumerate(question['options'])],
+                     key=f"q_{question['id']}")
+            
+            st.button("Submit Answer", on_click=submit_answer, args=(question['id'],))
+            answer_index = st.session_state.quiz_answers.get(question['id'])
+            if answer_index is not None:
+                # Show result
+                if answer_index == question['correct']:
+                    st.success("✅ Correct! Well done!")
+                else:
+                    st.error(f"❌ Incorrect. The correct answer is: {question['options'][question['correct']]}")
+                
+                # Show explanation
+                st.info(f"**Explanation:** {question['explanation']}")
+                
+                # Next question or results
+                if current_index < len(questions) - 1:
+                    st.button("Next Question", on_click=next_question)
+                else:
+                    st.button("View Results", on_click=finish_quiz, args=(section_id,))
+        else:
+            # Quiz completed - show results
+            correct_count = sum(1 for q in questions 
+                              if st.session_state.quiz_answers.get(q['id']) == q['correct'])
+            score = (correct_count / len(questions)) * 100
+            
+            # Results display
+            st.markdown("## Quiz Results")
+            
+            if score >= 80:
+                st.balloons()
+                st.success(f"🎉 Excellent work! You scored {score:.0f}% ({correct_count}/{len(questions)})")
+            elif score >= 60:
+                st.success(f"👍 Good job! You scored {score:.0f}% ({correct_count}/{len(questions)})")
+            else:
+                st.warning(f"📚 Keep practicing! You scored {score:.0f}% ({correct_count}/{len(questions)})")
+            
+            # Reset quiz
+            st.button("Take Another Quiz", on_click=close_quiz)
+    
+    # Overall progress
+    if quiz_scores:
+        st.markdown("## Your Overall Progress")
+        
+        total_sections = quiz_bank.section_count
+        completed_sections = len(quiz_scores)
+        average_score = st.session_state.progress.quiz_average()
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Average Score", f"{average_score:.0f}%")
+        with col2:
+            st.metric("Sections Completed", f"{completed_sections}/{total_sections}")
+        with col3:
+            perfect_scores = sum(1 for score in quiz_scores.values() if score.percentage == 100)
+            st.metric("Perfect Scores", perfect_scores)
+    
+    # Mark as complete if all sections passed
+    if len(quiz_scores) == quiz_bank.section_count:
+        if st.session_state.progress.quiz_average() >= 70:
+            if st.button("✅ Complete Practice & Mastery", use_container_width=True):
+                complete_page("Practice")
+                st.balloons()
+                st.success("🎯 Fantastic! You've mastered all the concepts. Ready to reference materials?")
@@ -0,0 +1,96 @@
+"""
+Quick Reference page of the interactive learning content
+"""
+
+import streamlit as st
+from content_pages.common import display_header
+from cheat_sheet import CHEAT_SHEET, load_reference_table, lookup
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    """Quick Reference - Command cheat sheets and reference materials"""
+    display_header("Quick Reference", "Essential Git commands and concepts at a glance", "📚")
+    
+    st.markdown("Keep this handy while you practice.")
+    
+    # Master cheat sheet
+    st.markdown("## Git/GitHub Cheat Sheet")
+    
+    # Desktop table view
+    st.markdown("### Complete Reference Table")
+    
+    # Arrow table cached per process; the cheat sheet is its first rows, so no per-rerun conversion
+    st.dataframe(load_reference_table().slice(0, len(CHEAT_SHEET)), use_container_width=True)
+    
+    # Common workflows
+    st.markdown("## Common Workflows")
+    
+    workflows = CONTENT['workflows']
+    
+    cols = st.columns(3)
+    for i, (workflow_name, steps) in enumerate(workflows):
+        with cols[i]:
+            st.markdown(f"### {workflow_name}")
+            for j, step in enumerate(steps, 1):
+                st.markdown(f"{j}. `{step}`")
+    
+    # Additional resources
+    st.markdown("## Additional Resources")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        ### Official GitHub Cheat Sheet
+        Official GitHub Education cheat sheet with comprehensive command reference
+        """)
+        st.link_button("📥 Download PDF", 
+                      "https://education.github.com/git-cheat-sheet-education.pdf",
+                      use_container_width=True)
+    
+    with col2:
+        st.markdown("""
+        ### GitHub Documentation
+        Comprehensive documentation for all GitHub features and workflows
+        """)
+        st.link_button("📖 View Docs", 
+                      "https://docs.github.com",
+                      use_container_width=True)
+    
+    st.markdown("""
+    <div class='info-box'>
+        <h4>💡 Pro Tip</h4>
+        <p>Build a habit of writing clear messages and checking <code>git status</code> often; these two habits will carry you far.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("## Quick Command Lookup")
+    
+    # Quick search
+    search_term = st.text_input("Search for a command or concept:", placeholder="Type to search...")
+    
+    if search_term:
+        # Ranked rows of the cached table, with a vectorized substring fallback
+        search_results = lookup(search_term)
+        
+        if search_results.num_rows:
+            st.markdown(f"**Search results for '{search_term}':**")
+            st.dataframe(search_results, use_container_width=True)
+        else:
+            st.info(f"No results found for '{search_term}'")
+    
+    # Most common commands highlight
+    st.markdown("## Most Commonly Used Commands")
+    
+    common_commands = CONTENT['common_commands']
+    
+    for cmd, purpose, when in common_commands:
+        col1, col2, col3 = st.columns([2, 2, 3])
+        with col1:
+            st.code(cmd, language='bash')
+        with col2:
+            st.caption(f"**Purpose:** {purpose}")
+        with col3:
+            st.caption(f"**When:** {when}")
@@ -0,0 +1,124 @@
+"""
+Real Projects page of the interactive learning content
+"""
+
+import streamlit as st
+from content_pages.common import display_header, complete_page
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    """Real Projects - Project ideas and applications"""
+    display_header("Real Projects", "Apply what you've learned to build something awesome", "🚀")
+    
+    st.markdown("These project ideas are fun, scope-appropriate, and naturally use GitHub's collaboration features.")
+    
+    # Project ideas
+    st.markdown("## Project Ideas You'll Want to Build")
+    
+    projects = CONTENT['projects']
+    
+    for project in projects:
+        with st.expander(f"{project['icon']} {project['title']}"):
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                st.markdown(f"**{project['description']}**")
+                
+                st.markdown("**Skills you'll develop:**")
+                for skill in project['skills']:
+                    st.markdown(f"• {skill}")
+                
+                st.markdown("**Project features:**")
+                for feature in project['features']:
+                    st.markdown(f"• {feature}")
+            
+            with col2:
+                st.markdown("**Example branch name:**")
+                st.code(project['branch_example'], language='bash')
+                st.markdown("**Example commit message:**")
+                st.code(project['commit_example'], language='bash')
+    
+    # Project benefits
+    st.markdown("## Why Build Real Projects?")
+    
+    project_benefits = CONTENT['project_benefits']
+    
+    cols = st.columns(2)
+    for i, (benefit, description) in enumerate(project_benefits):
+        col = cols[i % 2]
+        with col:
+            st.markdown(f"""
+            <div style='border: 1px solid #e0e0e0; border-radius: 10px; padding: 1.5rem; background: white; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+                <h4 style='color: #2c3e50; margin-bottom: 1rem;'>{benefit}</h4>
+                <p style='color: #6c757d; margin: 0;'>{description}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Building process
+    st.markdown("## How to Build Your First Real Project")
+    
+    building_steps = CONTENT['building_steps']
+    
+    cols = st.columns(4)
+    for i, (title, description, icon) in enumerate(building_steps, 1):
+        with cols[i-1]:
+            st.markdown(f"""
+            <div style='text-align: center; padding: 1.5rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border-radius: 10px; margin: 0.5rem 0;'>
+                <div style='font-size: 2.5rem; margin-bottom: 1rem;'>{icon}</div>
+                <h4 style='margin-bottom: 1rem;'>{i}. {title}</h4>
+                <p style='font-size: 0.9rem; opacity: 0.9;'>{description}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Next steps
+    st.markdown("## What Comes Next?")
+    
+    next_steps = CONTENT['next_steps']
+    
+    for title, description, link, icon in next_steps:
+        col1, col2 = st.columns([4, 1])
+        
+        with col1:
+            st.markdown(f"""
+            <div style='border: 1px solid #e0e0e0; border-radius: 10px; padding: 1.5rem; background: white; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+                <div style='display: flex; align-items: center; gap: 1rem; margin-bottom: 1rem;'>
+                    <div style='font-size: 2rem;'>{icon}</div>
+                    <div>
+                        <h4 style='color: #2c3e50; margin: 0;'>{title}</h4>
+                        <p style='color: #6c757d; margin: 0.5rem 0 0 0;'>{description}</p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            if link:
+                st.link_button("Visit", link)
+    
+    # Growth mindset
+    st.markdown("## The Key to Steady Progress")
+    
+    st.markdown("""
+    <div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); color: white; padding: 2rem; border-radius: 15px; text-align: center; margin: 2rem 0;'>
+        <h3 style='margin-bottom: 1rem;'>🎯 The Secret to Success</h3>
+        <p style='font-size: 1.2rem; margin-bottom: 1.5rem; line-height: 1.6;'>
+            The key to steady progress is <strong>small, frequent practice</strong>. 
+            Set a goal like <em>"one repository, one branch, one PR per week,"</em> and 
+            keep your messages short and honest.
+        </p>
+        <div style='background: rgba(255,255,255,0.2); padding: 1rem; border-radius: 8px;'>
+            <p style='margin: 0; font-size: 1.1rem;'>
+                <strong>Your Learning Journey:</strong><br>
+                Over time, your repository history will become a record of growth you can be proud of. 
+                Each commit, each branch, each merged pull request tells the story of how you learned and improved.
+            </p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if st.button("✅ Complete Real Projects", use_container_width=True):
+        complete_page("Real Projects")
+        st.balloons()
+        st.success("🎉 Amazing! You're ready to tackle real-world projects. Test your knowledge with our practice quiz!")
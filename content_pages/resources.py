@@ -0,0 +1,121 @@
+"""
+Resources page of the interactive learning content
+"""
+
+import streamlit as st
+from components import tool_card
+from content_pages.common import display_header
+from content_bundle import module_content
+
+CONTENT = module_content(__name__)
+
+def render():
+    """Resources - External links and learning paths"""
+    display_header("Learning Resources", "Continue your GitHub learning journey", "📖")
+    
+    st.markdown("Practice tools, official courses, and real-world applications to deepen your understanding.")
+    
+    # Visual learning aids and practice tools
+    st.markdown("## Visual Learning Aids and Practice Tools")
+    st.markdown("Visualization accelerates understanding, especially for branching and merging. Use the tools below for 10–15 minute practice bursts.")
+    
+    practice_tools = CONTENT['practice_tools']
+    
+    cols = st.columns(3)
+    for name, description, link, icon in practice_tools:
+        with cols[practice_tools.index((name, description, link, icon))]:
+            tool_card(icon, name, description, link)
+    
+    st.markdown("""
+    <div class='info-box'>
+        <h4>💡 Pro Tip:</h4>
+        <p>These resources are optional but highly recommended. If your teacher assigns them, treat them like mini-levels in a game: read the goal, try, observe the result, and iterate.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Official resources
+    st.markdown("## Official Learning Resources")
+    st.markdown("Structured courses and comprehensive documentation to deepen your understanding.")
+    
+    official_resources = CONTENT['official_resources']
+    
+    for name, description, link, resource_type in official_resources:
+        st.markdown(f"""
+        <div style='background: white; border-left: 4px solid #3498db; border-radius: 10px; padding: 1.5rem; margin: 1rem 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+            <div style='display: flex; justify-content: between; align-items: center; margin-bottom: 1rem;'>
+                <h3 style='color: #2c3e50; margin: 0;'>{name}</h3>
+                <span style='background: #3498db; color: white; padding: 0.3rem 0.6rem; border-radius: 20px; font-size: 0.8rem;'>{resource_type}</span>
+            </div>
+            <p style='color: #6c757d; margin-bottom: 1rem;'>{description}</p>
+            <a href='{link}' target='_blank' style='color: #3498db; font-weight: bold; text-decoration: none;'>Get Started →</a>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Learning path
+    st.markdown("## Your Learning Path")
+    st.markdown("Follow this structured approach to master GitHub step by step.")
+    
+    learning_path = CONTENT['learning_path']
+    
+    for i, (title, description, timeframe, action) in enumerate(learning_path, 1):
+        st.markdown(f"""
+        <div class='step-container'>
+            <div style='display: flex; justify-content: between; align-items: center; margin-bottom: 1rem;'>
+                <div style='display: flex; align-items: center; gap: 1rem;'>
+                    <div style='background: #3498db; color: white; width: 40px; height: 40px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-weight: bold; font-size: 1.2rem;'>{i}</div>
+                    <div>
+                        <h3 style='color: #2c3e50; margin: 0;'>{title}</h3>
+                        <p style='color: #3498db; margin: 0; font-size: 0.9rem; font-weight: bold;'>{timeframe}</p>
+                    </div>
+                </div>
+                <button style='background: #3498db; color: white; padding: 0.5rem 1rem; border: none; border-radius: 8px; font-weight: bold;'>{action}</button>
+            </div>
+            <p style='color: #6c757d; margin: 0; padding-left: 3rem;'>{description}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Key references
+    st.markdown("## Key References")
+    st.markdown("Important articles and guides that support this tutorial.")
+    
+    references = CONTENT['references']
+    
+    for title, description, link in references:
+        col1, col2 = st.columns([4, 1])
+        
+        with col1:
+            st.markdown(f"""
+            <div style='border: 1px solid #e0e0e0; border-radius: 10px; padding: 1.5rem; background: white; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+                <h4 style='color: #2c3e50; margin-bottom: 0.5rem;'>{title}</h4>
+                <p style='color: #6c757d; margin: 0;'>{description}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.link_button("Read", link)
+    
+    # Next steps
+    st.markdown("## What Comes Next")
+    
+    st.markdown("""
+    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 2rem; border-radius: 15px; margin: 2rem 0;'>
+        <h2 style='margin-bottom: 1rem;'>🚀 Ready for the Next Level?</h2>
+        <p style='font-size: 1.1rem; margin-bottom: 1.5rem; line-height: 1.6;'>
+            After you are comfortable with repos, commits, branches, pull requests, and `.gitignore`, 
+            you can level up by exploring GitHub Skills courses, building multi-branch projects, 
+            and creating a public portfolio of your work.
+        </p>
+        <div style='background: rgba(255,255,255,0.2); padding: 1rem; border-radius: 8px;'>
+            <p style='margin: 0; font-size: 1.1rem;'>
+                <strong>Key to steady progress:</strong> Small, frequent practice. Set a goal like 
+                "one repository, one branch, one PR per week," and keep your messages short and honest. 
+                Over time, your repository history will become a record of growth you can be proud of.
+            </p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Celebration for completing all content
+    if st.session_state.progress.completed_count >= 8:  # Most of the tutorial
+        st.balloons()
+        st.success("🎉 Congratulations! You've completed most of the tutorial. You're well on your way to mastering GitHub!")
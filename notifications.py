@@ -0,0 +1,42 @@
+"""
+Non-blocking notification queue shared by the tutorial apps
+Unlock and celebration events are queued in session state and drained as toasts
+"""
+
+import streamlit as st
+from typing import Dict, List
+
+# Icon and one-shot effect for each notification kind; Material icons, since
+# an emoji icon makes Streamlit load its whole emoji catalog to validate it
+NOTIFICATION_STYLES = {
+    'achievement': {'icon': ':material/military_tech:', 'effect': 'balloons'},
+    'success': {'icon': ':material/celebration:', 'effect': 'balloons'},
+    'guide_complete': {'icon': ':material/emoji_events:', 'effect': 'snow'},
+}
+
+def queue_notification(message: str, kind: str = 'success'):
+    """Queue a notification to be shown on the next drain"""
+    if 'notification_queue' not in st.session_state:
+        st.session_state.notification_queue = []
+    st.session_state.notification_queue.append({'message': message, 'kind': kind})
+
+def drain_notifications() -> List[Dict]:
+    """Show every queued notification as a toast and empty the queue"""
+    queue = st.session_state.get('notification_queue')
+    if not queue:
+        return []
+
+    st.session_state.notification_queue = []
+    effects = set()
+    for notification in queue:
+        style = NOTIFICATION_STYLES.get(notification['kind'], NOTIFICATION_STYLES['success'])
+        st.toast(notification['message'], icon=style['icon'])
+        effects.add(style['effect'])
+
+    # Play each animation once per drain, however many events were queued
+    if 'balloons' in effects:
+        st.balloons()
+    if 'snow' in effects:
+        st.snow()
+
+    return queue
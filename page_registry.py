@@ -0,0 +1,36 @@
+"""
+Manifest-driven page registry
+Page modules are imported on first visit and cached for the life of the process
+"""
+
+import importlib
+from typing import Callable, Dict, List
+
+class PageRegistry:
+    """Dispatch page ids to lazily imported page modules"""
+
+    def __init__(self, package: str, manifest: List[Dict]):
+        self.package = package
+        self.manifest = manifest
+        self.pages = {page['id']: page for page in manifest}
+        self._renderers: Dict[str, Callable[[], None]] = {}
+
+    def __contains__(self, page_id: str) -> bool:
+        return page_id in self.pages
+
+    def renderer(self, page_id: str) -> Callable[[], None]:
+        """Return the page's render function, importing its module on first use"""
+        renderer = self._renderers.get(page_id)
+        if renderer is None:
+            module = importlib.import_module(f"{self.package}.{self.pages[page_id]['module']}")
+            renderer = self._renderers[page_id] = module.render
+        return renderer
+
+    def render(self, page_id: str):
+        """Render a page by id"""
+        self.renderer(page_id)()
+
+    def label(self, page_id: str) -> str:
+        """Navigation label with the page icon"""
+        page = self.pages[page_id]
+        return f"{page['icon']} {page['title']}"
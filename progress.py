@@ -0,0 +1,221 @@
+"""
+Compact per-session progress model
+Page visits, page completion and achievement unlocks are bitsets over fixed
+id tables, timestamps are integer epoch seconds, time on each page is an
+integer millisecond count, and the counters the dashboards read are
+popcounts, so a session holds a few hundred bytes
+"""
+
+import time
+from array import array
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+from achievements import ACHIEVEMENT_DEFINITIONS
+from app_pages import MANIFEST
+
+ACHIEVEMENT_CATEGORIES = ('completion', 'mastery', 'exploration', 'speed')
+
+# Bit positions, fixed by manifest and definition order
+PAGE_IDS = tuple(page['id'] for page in MANIFEST)
+PAGE_BITS = {page_id: 1 << index for index, page_id in enumerate(PAGE_IDS)}
+PAGE_INDEX = {page_id: index for index, page_id in enumerate(PAGE_IDS)}
+ACHIEVEMENT_IDS = tuple(ACHIEVEMENT_DEFINITIONS)
+ACHIEVEMENT_BITS = {achievement_id: 1 << index for index, achievement_id in enumerate(ACHIEVEMENT_IDS)}
+
+CATEGORY_MASKS = {
+    category: sum(bit for achievement_id, bit in ACHIEVEMENT_BITS.items()
+                  if ACHIEVEMENT_DEFINITIONS[achievement_id]['category'] == category)
+    for category in ACHIEVEMENT_CATEGORIES
+}
+
+# Number of achievements in each category, computed once per process
+CATEGORY_TOTALS = {category: mask.bit_count() for category, mask in CATEGORY_MASKS.items()}
+
+def epoch_now() -> int:
+    """Current time as integer epoch seconds"""
+    return int(time.time())
+
+def format_date(timestamp: Optional[int]) -> str:
+    """Render an epoch timestamp as YYYY-MM-DD"""
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d') if timestamp else "N/A"
+
+class QuizScore:
+    """Result of one quiz section, with the time spent answering it in ms and the option chosen
+    for each question (-1 where it was skipped), which the classroom analytics read"""
+    __slots__ = ('correct', 'total', 'percentage', 'completed_at', 'response_ms', 'answers')
+
+    def __init__(self, correct: int, total: int, completed_at: Optional[int] = None, response_ms: int = 0,
+                 answers: Tuple[int, ...] = ()):
+        self.correct = correct
+        self.total = total
+        self.percentage = int((correct / total) * 100)
+        self.completed_at = completed_at or epoch_now()
+        self.response_ms = response_ms
+        self.answers = tuple(answers)
+
+class Progress:
+    """Learning progress and achievement unlocks for one session"""
+    __slots__ = ('total_pages', 'current_page', 'started_at', 'last_activity', 'visited', 'completed',
+                 'last_visited', 'quiz_scores', 'quiz_percentage_total', 'page_ms', 'unlocked',
+                 'last_unlocked_at', 'sections_completed', 'current_streak', 'total_questions_answered',
+                 'correct_answers')
+
+    def __init__(self, total_pages: int = len(PAGE_IDS)):
+        now = epoch_now()
+        self.total_pages = total_pages
+        self.current_page = PAGE_IDS[0]
+        self.started_at = now
+        self.last_activity = now
+        self.visited = 0
+        self.completed = 0
+        self.last_visited = array('I', [0]) * len(PAGE_IDS)
+        self.quiz_scores: Dict[str, QuizScore] = {}
+        self.quiz_percentage_total = 0
+        self.page_ms = array('I', [0]) * len(PAGE_IDS)
+        self.unlocked = 0
+        self.last_unlocked_at = None
+        self.sections_completed = 0
+        self.current_streak = 0
+        self.total_questions_answered = 0
+        self.correct_answers = 0
+
+    # Pages
+
+    @property
+    def visited_count(self) -> int:
+        return self.visited.bit_count()
+
+    @property
+    def completed_count(self) -> int:
+        return self.completed.bit_count()
+
+    @property
+    def overall_progress(self) -> int:
+        return int((self.completed_count / self.total_pages) * 100)
+
+    def is_visited(self, page_id: str) -> bool:
+        return bool(self.visited & PAGE_BITS.get(page_id, 0))
+
+    def is_completed(self, page_id: str) -> bool:
+        return bool(self.completed & PAGE_BITS.get(page_id, 0))
+
+    def visit(self, page_id: str) -> bool:
+        """Record a page visit and return True on the first visit"""
+        now = epoch_now()
+        self.current_page = page_id
+        self.last_activity = now
+        self.last_visited[PAGE_INDEX[page_id]] = now
+        first_visit = not self.is_visited(page_id)
+        self.visited |= PAGE_BITS[page_id]
+        return first_visit
+
+    def complete(self, page_id: str) -> bool:
+        """Mark a visited page complete and return True if it was not already"""
+        if not self.is_visited(page_id) or self.is_completed(page_id):
+            return False
+        self.completed |= PAGE_BITS[page_id]
+        return True
+
+    def add_dwell(self, page_id: str, milliseconds: int):
+        """Credit time on a page"""
+        index = PAGE_INDEX.get(page_id)
+        if index is not None:
+            self.page_ms[index] = min(self.page_ms[index] + milliseconds, 0xFFFFFFFF)
+
+    @property
+    def time_spent(self) -> int:
+        """Whole minutes on task across every page"""
+        return sum(self.page_ms) // 60000
+
+    def pages(self) -> Iterator[Tuple[str, bool]]:
+        """(page id, completed) for every visited page, in manifest order"""
+        for page_id in PAGE_IDS:
+            if self.is_visited(page_id):
+                yield page_id, self.is_completed(page_id)
+
+    # Quizzes
+
+    def record_score(self, section: str, score: QuizScore):
+        """Store a quiz score, keeping the percentage total in step"""
+        previous = self.quiz_scores.get(section)
+        if previous is not None:
+            self.quiz_percentage_total -= previous.percentage
+        self.quiz_scores[section] = score
+        self.quiz_percentage_total += score.percentage
+
+    def quiz_average(self) -> float:
+        """Average quiz percentage across scored sections"""
+        scored = len(self.quiz_scores)
+        return self.quiz_percentage_total / scored if scored else 0
+
+    def complete_section(self, section_index: int):
+        """Mark a quiz section complete by its position in the quiz bank"""
+        self.sections_completed |= 1 << section_index
+
+    # Achievements
+
+    @property
+    def unlocked_count(self) -> int:
+        return self.unlocked.bit_count()
+
+    def unlocked_in(self, category: str) -> int:
+        return (self.unlocked & CATEGORY_MASKS[category]).bit_count()
+
+    def is_unlocked(self, achievement_id: str) -> bool:
+        return bool(self.unlocked & ACHIEVEMENT_BITS[achievement_id])
+
+    def unlock(self, achievement_id: str) -> bool:
+        """Unlock an achievement and return True if it was locked"""
+        if self.is_unlocked(achievement_id):
+            return False
+        self.unlocked |= ACHIEVEMENT_BITS[achievement_id]
+        self.last_unlocked_at = epoch_now()
+        return True
+
+    def reset_unlocks(self):
+        """Lock every achievement again"""
+        self.unlocked = 0
+        self.last_unlocked_at = None
+
+    # Persistence
+
+    @classmethod
+    def _fields(cls) -> Tuple[str, ...]:
+        return tuple(slot for klass in reversed(cls.__mro__) for slot in getattr(klass, '__slots__', ()))
+
+    def to_record(self) -> Dict:
+        """Plain snapshot for storage; bitsets are saved as id lists so ids can be reordered"""
+        record = {field: getattr(self, field) for field in self._fields()}
+        record['visited'] = [page_id for page_id, bit in PAGE_BITS.items() if self.visited & bit]
+        record['completed'] = [page_id for page_id, bit in PAGE_BITS.items() if self.completed & bit]
+        record['unlocked'] = [achievement_id for achievement_id, bit in ACHIEVEMENT_BITS.items() if self.unlocked & bit]
+        record['last_visited'] = {page_id: self.last_visited[index]
+                                  for page_id, index in PAGE_INDEX.items() if self.last_visited[index]}
+        record['page_ms'] = {page_id: self.page_ms[index] for page_id, index in PAGE_INDEX.items() if self.page_ms[index]}
+        record['quiz_scores'] = {section: [score.correct, score.total, score.completed_at, score.response_ms,
+                                           list(score.answers)]
+                                 for section, score in self.quiz_scores.items()}
+        return record
+
+    @classmethod
+    def from_record(cls, record: Dict) -> 'Progress':
+        """Rebuild progress from a stored snapshot, ignoring ids that no longer exist"""
+        progress = cls()
+        for field in cls._fields():
+            if field in record:
+                setattr(progress, field, record[field])
+        progress.visited = sum(PAGE_BITS.get(page_id, 0) for page_id in record.get('visited', ()))
+        progress.completed = sum(PAGE_BITS.get(page_id, 0) for page_id in record.get('completed', ()))
+        progress.unlocked = sum(ACHIEVEMENT_BITS.get(achievement_id, 0) for achievement_id in record.get('unlocked', ()))
+        progress.last_visited = array('I', [0]) * len(PAGE_IDS)
+        for page_id, timestamp in record.get('last_visited', {}).items():
+            if page_id in PAGE_INDEX:
+                progress.last_visited[PAGE_INDEX[page_id]] = timestamp
+        progress.page_ms = array('I', [0]) * len(PAGE_IDS)
+        for page_id, milliseconds in record.get('page_ms', {}).items():
+            if page_id in PAGE_INDEX:
+                progress.page_ms[PAGE_INDEX[page_id]] = milliseconds
+        progress.quiz_scores = {section: QuizScore(*values) for section, values in record.get('quiz_scores', {}).items()}
+        progress.quiz_percentage_total = sum(score.percentage for score in progress.quiz_scores.values())
+        return progress
@@ -0,0 +1,232 @@
+"""
+Durable progress store backed by SQLite
+Saves are snapshotted into an in-memory buffer, coalesced per learner and
+written in batches by a background thread, so a click never waits on disk.
+The database runs in WAL mode so the flush never blocks readers. The latest
+snapshots also stay in a process-level LRU cache, so a session resuming from
+its URL token is rehydrated without touching SQLite.
+"""
+
+import atexit
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Type
+
+import streamlit as st
+
+DEFAULT_PATH = Path(__file__).parent / "progress.sqlite3"
+FLUSH_INTERVAL = 1.0
+CACHE_SIZE = 2048
+
+# Query parameter carrying the learner's resume token
+RESUME_PARAM = "resume"
+_TOKEN_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+# Marks a pending delete in the write buffer
+_DELETED = object()
+
+logger = logging.getLogger(__name__)
+
+class ProgressStore:
+    """Write-behind SQLite store for progress snapshots keyed by learner and app"""
+
+    def __init__(self, path: Path, flush_interval: float = FLUSH_INTERVAL, cache_size: int = CACHE_SIZE):
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.cache_size = cache_size
+        self.connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS progress ("
+            " learner_id TEXT NOT NULL, app TEXT NOT NULL, record TEXT NOT NULL,"
+            " updated_at INTEGER NOT NULL, PRIMARY KEY (learner_id, app)) WITHOUT ROWID"
+        )
+        self._db_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buffer_lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str], object] = {}
+        self._inflight: Dict[Tuple[str, str], object] = {}
+        self._cache: OrderedDict = OrderedDict()
+        self._wake = threading.Event()
+        self._closed = False
+        self.stats = {'saves': 0, 'rows_written': 0, 'batches': 0, 'failed_batches': 0, 'last_flush_ms': 0.0,
+                      'cache_hits': 0, 'cold_loads': 0}
+        self._thread = threading.Thread(target=self._run, name="progress-store-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def save(self, learner_id: str, app: str, progress):
+        """Buffer a snapshot of ``progress``; later saves for the same key replace it"""
+        record = progress.to_record()
+        with self._buffer_lock:
+            self._pending[(learner_id, app)] = record
+            self._remember((learner_id, app), record)
+            self.stats['saves'] += 1
+
+    def delete(self, learner_id: str):
+        """Buffer the removal of every app's progress for a learner"""
+        with self._buffer_lock:
+            for key in [key for key in self._pending if key[0] == learner_id]:
+                del self._pending[key]
+            for key in [key for key in self._cache if key[0] == learner_id]:
+                del self._cache[key]
+            self._pending[(learner_id, None)] = _DELETED
+
+    def load(self, learner_id: str, app: str) -> Optional[Dict]:
+        """Latest snapshot for a learner, from the cache when it is warm"""
+        key = (learner_id, app)
+        with self._buffer_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.stats['cache_hits'] += 1
+                return self._cache[key]
+            for buffer in (self._pending, self._inflight):
+                if (learner_id, None) in buffer:
+                    return None
+            self.stats['cold_loads'] += 1
+        with self._db_lock:
+            row = self.connection.execute(
+                "SELECT record FROM progress WHERE learner_id = ? AND app = ?", key
+            ).fetchone()
+        if row is None:
+            return None
+        record = json.loads(row[0])
+        with self._buffer_lock:
+            # A save that raced this read is newer than the stored row
+            record = self._cache.get(key, record)
+            self._remember(key, record)
+        return record
+
+    def records(self, app: str) -> Iterator[Dict]:
+        """Every learner's latest snapshot for an app, buffered saves included"""
+        self.flush()
+        with self._db_lock:
+            rows = self.connection.execute("SELECT record FROM progress WHERE app = ?", (app,)).fetchall()
+        for (record,) in rows:
+            yield json.loads(record)
+
+    def _remember(self, key: Tuple[str, str], record: Dict):
+        self._cache[key] = record
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self):
+        """Write every buffered snapshot in one transaction; on failure they stay buffered and the error is raised"""
+        with self._flush_lock:
+            self._flush()
+
+    def _flush(self):
+        with self._buffer_lock:
+            batch, self._pending = self._pending, {}
+            self._inflight = batch
+        if not batch:
+            return
+
+        began = time.perf_counter()
+        try:
+            self._write(batch)
+        except Exception:
+            with self._buffer_lock:
+                # Saves buffered since the batch was taken are newer, and a learner deleted since loses the batch
+                deleted = {key[0] for key, record in self._pending.items() if record is _DELETED}
+                self._pending = {**{key: record for key, record in batch.items() if key[0] not in deleted},
+                                 **self._pending}
+                self._inflight = {}
+            self.stats['failed_batches'] += 1
+            raise
+        with self._buffer_lock:
+            self._inflight = {}
+        self.stats['rows_written'] += len(batch)
+        self.stats['batches'] += 1
+        self.stats['last_flush_ms'] = (time.perf_counter() - began) * 1000
+
+    def _write(self, batch: Dict[Tuple[str, str], object]):
+        """Apply one batch in a transaction, rolled back if any statement fails"""
+        now = int(time.time())
+        deletes = [(learner_id,) for (learner_id, app), record in batch.items() if record is _DELETED]
+        upserts = [
+            (learner_id, app, json.dumps(record, separators=(',', ':')), now)
+            for (learner_id, app), record in batch.items() if record is not _DELETED
+        ]
+        with self._db_lock:
+            self.connection.execute("BEGIN")
+            try:
+                self.connection.executemany("DELETE FROM progress WHERE learner_id = ?", deletes)
+                self.connection.executemany(
+                    "INSERT INTO progress (learner_id, app, record, updated_at) VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT (learner_id, app) DO UPDATE SET record = excluded.record,"
+                    " updated_at = excluded.updated_at",
+                    upserts,
+                )
+                self.connection.execute("COMMIT")
+            except BaseException:
+                if self.connection.in_transaction:
+                    self.connection.execute("ROLLBACK")
+                raise
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Writing progress failed; the snapshots stay buffered for the next flush")
+
+    def close(self):
+        """Flush outstanding writes and stop the background thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join(timeout=5)
+        try:
+            self.flush()
+        finally:
+            self.connection.close()
+
+@st.cache_resource(show_spinner=False)
+def get_progress_store() -> ProgressStore:
+    """The process-wide store, at $LEARNGIT_PROGRESS_DB or next to the app"""
+    return ProgressStore(Path(os.environ.get("LEARNGIT_PROGRESS_DB", DEFAULT_PATH)))
+
+def new_learner_id() -> str:
+    return uuid.uuid4().hex
+
+def resume_learner_id() -> str:
+    """Learner id from the URL resume token, issuing a new token when there is none"""
+    token = st.query_params.get(RESUME_PARAM, "")
+    if _TOKEN_PATTERN.fullmatch(token):
+        return token
+    learner_id = new_learner_id()
+    st.query_params[RESUME_PARAM] = learner_id
+    return learner_id
+
+def keep_resume_token(learner_id: str):
+    """Put the learner's token back in the URL when navigation dropped it"""
+    # st.navigation keeps only widget-bound query parameters across a page switch
+    if st.query_params.get(RESUME_PARAM) != learner_id:
+        st.query_params[RESUME_PARAM] = learner_id
+
+def forget_resume_token():
+    """Drop the resume token so the next session starts as a new learner"""
+    st.query_params.pop(RESUME_PARAM, None)
+
+def load_progress(learner_id: str, app: str, progress_class: Type):
+    """Session progress from the store, or a fresh record for a new learner"""
+    record = get_progress_store().load(learner_id, app)
+    return progress_class.from_record(record) if record else progress_class()
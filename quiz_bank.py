@@ -0,0 +1,50 @@
+"""
+Canonical quiz question bank shared by all three apps
+Loaded once per process into an immutable, indexed structure
+"""
+
+import streamlit as st
+from types import MappingProxyType
+from typing import Mapping
+
+from content_bundle import module_content
+
+# Canonical quiz data - the React implementation's sections, then the basics sections of the
+# original tutorial practice page; source in content_data/quiz_bank.json
+QUIZ_DATA = module_content(__name__)
+
+class QuizBank:
+    """Read-only quiz bank indexed by section and question id"""
+
+    def __init__(self, data: Mapping):
+        sections = {}
+        questions_by_id = {}
+        for section_key, section in data.items():
+            questions = tuple(
+                MappingProxyType({**question, 'options': tuple(question['options'])})
+                for question in section['questions']
+            )
+            for question in questions:
+                questions_by_id[question['id']] = question
+            sections[section_key] = MappingProxyType({
+                'id': section['id'],
+                'title': section['title'],
+                'description': section['description'],
+                'questions': questions,
+                'question_count': len(questions)
+            })
+
+        self.sections = MappingProxyType(sections)
+        self.questions_by_id = MappingProxyType(questions_by_id)
+        self.section_keys = tuple(sections)
+        self.section_count = len(sections)
+        self.total_questions = len(questions_by_id)
+
+    def question(self, section_key: str, question_idx: int) -> Mapping:
+        """Look up a question by section and position"""
+        return self.sections[section_key]['questions'][question_idx]
+
+@st.cache_resource
+def load_quiz_bank() -> QuizBank:
+    """Build the quiz bank once per process and share it across sessions"""
+    return QuizBank(QUIZ_DATA)
@@ -0,0 +1,133 @@
+"""
+Ranked in-memory search over short reference documents
+An inverted index with IDF-weighted fields, prefix matching through a sorted
+vocabulary and one-edit typo matching through a symmetric-delete table,
+all built once so a query is a handful of dict lookups
+"""
+
+import math
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Sequence, Set, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Score multipliers by how a query token matched an indexed token; a token that
+# only matches as a typo is taken as a misspelling and scores as a CORRECTION
+EXACT, PREFIX, TYPO, CORRECTION = 1.0, 0.6, 0.4, 0.8
+
+# Bonus when the query matches a document's title as a whole
+TITLE_EXACT, TITLE_PREFIX = 8.0, 4.0
+
+MIN_PREFIX_LENGTH = 2
+MIN_TYPO_LENGTH = 4
+CACHE_SIZE = 1024
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens of ``text``"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+def _deletes(token: str) -> Set[str]:
+    return {token[:index] + token[index + 1:] for index in range(len(token))}
+
+class SearchIndex:
+    """Immutable index over documents of parallel text fields; field 0 is the title"""
+
+    def __init__(self, documents: Sequence[Sequence[str]], weights: Sequence[float]):
+        self.documents = tuple(tuple(document) for document in documents)
+        field_weights: Dict[str, Dict[int, float]] = defaultdict(dict)
+        for doc_id, fields in enumerate(self.documents):
+            for text, weight in zip(fields, weights):
+                for token in tokenize(text):
+                    field_weights[token][doc_id] = max(field_weights[token].get(doc_id, 0.0), weight)
+
+        # Tokens on every entry ("git") count for less than rare ones ("rebase")
+        count = len(self.documents)
+        self._postings: Dict[str, Dict[int, float]] = {
+            token: {doc_id: weight * math.log(1 + count / len(docs)) for doc_id, weight in docs.items()}
+            for token, docs in field_weights.items()
+        }
+        self._vocabulary = sorted(self._postings)
+
+        # Every token and its one-character deletes, so a typo is a key lookup
+        typos: Dict[str, Set[str]] = defaultdict(set)
+        for token in self._vocabulary:
+            if len(token) >= MIN_TYPO_LENGTH - 1:
+                typos[token].add(token)
+                for variant in _deletes(token):
+                    typos[variant].add(token)
+        self._typos = dict(typos)
+
+        self._titles = tuple(" ".join(tokenize(fields[0])) for fields in self.documents)
+        self._cache: Dict[str, Tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def expand(self, token: str) -> Dict[str, float]:
+        """Indexed tokens a query token can stand for, with their match multiplier"""
+        matches: Dict[str, float] = {}
+        if len(token) >= MIN_PREFIX_LENGTH:
+            start = bisect_left(self._vocabulary, token)
+            for candidate in self._vocabulary[start:]:
+                if not candidate.startswith(token):
+                    break
+                matches[candidate] = PREFIX
+        if token in self._postings:
+            matches[token] = EXACT
+        if len(token) >= MIN_TYPO_LENGTH:
+            multiplier = TYPO if matches else CORRECTION
+            for variant in _deletes(token) | {token}:
+                for candidate in self._typos.get(variant, ()):
+                    matches.setdefault(candidate, multiplier)
+        return matches
+
+    def search(self, query: str, limit: int = 20) -> Tuple[int, ...]:
+        """Ids of documents matching every query token, best first"""
+        tokens = tokenize(query)
+        if not tokens:
+            return ()
+        key = " ".join(tokens)
+        # One lookup: another session's search may clear the shared cache between two
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached[:limit]
+
+        # Rarest token first, so common ones like "git" only score the surviving candidates
+        expansions = sorted((self.expand(token) for token in tokens),
+                            key=lambda matches: sum(len(self._postings[candidate]) for candidate in matches))
+        scores: Dict[int, float] = {}
+        for position, matches in enumerate(expansions):
+            if position == 0:
+                for candidate, multiplier in matches.items():
+                    for doc_id, weight in self._postings[candidate].items():
+                        if weight * multiplier > scores.get(doc_id, 0.0):
+                            scores[doc_id] = weight * multiplier
+            else:
+                postings = [(self._postings[candidate], multiplier) for candidate, multiplier in matches.items()]
+                narrowed = {}
+                for doc_id, score in scores.items():
+                    best = max((docs[doc_id] * multiplier for docs, multiplier in postings if doc_id in docs), default=0.0)
+                    if best:
+                        narrowed[doc_id] = score + best
+                scores = narrowed
+            if not scores:
+                break
+
+        for doc_id in scores:
+            title = self._titles[doc_id]
+            if title == key:
+                scores[doc_id] += TITLE_EXACT
+            elif title.startswith(key + " "):
+                scores[doc_id] += TITLE_PREFIX
+        ranked = tuple(sorted(scores, key=lambda doc_id: (-scores[doc_id], doc_id)))
+
+        if len(self._cache) >= CACHE_SIZE:
+            self._cache.clear()
+        self._cache[key] = ranked
+        return ranked[:limit]
+
+    def results(self, query: str, limit: int = 20) -> List[Tuple[str, ...]]:
+        """Documents matching ``query``, best first"""
+        return [self.documents[doc_id] for doc_id in self.search(query, limit)]
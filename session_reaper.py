@@ -0,0 +1,160 @@
+"""
+Idle-session reaper and per-session memory budget
+Every script run checks its session in here. A background thread flushes the
+progress of sessions idle longer than the TTL to the store and drops their
+rebuildable state from memory; the next run rehydrates it from the resume
+token. A session whose state outgrows the budget is compacted when it checks in.
+"""
+
+import hmac
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import streamlit as st
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from progress_store import get_progress_store
+from state_size import session_size
+
+SESSION_TTL = float(os.environ.get("LEARNGIT_SESSION_TTL", 15 * 60))
+SESSION_BUDGET = int(os.environ.get("LEARNGIT_SESSION_BUDGET", 32 * 1024))
+REAP_INTERVAL = float(os.environ.get("LEARNGIT_REAP_INTERVAL", 30))
+
+logger = logging.getLogger(__name__)
+
+class TrackedSession:
+    """What the reaper knows about one browser session"""
+    __slots__ = ('state', 'app', 'keys', 'last_seen', 'bytes', 'evicted')
+
+    def __init__(self, state, app: str, keys: Tuple[str, ...]):
+        self.state = state
+        self.app = app
+        self.keys = keys
+        self.last_seen = time.monotonic()
+        self.bytes = 0
+        self.evicted = False
+
+class SessionReaper:
+    """Process-wide registry of live sessions with an idle-eviction thread"""
+
+    def __init__(self, ttl: float = SESSION_TTL, budget: int = SESSION_BUDGET, interval: float = REAP_INTERVAL):
+        self.ttl = ttl
+        self.budget = budget
+        self.interval = interval
+        self._sessions: Dict[str, TrackedSession] = {}
+        self._lock = threading.Lock()
+        self.stats = {'evicted': 0, 'compactions': 0}
+        self._thread = threading.Thread(target=self._run, name="session-reaper", daemon=True)
+        self._thread.start()
+
+    def check_in(self, app: str, keys: Tuple[str, ...], compact: Optional[Callable] = None) -> int:
+        """Mark the current session active and compact its state if it is over budget"""
+        # Called before session state is initialized, so a running script never loses its state
+        ctx = get_script_run_ctx()
+        if ctx is None:
+            return 0
+        # The SafeSessionState wrapper is rebuilt every run; the SessionState
+        # under it lives exactly as long as the browser session
+        state = ctx.session_state._state
+        with self._lock:
+            session = self._sessions.get(ctx.session_id)
+            if session is None or session.state is not state:
+                session = self._sessions[ctx.session_id] = TrackedSession(state, app, keys)
+            session.last_seen = time.monotonic()
+            session.evicted = False
+
+        size = sum(session_size(st.session_state, keys).values())
+        if size > self.budget and compact is not None:
+            compact(st.session_state)
+            compacted = sum(session_size(st.session_state, keys).values())
+            self.stats['compactions'] += 1
+            logger.info("Compacted session %s from %d to %d bytes", ctx.session_id, size, compacted)
+            size = compacted
+        if size > self.budget:
+            logger.warning("Session %s holds %d bytes, over the %d byte budget", ctx.session_id, size, self.budget)
+        session.bytes = size
+        return size
+
+    def reap(self, now: Optional[float] = None) -> int:
+        """Evict the state of sessions idle past the TTL; returns how many were evicted"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            # Disconnected sessions are Streamlit's to clean up; stop holding their state
+            if Runtime.exists():
+                runtime = Runtime.instance()
+                for session_id in [session_id for session_id in self._sessions if not runtime.is_active_session(session_id)]:
+                    del self._sessions[session_id]
+            idle = [session for session in self._sessions.values()
+                    if not session.evicted and now - session.last_seen > self.ttl]
+        if not idle:
+            return 0
+
+        # Progress is saved on every change; make sure it is on disk before dropping it
+        get_progress_store().flush()
+        evicted = 0
+        with self._lock:
+            for session in idle:
+                # A run that checked in since the scan above keeps its state
+                if now - session.last_seen <= self.ttl:
+                    continue
+                for key in session.keys:
+                    if key in session.state:
+                        del session.state[key]
+                session.bytes = 0
+                session.evicted = True
+                evicted += 1
+        self.stats['evicted'] += evicted
+        return evicted
+
+    def snapshot(self) -> Dict:
+        """Session count and state bytes for the admin view"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+        return {
+            'sessions': len(sessions),
+            'resident': sum(not session.evicted for session in sessions),
+            'total_bytes': sum(session.bytes for session in sessions),
+            'largest_bytes': max((session.bytes for session in sessions), default=0),
+            'budget': self.budget,
+            'ttl': self.ttl,
+            **self.stats,
+        }
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.reap()
+            except Exception:
+                logger.exception("Session reaper pass failed")
+
+@st.cache_resource(show_spinner=False)
+def get_session_reaper() -> SessionReaper:
+    """The process-wide reaper, configured from $LEARNGIT_SESSION_TTL, $LEARNGIT_SESSION_BUDGET and $LEARNGIT_REAP_INTERVAL"""
+    return SessionReaper()
+
+def is_admin() -> bool:
+    """True once ?admin= has matched $LEARNGIT_ADMIN_KEY in this session"""
+    # Remembered, since switching sections drops the query parameter from the URL
+    if st.session_state.get('admin_verified', False):
+        return True
+    key = os.environ.get("LEARNGIT_ADMIN_KEY", "")
+    if key and hmac.compare_digest(st.query_params.get("admin", "").encode(), key.encode()):
+        st.session_state.admin_verified = True
+        return True
+    return False
+
+def render_admin_view():
+    """Server-wide session count and memory, for the operator"""
+    stats = get_session_reaper().snapshot()
+    with st.expander("🛠️ Server Sessions (admin)", expanded=True):
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Sessions", stats['sessions'], f"{stats['resident']} resident", delta_color="off")
+        col2.metric("Total State", f"{stats['total_bytes'] / 1024:.1f} KB",
+                    f"largest {stats['largest_bytes'] / 1024:.1f} KB", delta_color="off")
+        col3.metric("Evicted Idle", stats['evicted'], f"{stats['compactions']} compactions", delta_color="off")
+        st.caption(f"Idle TTL {stats['ttl'] / 60:.0f} min · budget {stats['budget'] / 1024:.0f} KB per session")
@@ -0,0 +1,215 @@
+"""
+Tutorial-wide full-text search
+Page text is read from each page module's source (markdown, HTML, the data
+literals it renders and the content-bundle tables it reads), split into
+sections at headings and indexed with the quiz bank. Extraction is cached per module file and modification time, so an
+edited page is re-read on its own and the index is rebuilt around it.
+"""
+
+import ast
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Sequence, Tuple
+
+import streamlit as st
+
+from content_bundle import iter_text, module_content
+from quiz_bank import load_quiz_bank
+from search_index import SearchIndex, tokenize
+
+# Heading, section text, page title
+SECTION_WEIGHTS = (3.0, 1.0, 1.5)
+
+MARKDOWN_HEADING = re.compile(r"^\s*#{1,4}\s+(.+?)\s*#*\s*$")
+HTML_HEADING = re.compile(r"<h[1-4][^>]*>(.*?)</h[1-4]>", re.S | re.I)
+HTML_TAG = re.compile(r"<[^>]+>")
+MARKDOWN_EMPHASIS = re.compile(r"[*_`]+")
+
+# Calls whose first argument is a heading, and keyword arguments that are never page text
+HEADING_CALLS = {'title', 'header', 'subheader', 'display_header', 'banner'}
+IGNORED_KEYWORDS = {'key', 'language', 'type', 'width', 'height', 'icon', 'page_icon'}
+
+SNIPPET_LENGTH = 90
+
+class _TextCollector(ast.NodeVisitor):
+    """Walks a module in source order, collecting ('heading' | 'text', value) pieces"""
+
+    def __init__(self, content: Mapping = MappingProxyType({})):
+        self.pieces: List[Tuple[str, str]] = []
+        self.content = content
+
+    def _visit_body(self, node):
+        body = node.body
+        if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+            body = body[1:]  # docstring
+        for child in body:
+            self.visit(child)
+
+    def visit_Module(self, node):
+        self._visit_body(node)
+
+    def visit_FunctionDef(self, node):
+        self._visit_body(node)
+
+    def visit_Import(self, node):
+        pass
+
+    visit_ImportFrom = visit_Import
+
+    def visit_Call(self, node):
+        name = getattr(node.func, 'attr', getattr(node.func, 'id', ''))
+        args = node.args
+        if name in HEADING_CALLS and args and isinstance(args[0], (ast.Constant, ast.JoinedStr)):
+            self._heading(self._literal(args[0]))
+            args = args[1:]
+        for arg in args:
+            self.visit(arg)
+        for keyword in node.keywords:
+            if keyword.arg not in IGNORED_KEYWORDS:
+                self.visit(keyword.value)
+
+    def visit_Subscript(self, node):
+        # CONTENT['table'] reads a content-bundle table; its text belongs here
+        if isinstance(node.value, ast.Name) and node.value.id == 'CONTENT' \
+                and isinstance(node.slice, ast.Constant) and node.slice.value in self.content:
+            for value in iter_text(self.content[node.slice.value]):
+                self._text(value)
+        else:
+            self.generic_visit(node)
+
+    def visit_Constant(self, node):
+        if isinstance(node.value, str):
+            self._text(node.value)
+
+    def visit_JoinedStr(self, node):
+        self._text(self._literal(node))
+
+    @staticmethod
+    def _literal(node) -> str:
+        if isinstance(node, ast.JoinedStr):
+            return " ".join(value.value for value in node.values if isinstance(value, ast.Constant))
+        return node.value if isinstance(node.value, str) else ""
+
+    def _heading(self, value: str):
+        heading = " ".join(MARKDOWN_EMPHASIS.sub("", HTML_TAG.sub(" ", value)).split())
+        if tokenize(heading):
+            self.pieces.append(('heading', heading))
+
+    def _text(self, value: str):
+        # Identifiers, CSS classes and widget keys have no spaces; page text does
+        if not value.strip() or " " not in value.strip():
+            return
+        value = HTML_HEADING.sub(lambda match: f"\n## {match.group(1)}\n", value)
+        for line in HTML_TAG.sub(" ", value).splitlines():
+            heading = MARKDOWN_HEADING.match(line)
+            if heading:
+                self._heading(heading.group(1))
+            elif line.strip():
+                self.pieces.append(('text', line.strip()))
+
+def extract_sections(path: Path, page_title: str, content: Mapping = MappingProxyType({})) -> Tuple[Tuple[str, str], ...]:
+    """(heading, text) for each section of a page module and the bundle content it reads, in source order"""
+    collector = _TextCollector(content)
+    collector.visit(ast.parse(path.read_text(encoding="utf-8")))
+    sections = [[page_title, []]]
+    for kind, value in collector.pieces:
+        if kind == 'heading':
+            sections.append([value, []])
+        else:
+            sections[-1][1].append(value)
+    return tuple((heading, " ".join(lines)) for heading, lines in sections if lines or heading != page_title)
+
+class SiteIndex:
+    """Search index over every section of a page package plus the quiz bank"""
+
+    def __init__(self, sections: Sequence[Tuple[str, str, str, str]]):
+        # (page id, page title, heading, text)
+        self.sections = tuple(sections)
+        self.index = SearchIndex([(heading, text, title) for _, title, heading, text in self.sections],
+                                 SECTION_WEIGHTS)
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def search(self, query: str, limit: int = 6) -> List[Tuple[int, str, str, str, str]]:
+        """(section id, page id, page title, heading, snippet) for the best matches"""
+        results = []
+        for section_id in self.index.search(query, limit):
+            page_id, title, heading, text = self.sections[section_id]
+            snippet = text if len(text) <= SNIPPET_LENGTH else text[:SNIPPET_LENGTH].rsplit(" ", 1)[0] + "…"
+            results.append((section_id, page_id, title, heading, snippet))
+        return results
+
+# Process-wide, like the page registry: package -> (module mtimes, index), module path -> (mtime, sections)
+_indexes: Dict[str, Tuple[Tuple[int, ...], SiteIndex]] = {}
+_page_sections: Dict[str, Tuple[int, Tuple[Tuple[str, str], ...]]] = {}
+_build_lock = threading.Lock()
+
+def _module_paths(registry) -> Tuple[str, ...]:
+    package = os.path.join(os.path.dirname(os.path.abspath(__file__)), *registry.package.split("."))
+    return tuple(os.path.join(package, f"{page['module']}.py") for page in registry.manifest)
+
+def _build_site_index(registry, quiz_page: str, paths: Tuple[str, ...], mtimes: Tuple[int, ...]) -> SiteIndex:
+    sections = []
+    for page, path, mtime_ns in zip(registry.manifest, paths, mtimes):
+        cached = _page_sections.get(path)
+        if cached is None or cached[0] != mtime_ns:
+            content = module_content(f"{registry.package}.{page['module']}")
+            cached = _page_sections[path] = (mtime_ns, extract_sections(Path(path), page['title'], content))
+        sections.extend((page['id'], page['title'], heading, text) for heading, text in cached[1])
+
+    quiz_title = registry.pages[quiz_page]['title']
+    for section in load_quiz_bank().sections.values():
+        for question in section['questions']:
+            text = " ".join([question['question'], *question['options'], question['explanation']])
+            sections.append((quiz_page, quiz_title, f"{section['title']} quiz", text))
+    return SiteIndex(sections)
+
+def load_site_index(registry, quiz_page: str) -> SiteIndex:
+    """The shared index for ``registry``'s pages; only modules changed since the last build are re-read"""
+    paths = _module_paths(registry)
+    mtimes = tuple(os.stat(path).st_mtime_ns for path in paths)
+    current = _indexes.get(registry.package)
+    if current is not None and current[0] == mtimes:
+        return current[1]
+    with _build_lock:
+        current = _indexes.get(registry.package)
+        if current is None or current[0] != mtimes:
+            current = _indexes[registry.package] = (mtimes, _build_site_index(registry, quiz_page, paths, mtimes))
+    return current[1]
+
+def render_search_box(registry, quiz_page: str, navigate: Callable[[str], None]):
+    """Sidebar search; picking a result navigates to its page and scrolls to the section"""
+    def jump(page_id: str, heading: str):
+        st.session_state.search_target = heading
+        navigate(page_id)
+
+    query = st.sidebar.text_input("🔍 Search the tutorial", placeholder="e.g. merge conflict", key="site_search")
+    if not query:
+        return
+    # Built on the first query rather than the first run, which keeps it off a cold start
+    results = load_site_index(registry, quiz_page).search(query)
+    if not results:
+        st.sidebar.caption(f"No matches for '{query}'")
+    for section_id, page_id, title, heading, snippet in results:
+        label = title if heading == title else f"{title} › {heading}"
+        st.sidebar.button(label, key=f"search-{section_id}", help=snippet, use_container_width=True,
+                          on_click=jump, args=(page_id, heading))
+
+def scroll_to_search_target():
+    """After a search jump, scroll the rendered page to the chosen section"""
+    heading = st.session_state.pop('search_target', None)
+    if heading is None:
+        return
+    target = json.dumps(heading).replace("</", "<\\/")
+    st.html(f"""<script>
+    setTimeout(() => {{
+        const heading = [...document.querySelectorAll("h1, h2, h3, h4")]
+            .find(element => element.textContent.includes({target}));
+        if (heading) heading.scrollIntoView({{behavior: "smooth", block: "start"}});
+    }}, 150);
+    </script>""", unsafe_allow_javascript=True)
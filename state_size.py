@@ -0,0 +1,37 @@
+"""
+Per-session memory accounting
+Walks session state objects and sums the size of everything they reference
+"""
+
+import sys
+from array import array
+from typing import Dict, Iterable, Optional, Set
+
+def deep_sizeof(obj, seen: Optional[Set[int]] = None) -> int:
+    """Bytes held by ``obj`` and every container, slot and value it references"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool, type(None), array)):
+        return size
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, '__slots__', ()):
+            if hasattr(obj, slot):
+                size += deep_sizeof(getattr(obj, slot), seen)
+    if hasattr(obj, '__dict__') and not isinstance(obj, type):
+        size += deep_sizeof(vars(obj), seen)
+    return size
+
+def session_size(state, keys: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """Deep size of each session state entry, largest first"""
+    keys = list(state.keys()) if keys is None else [key for key in keys if key in state]
+    sizes = {key: deep_sizeof(state[key]) for key in keys}
+    return dict(sorted(sizes.items(), key=lambda item: item[1], reverse=True))
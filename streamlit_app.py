@@ -0,0 +1,48 @@
+"""
+GitHub Tutorial - single multipage entry point
+The tutorial, the lessons and the interactive features are sections of one
+st.navigation app. A section's script runs only while its page is open, and
+all of them share one session progress record and the process-wide content
+bundle, so one server process hosts the whole tutorial. Operators also get the
+teacher dashboard.
+
+    streamlit run streamlit_app.py
+"""
+
+import streamlit as st
+
+from app_state import REBUILDABLE_KEYS, compact_session_state, initialize_session_state
+from session_reaper import get_session_reaper, is_admin
+
+# Section scripts in navigation order; the first one is the default page
+SECTIONS = [
+    {'script': 'app.py', 'title': 'Tutorial', 'icon': ':material/account_tree:', 'url_path': 'tutorial'},
+    {'script': 'content.py', 'title': 'Lessons', 'icon': ':material/school:', 'url_path': 'lessons'},
+    {'script': 'features.py', 'title': 'Interactive Features', 'icon': ':material/extension:',
+     'url_path': 'interactive'},
+]
+
+# Listed only for operators, so learners never load the analytics
+TEACHER_SECTION = {'script': 'teacher.py', 'title': 'Teacher Dashboard', 'icon': ':material/monitoring:',
+                   'url_path': 'teacher'}
+
+def main():
+    st.set_page_config(
+        page_title="GitHub Tutorial for 9th Graders",
+        page_icon=":material/account_tree:",  # ASCII, so Streamlit skips its emoji catalog
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+
+    # Keep this session off the idle list before its state is touched
+    get_session_reaper().check_in('tutorial', REBUILDABLE_KEYS, compact_session_state)
+    initialize_session_state()
+
+    sections = SECTIONS + [TEACHER_SECTION] if is_admin() else SECTIONS
+    pages = [st.Page(section['script'], title=section['title'], icon=section['icon'],
+                     url_path=section['url_path'], default=index == 0)
+             for index, section in enumerate(sections)]
+    st.navigation(pages, position="top").run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Stylesheet pipeline shared by the tutorial apps
+Each stylesheet is read and minified once per process, written to the static
+folder under a content fingerprint and linked with a short @import tag, so the
+browser fetches and caches the CSS instead of receiving it on every rerun
+"""
+
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Dict
+
+import streamlit as st
+
+ROOT_DIR = Path(__file__).parent
+STATIC_DIR = ROOT_DIR / "static"
+STATIC_URL = "app/static"
+
+_COMMENTS = re.compile(r"/\*.*?\*/", re.S)
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = _COMMENTS.sub("", css)
+    css = _WHITESPACE.sub(" ", css)
+    css = _PUNCTUATION.sub(r"\1", css)
+    css = css.replace(": ", ":").replace(";}", "}")
+    return css.strip()
+
+def _publish(stem: str, fingerprint: str, css: str) -> str:
+    """Write the fingerprinted file to the static folder and drop stale versions"""
+    filename = f"{stem}.{fingerprint}.css"
+    target = STATIC_DIR / filename
+    if not target.exists():
+        STATIC_DIR.mkdir(exist_ok=True)
+        temporary = target.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(css, encoding="utf-8")
+        os.replace(temporary, target)
+    for stale in STATIC_DIR.glob(f"{stem}.*.css"):
+        if stale.name != filename:
+            stale.unlink(missing_ok=True)
+    return filename
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def compile_stylesheet(name: str, mtime_ns: int) -> Dict:
+    """Minify and publish a stylesheet; keyed by mtime so edits invalidate it"""
+    css = minify_css((ROOT_DIR / name).read_text(encoding="utf-8"))
+    fingerprint = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+    try:
+        url = f"{STATIC_URL}/{_publish(Path(name).stem, fingerprint, css)}"
+    except OSError:
+        # Read-only checkout: fall back to inlining the minified CSS
+        url = None
+    return {'css': css, 'fingerprint': fingerprint, 'url': url, 'bytes': len(css)}
+
+def stylesheet_tag(*names: str) -> str:
+    """HTML that loads stylesheets, as @imports of the cached files when possible"""
+    rules = []
+    for name in names:
+        stylesheet = compile_stylesheet(name, (ROOT_DIR / name).stat().st_mtime_ns)
+        if stylesheet['url'] is None:
+            rules.append(stylesheet['css'])
+        else:
+            rules.append(f'@import url("{stylesheet["url"]}");')
+    # @import rules must precede any inlined rules
+    rules.sort(key=lambda rule: not rule.startswith('@import'))
+    return f"<style>{''.join(rules)}</style>"
+
+def load_stylesheet(*names: str):
+    """Attach stylesheets to the current page in a single element"""
+    st.markdown(stylesheet_tag(*names), unsafe_allow_html=True)
@@ -0,0 +1,94 @@
+"""
+Teacher dashboard - item analytics for every quiz question
+Difficulty, discrimination and option popularity across every learner's saved
+answers, so weak questions and distractors nobody picks stand out.
+Runs as the Teacher Dashboard section of streamlit_app.py, which lists it only
+for operators (?admin= matching $LEARNGIT_ADMIN_KEY)
+"""
+
+import numpy as np
+import streamlit as st
+
+from classroom_analytics import REFRESH_INTERVAL, ItemStatistics, QuestionColumns, load_item_statistics, question_columns
+from components import banner, load_components
+from quiz_bank import load_quiz_bank
+from session_reaper import is_admin
+
+# Rules of thumb from classical test theory
+TOO_HARD = 0.30
+TOO_EASY = 0.90
+LOW_DISCRIMINATION = 0.20
+UNPOPULAR_DISTRACTOR = 0.05
+
+OPTION_LETTERS = "ABCDEFGH"
+
+def question_flags(difficulty: float, discrimination: float, shares: np.ndarray, correct: int) -> str:
+    """Short notes on what looks wrong with a question, empty when nothing does"""
+    flags = []
+    if difficulty < TOO_HARD:
+        flags.append("too hard")
+    elif difficulty > TOO_EASY:
+        flags.append("too easy")
+    if discrimination < LOW_DISCRIMINATION:
+        flags.append("low discrimination")
+    unpopular = [OPTION_LETTERS[option] for option, share in enumerate(shares)
+                 if option != correct and share < UNPOPULAR_DISTRACTOR]
+    if unpopular:
+        flags.append(f"unpopular {', '.join(unpopular)}")
+    return "; ".join(flags)
+
+def render_section(section_key: str, stats: ItemStatistics, columns: QuestionColumns):
+    """One table row per question of a quiz section"""
+    section = load_quiz_bank().sections[section_key]
+    span = columns.sections[section_key]
+    option_count = stats.option_shares.shape[1]
+    table = {
+        "Q": [f"Q{number}" for number in range(1, section['question_count'] + 1)],
+        "Question": [question['question'] for question in section['questions']],
+        "Answered": stats.answered[span].tolist(),
+        "Correct": stats.difficulty[span].tolist(),
+        "Discrimination": stats.discrimination[span].tolist(),
+        "Key": [OPTION_LETTERS[correct] for correct in columns.correct[span]],
+    }
+    for option in range(option_count):
+        table[OPTION_LETTERS[option]] = (stats.option_shares[span, option] * 100).tolist()
+    table["Flags"] = [question_flags(*values) for values in zip(stats.difficulty[span], stats.discrimination[span],
+                                                                  stats.option_shares[span], columns.correct[span])]
+
+    st.markdown(f"#### {section['title']}")
+    st.dataframe(table, hide_index=True, use_container_width=True, column_config={
+        "Question": st.column_config.TextColumn(width="large"),
+        "Correct": st.column_config.ProgressColumn("Correct", help="Share of answerers who got it right",
+                                                   format="percent", min_value=0, max_value=1),
+        "Discrimination": st.column_config.NumberColumn(
+            help="Correlation between getting this right and the score on every other question", format="%.2f"),
+        **{OPTION_LETTERS[option]: st.column_config.NumberColumn(help="Share of answerers choosing it", format="%.0f%%")
+           for option in range(option_count)},
+    })
+
+def main():
+    load_components()
+    if not is_admin():
+        st.error("The teacher dashboard needs an operator link.")
+        return
+
+    banner("📊 Teacher Dashboard", "How every quiz question performs across all learners")
+    stats = load_item_statistics()
+    columns = question_columns()
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Learners With Answers", f"{stats.students:,}")
+    col2.metric("Answers Recorded", f"{int(stats.answered.sum()):,}")
+    col3.metric("Average Correct", f"{np.nanmean(stats.difficulty):.0%}" if stats.students else "N/A")
+    st.caption(f"Refreshed at most every {REFRESH_INTERVAL} seconds. Correct below {TOO_HARD:.0%} or above "
+               f"{TOO_EASY:.0%}, discrimination below {LOW_DISCRIMINATION:.2f} and distractors chosen by fewer "
+               f"than {UNPOPULAR_DISTRACTOR:.0%} of answerers are flagged.")
+
+    if not stats.students:
+        st.info("No learner has finished a quiz section yet.")
+        return
+    for section_key in load_quiz_bank().section_keys:
+        render_section(section_key, stats, columns)
+
+if __name__ == "__main__":
+    main()
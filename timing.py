@@ -0,0 +1,45 @@
+"""
+Time on task from the monotonic clock
+Stamps are time.perf_counter_ns() readings, which only mean something inside
+the process that took them, so a session keeps its stamps in memory and only
+the durations measured from them (integer milliseconds) are saved or shown
+"""
+
+import time
+from typing import Optional, Tuple
+
+# A longer gap between two runs is a learner away from the screen; it counts this much
+IDLE_LIMIT_MS = 5 * 60 * 1000
+
+def now_ns() -> int:
+    """Monotonic, high-resolution clock reading"""
+    return time.perf_counter_ns()
+
+def elapsed_ms(since_ns: int, until_ns: Optional[int] = None) -> int:
+    """Whole milliseconds between two stamps, capped at the idle limit"""
+    until_ns = now_ns() if until_ns is None else until_ns
+    return min((until_ns - since_ns) // 1_000_000, IDLE_LIMIT_MS)
+
+def format_duration(milliseconds: int) -> str:
+    """Render a duration as 4.2s, 3m 05s or 1h 02m"""
+    seconds = milliseconds // 1000
+    if seconds < 60:
+        return f"{milliseconds / 1000:.1f}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds // 3600}h {seconds // 60 % 60:02d}m"
+
+class DwellClock:
+    """The page a session is showing and since when"""
+    __slots__ = ('page_id', 'since_ns')
+
+    def __init__(self):
+        self.page_id: Optional[str] = None
+        self.since_ns = now_ns()
+
+    def switch(self, page_id: Optional[str]) -> Tuple[Optional[str], int]:
+        """Start timing ``page_id`` and return the page timed until now with its dwell in ms"""
+        now = now_ns()
+        previous, dwell_ms = self.page_id, elapsed_ms(self.since_ns, now)
+        self.page_id, self.since_ns = page_id, now
+        return previous, dwell_ms